@@ -3,12 +3,16 @@ Configuration loader and management for CDP Signal Scanner.
 """
 
 import os
+import copy
+import hashlib
 import logging
-from typing import Dict, Any
-import yaml
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+
+# Keyword lists are tuples so they can be shared without defensive copies
 DEFAULT_CONFIG = {
     "scoring": {
         "hiring_target_persona_with_cdp_keywords": 5,
@@ -18,25 +22,25 @@ DEFAULT_CONFIG = {
         "funding_or_expansion": 2
     },
     "keywords": {
-        "cdp_vendors": [
+        "cdp_vendors": (
             "segment", "mparticle", "rudderstack", "tealium", 
             "adobe real-time cdp", "blueconic", "lytics", "treasure data"
-        ],
-        "target_personas": [
+        ),
+        "target_personas": (
             "director data platform", "vp marketing", "growth marketing manager",
             "cto", "vp engineering", "director security", "marketing ops", 
             "chief marketing officer", "chief digital officer", 
             "vp product", "head of analytics", "head of data"
-        ],
-        "cdp_related": [
+        ),
+        "cdp_related": (
             "customer data platform", "cdp", "data integration", "customer 360",
             "unified data", "real-time personalization", "data orchestration",
             "customer journey", "omnichannel", "first-party data"
-        ],
-        "data_tech": [
+        ),
+        "data_tech": (
             "snowflake", "dbt", "fivetran", "bigquery", 
             "redshift", "databricks", "data lakehouse", "data warehouse"
-        ]
+        )
     },
     "api": {
         "serpapi": {
@@ -53,43 +57,149 @@ DEFAULT_CONFIG = {
     "scraping": {
         "timeout": 10,  # Seconds
         "max_retries": 3,
+        "company_concurrency": 8,  # Companies scanned at the same time
+        # On-disk caches are opt-in. Entries are pickled and loaded back on
+        # later runs, so a cache directory must be trusted and not writable
+        # by others; cached URLs include API keys.
+        "http_cache_dir": "",  # GET response cache directory, e.g. ".cache/http"; empty to disable
+        "http_cache_ttl": 3600,  # Seconds a cached response is reused without revalidating; 0 to always revalidate
+        "lookup_cache_dir": "",  # Cached lookups such as job board tokens, e.g. ".cache/lookups"; empty to disable
         "headers": {
             "User-Agent": "CDP Signal Scanner/0.1.0 (research tool, contact hello@example.com)"
         }
     }
 }
 
+# Parsed configs keyed by (absolute config path, mtime in ns)
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+# Last parsed YAML per config path as (content digest, parsed document)
+_YAML_CACHE: Dict[str, Tuple[bytes, Any]] = {}
+
 
 def load_config() -> Dict[str, Any]:
     """
     Load configuration from config.yml file and merge with defaults.
     
+    Results are memoized per config file path and modification time, so
+    repeated calls skip the YAML parse until the file changes.
+    
     Returns:
         Dict containing the merged configuration
     """
-    config = DEFAULT_CONFIG.copy()
+    config_path = os.getenv("CONFIG_PATH", "config.yml")
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    cache_key = (os.path.abspath(config_path), mtime_ns)
+    
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+    
+    # Deep copy so merging file values never mutates the shared defaults
+    config = copy.deepcopy(DEFAULT_CONFIG)
     
     # Try to load config from file
     try:
-        config_path = os.getenv("CONFIG_PATH", "config.yml")
         if os.path.exists(config_path):
-            with open(config_path, "r") as f:
-                file_config = yaml.safe_load(f)
-                if file_config:
-                    # Recursively update config with file values
-                    deep_update(config, file_config)
+            file_config = _parse_yaml_file(config_path)
+            if file_config:
+                # Recursively update config with file values
+                deep_update(config, file_config)
             logger.info(f"Loaded configuration from {config_path}")
         else:
             logger.warning(f"Config file {config_path} not found, using defaults")
     except Exception as e:
         logger.warning(f"Error loading config file: {str(e)}, using defaults")
+        _freeze_keywords(config)
+        return config
+    
+    _freeze_keywords(config)
+    _CONFIG_CACHE[cache_key] = config
+    return copy.deepcopy(config)
+
+
+def _freeze_keywords(config: Dict[str, Any]) -> None:
+    """
+    Normalize keyword lists to tuples.
+    
+    Tuples of strings are returned as-is by ``copy.deepcopy``, so the copies
+    handed out by load_config share the keyword lists instead of copying them.
     
-    return config
+    Args:
+        config: Merged configuration to update in place
+    """
+    keywords = config["keywords"]
+    for name, words in keywords.items():
+        keywords[name] = tuple(words or ())
+
+
+@lru_cache(maxsize=None)
+def _yaml_loader() -> Any:
+    """
+    Resolve the YAML loader class, importing PyYAML on first use.
+    
+    Prefers the libyaml-backed CSafeLoader and falls back to the
+    pure-Python SafeLoader.
+    
+    Returns:
+        YAML loader class
+    """
+    import yaml
+    
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    if loader is yaml.SafeLoader:
+        logger.info("libyaml not available, using pure-Python YAML loader")
+    return loader
+
+
+def _parse_yaml_file(config_path: str) -> Any:
+    """
+    Parse a YAML file, skipping the parse when its content is unchanged.
+    
+    The file is read as raw bytes so libyaml decodes it directly, and the
+    previous parse is reused when the content digest matches (e.g. the file
+    was touched but not edited). The document is shared with the cache, so
+    callers must not mutate it; load_config only hands out deep copies of
+    the configuration it is merged into.
+    
+    Args:
+        config_path: Path to the YAML file
+        
+    Returns:
+        Parsed YAML document
+    """
+    with open(config_path, "rb") as f:
+        data = f.read()
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    
+    key = os.path.abspath(config_path)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == digest:
+        parsed = cached[1]
+    else:
+        import yaml
+        
+        parsed = yaml.load(data, Loader=_yaml_loader())
+        _YAML_CACHE[key] = (digest, parsed)
+    
+    return parsed
+
+
+def clear_config_cache() -> None:
+    """
+    Drop all memoized configurations, so the next load_config call parses
+    the config file again.
+    """
+    _CONFIG_CACHE.clear()
+    _YAML_CACHE.clear()
 
 
 def deep_update(source: Dict, updates: Dict) -> Dict:
     """
-    Recursively update a nested dictionary.
+    Update a nested dictionary in place, merging nested dicts.
     
     Args:
         source: Original dictionary to update
@@ -98,9 +208,14 @@ def deep_update(source: Dict, updates: Dict) -> Dict:
     Returns:
         Updated dictionary
     """
-    for key, value in updates.items():
-        if key in source and isinstance(source[key], dict) and isinstance(value, dict):
-            deep_update(source[key], value)
-        else:
-            source[key] = value
+    # Walk nested dicts with an explicit stack instead of recursing
+    stack = [(source, updates)]
+    while stack:
+        target, changes = stack.pop()
+        for key, value in changes.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
     return source
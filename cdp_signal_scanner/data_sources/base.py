@@ -5,12 +5,41 @@ Base class for all data sources used in CDP Signal Scanner.
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Callable, ClassVar, Dict, List, Any, Optional, Set, Tuple
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+
+from ..utils import HTTPCache, KeywordMatcher, TokenBucket, clean_text
 
 logger = logging.getLogger(__name__)
 
+# Trigger words used alongside the configured keywords by classify_signal.
+# These are matched against whole tokens, so common inflections are listed.
+HIRING_TRIGGERS = frozenset({"job", "jobs", "hiring", "career", "careers"})
+EXECUTIVE_TRIGGERS = frozenset({"join", "joins", "joined", "joining", "hired", "appointed", "named"})
+GROWTH_TRIGGERS = frozenset({
+    "series", "funding", "raised", "investment", "investments",
+    "launch", "launches", "launched", "launching",
+    "expand", "expands", "expanded", "expanding",
+})
+
+# Connection pool sizing for the HTTP client
+HTTP_LIMITS = httpx.Limits(
+    max_connections=1000,
+    max_keepalive_connections=200,
+    keepalive_expiry=30.0,
+)
+
+# Seconds to wait for a connection, so unreachable hosts fail fast even
+# when the read timeout is long
+CONNECT_TIMEOUT = 5.0
+
+# Maximum concurrent probes per _first_reachable_url call
+PROBE_CONCURRENCY = 8
+
+# Probes ask for a single byte so the reply is a tiny 206 (or 200)
+PROBE_HEADERS = {"Range": "bytes=0-0"}
+
 
 class DataSourceBase(ABC):
     """
@@ -18,9 +47,26 @@ class DataSourceBase(ABC):
     
     Attributes:
         config (Dict): Configuration dictionary
-        client (httpx.AsyncClient): Async HTTP client for making requests
+        client (httpx.AsyncClient): Async HTTP client shared by all sources
+            built from the same configuration
     """
     
+    # Shared clients keyed by id(config); the config is kept alongside so
+    # its id cannot be reused while the client is alive
+    _shared_clients: ClassVar[Dict[int, Tuple[Dict[str, Any], httpx.AsyncClient]]] = {}
+    
+    # Memoized helpers shared by sources built from the same configuration,
+    # keyed and kept alive the same way as the shared clients. Sources are
+    # created per company, so a per-instance cache would start cold for
+    # every company of a scan.
+    _shared_caches: ClassVar[Dict[int, Tuple[Dict[str, Any], Dict[Tuple[type, str], Callable]]]] = {}
+    
+    # Sources are created per scan, so skip the per-instance __dict__
+    __slots__ = (
+        "config", "client", "_personas", "_vendors", "_tech", "_cdp",
+        "_classifier", "_persona_matcher", "_max_retries", "_http_cache",
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the data source with configuration.
@@ -29,10 +75,100 @@ class DataSourceBase(ABC):
             config: Configuration dictionary
         """
         self.config = config
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(config["scraping"]["timeout"]),
-            headers=config["scraping"]["headers"]
+        
+        # Bind keyword lists once so per-signal checks skip the config dict walk
+        keywords = config.get("keywords", {})
+        self._personas = tuple(keywords.get("target_personas", ()))
+        self._vendors = tuple(keywords.get("cdp_vendors", ()))
+        self._tech = tuple(keywords.get("data_tech", ()))
+        self._cdp = tuple(keywords.get("cdp_related", ()))
+        
+        # Compile classification keywords once for all signals. Personas are
+        # kept separate since they only matter once a trigger word is found.
+        self._classifier = KeywordMatcher({
+            "vendor": self._vendors,
+            "tech": self._tech,
+        })
+        self._persona_matcher = KeywordMatcher({"persona": self._personas})
+        
+        self._max_retries = max(1, config.get("scraping", {}).get("max_retries", 3))
+        
+        # GET response cache, enabled by setting scraping.http_cache_dir.
+        # Responses younger than scraping.http_cache_ttl are served without
+        # a request; older ones are revalidated.
+        scraping = config.get("scraping", {})
+        cache_dir = scraping.get("http_cache_dir")
+        self._http_cache = HTTPCache(cache_dir, ttl=scraping.get("http_cache_ttl", 0)) if cache_dir else None
+        
+        self.client = type(self).get_shared_client(config)
+    
+    @classmethod
+    def get_shared_client(cls, config: Dict[str, Any]) -> httpx.AsyncClient:
+        """
+        Get the HTTP client shared by all data sources using this configuration.
+        
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            Shared async HTTP client
+        """
+        entry = DataSourceBase._shared_clients.get(id(config))
+        if entry is not None and not entry[1].is_closed:
+            return entry[1]
+        
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(config["scraping"]["timeout"], connect=min(CONNECT_TIMEOUT, config["scraping"]["timeout"])),
+            headers=config["scraping"]["headers"],
+            limits=HTTP_LIMITS,
+            http2=True,
         )
+        DataSourceBase._shared_clients[id(config)] = (config, client)
+        return client
+    
+    @classmethod
+    def get_shared_cache(
+        cls, config: Dict[str, Any], name: str, func: Callable, maxsize: int
+    ) -> Callable:
+        """
+        Get an lru_cache of func shared by all sources of this class using
+        this configuration.
+        
+        The first source to ask for a cache supplies func, so func must only
+        depend on its arguments and on the configuration.
+        
+        Args:
+            config: Configuration dictionary
+            name: Name of the cache within the source class
+            func: Function to memoize
+            maxsize: Maximum number of cached results
+            
+        Returns:
+            Memoized function
+        """
+        entry = DataSourceBase._shared_caches.setdefault(id(config), (config, {}))
+        caches = entry[1]
+        cached = caches.get((cls, name))
+        if cached is None:
+            cached = caches.setdefault((cls, name), lru_cache(maxsize=maxsize)(func))
+        return cached
+    
+    @classmethod
+    async def close_shared(cls, config: Dict[str, Any]):
+        """
+        Close the HTTP client and drop the caches shared by sources using
+        this configuration.
+        
+        Each scan owns the client built from its configuration, so scans
+        running in other threads or event loops keep their own clients.
+        
+        Args:
+            config: Configuration dictionary the client was created for
+        """
+        DataSourceBase._shared_caches.pop(id(config), None)
+        entry = DataSourceBase._shared_clients.pop(id(config), None)
+        if entry is not None:
+            await entry[1].aclose()
     
     @abstractmethod
     async def gather_signals(self, company: str) -> List[Dict[str, Any]]:
@@ -50,8 +186,11 @@ class DataSourceBase(ABC):
     async def clean_up(self):
         """
         Clean up resources used by the data source.
+        
+        The HTTP client is shared between sources and is closed by
+        close_shared(config), so there is nothing to release per instance.
         """
-        await self.client.aclose()
+        pass
 
     def clean_text(self, text: str) -> str:
         """
@@ -63,73 +202,170 @@ class DataSourceBase(ABC):
         Returns:
             Cleaned text
         """
-        if not text:
-            return ""
-        
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Replace punctuation with spaces
-        for char in ",.!?;:()[]{}\"'":
-            text = text.replace(char, " ")
-        
-        # Remove extra whitespace
-        text = " ".join(text.split())
-        
-        return text
+        return clean_text(text)
 
-    def classify_signal(self, signal: Dict[str, Any]) -> str:
+    def classify_signal(self, signal: Dict[str, Any], keyword_groups: Optional[Set[str]] = None) -> str:
         """
         Classify a signal into one of the predefined categories.
         
         Args:
             signal: Signal dictionary
+            keyword_groups: Keyword groups already found in the snippet by the
+                caller. A "vendor" or "tech" entry marks a technology signal
+                without rescanning the snippet for those keywords.
             
         Returns:
             Classification category
         """
         content = self.clean_text(signal.get("snippet", ""))
         
-        # Check if it's a job posting for a target persona
-        if any(persona in content for persona in self.config["keywords"]["target_personas"]):
-            if "job" in content or "hiring" in content or "career" in content:
-                return "hiring_target_persona"
+        if not content:
+            return "other"
         
-        # Check if it's an executive move
-        if ("join" in content or "hired" in content or "appointed" in content or 
-            "named" in content) and any(persona in content for persona in self.config["keywords"]["target_personas"]):
-            return "executive_move"
+        # Tokenize once so trigger words are set lookups rather than substring scans
+        tokens = set(content.split())
+        is_hiring = not tokens.isdisjoint(HIRING_TRIGGERS)
+        
+        # Check if it's a job posting for, or an executive move into, a target persona.
+        # The longer persona list is only scanned when a trigger word is present.
+        if is_hiring or not tokens.isdisjoint(EXECUTIVE_TRIGGERS):
+            if self._persona_matcher.contains(content, "persona"):
+                return "hiring_target_persona" if is_hiring else "executive_move"
         
         # Check if it's a technology signal
-        if any(tech in content for tech in self.config["keywords"]["data_tech"]) or \
-           any(vendor in content for vendor in self.config["keywords"]["cdp_vendors"]):
+        if keyword_groups is None:
+            keyword_groups = self._classifier.find_groups(content)
+        if not keyword_groups.isdisjoint(("vendor", "tech")):
             return "technology_signal"
         
         # Check if it's growth or funding news
-        if ("series" in content or "funding" in content or "raised" in content or 
-            "investment" in content or "launch" in content or "expand" in content):
+        if not tokens.isdisjoint(GROWTH_TRIGGERS):
             return "growth_funding"
         
         # Default to "other" if no clear classification
         return "other"
+
+    def classify_signals(self, signals: List[Dict[str, Any]]) -> List[str]:
+        """
+        Classify each signal in a list with classify_signal.
         
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException))
-    )
-    async def make_request(self, url: str, method: str = "GET", **kwargs) -> httpx.Response:
+        A convenience wrapper for callers that collect signals before
+        classifying them; every signal is still classified on its own.
+        
+        Args:
+            signals: List of signal dictionaries
+        
+        Returns:
+            Classification categories, in the same order as the signals
+        """
+        classify = self.classify_signal
+        return [classify(signal) for signal in signals]
+
+    async def make_request(
+        self, url: str, method: str = "GET", rate_limiter: Optional[TokenBucket] = None, **kwargs
+    ) -> httpx.Response:
         """
         Make an HTTP request with retry logic.
         
+        Failed attempts are retried with exponential backoff (1s, 2s, 4s, ...
+        capped at 10s) up to the configured ``scraping.max_retries``. When the
+        HTTP cache is enabled, GET requests for URLs cached within the TTL are
+        answered from the cache. Other cached URLs are sent as conditional
+        requests and a 304 reply is served from the cache.
+        
         Args:
             url: URL to request
             method: HTTP method to use
+            rate_limiter: Limiter acquired before every attempt, including
+                retries, so they stay within the site's rate limit
             **kwargs: Additional arguments to pass to httpx
             
         Returns:
             HTTP response
         """
-        response = await self.client.request(method, url, **kwargs)
-        response.raise_for_status()
-        return response
+        cache = self._http_cache if method == "GET" else None
+        entry = cache.load(url) if cache is not None else None
+        if entry is not None:
+            if cache.is_fresh(entry):
+                return cache.cached(entry, url)
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **cache.conditional_headers(entry)}
+        
+        for attempt in range(self._max_retries):
+            try:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+                response = await self.client.request(method, url, **kwargs)
+                if entry is not None and response.status_code == 304:
+                    cache.refresh(url, entry)
+                    return cache.revalidated(entry, response)
+                response.raise_for_status()
+                if cache is not None:
+                    cache.store(url, response)
+                return response
+            except (httpx.HTTPError, httpx.TimeoutException):
+                if attempt >= self._max_retries - 1:
+                    raise
+                await asyncio.sleep(min(10, 2 ** attempt))
+    
+    async def _first_reachable_url(
+        self, urls: List[str], head: bool = False, statuses: Optional[Dict[str, int]] = None
+    ) -> Optional[str]:
+        """
+        Probe candidate URLs concurrently.
+        
+        By default each probe is a GET for the first byte only, since many
+        sites reject or mishandle HEAD, and the body is never read. APIs that
+        answer HEAD properly can be probed with ``head=True`` instead, which
+        sends a HEAD without following redirects and only accepts a 2xx
+        reply, falling back to the ranged GET when HEAD is not allowed.
+        Probes are not retried. As soon as every URL ahead of a reachable one
+        has answered, that URL is returned and the remaining probes are
+        cancelled.
+        
+        Args:
+            urls: Candidate URLs in order of preference
+            head: Probe with HEAD requests
+            statuses: Filled with the final status code of each probe that
+                got a reply. URLs whose probe raised or was cancelled are
+                left out, so callers can tell a definitive miss from a
+                network error.
+            
+        Returns:
+            The first URL in the given order that responded without an error,
+            or None if none did
+        """
+        semaphore = asyncio.Semaphore(PROBE_CONCURRENCY)
+        
+        async def probe(index: int, url: str) -> Tuple[int, bool]:
+            async with semaphore:
+                try:
+                    if head:
+                        response = await self.client.head(url, follow_redirects=False, timeout=5.0)
+                        if response.status_code != 405:
+                            if statuses is not None:
+                                statuses[url] = response.status_code
+                            return index, 200 <= response.status_code < 300
+                    async with self.client.stream(
+                        "GET", url, headers=PROBE_HEADERS, follow_redirects=True, timeout=5.0
+                    ) as response:
+                        if statuses is not None:
+                            statuses[url] = response.status_code
+                        return index, response.status_code < 400
+                except Exception:
+                    return index, False
+        
+        tasks = [asyncio.create_task(probe(i, url)) for i, url in enumerate(urls)]
+        reachable: List[Optional[bool]] = [None] * len(urls)
+        best = 0  # Lowest index still without a failed probe
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, ok = await next_done
+                reachable[index] = ok
+                while best < len(urls) and reachable[best] is False:
+                    best += 1
+                if best < len(urls) and reachable[best]:
+                    return urls[best]
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
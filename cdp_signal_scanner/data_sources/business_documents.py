@@ -7,24 +7,230 @@ import asyncio
 import logging
 import os
 import re
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import weakref
+from datetime import date, timedelta
+from typing import Any, ClassVar, Dict, List, Optional, Set, Tuple
 from urllib.parse import quote, urljoin
 
 import httpx
 from bs4 import BeautifulSoup
+from lxml import etree
 import trafilatura
 
 from cdp_signal_scanner.data_sources.base import DataSourceBase
+from cdp_signal_scanner.utils import (
+    KeywordMatcher, TokenBucket, has_class_xpath, load_json, lowercase_xpath, parse_html
+)
 
 logger = logging.getLogger(__name__)
 
+# SEC requires a user-agent with contact details on every request
+SEC_HEADERS = {"User-Agent": "CDPSignalScanner research.tool@example.com"}
+
+# SEC EDGAR endpoints: the company/CIK list, per-company filing history as
+# JSON, and the archive folder holding each filing's documents
+SEC_COMPANIES_URL = "https://www.sec.gov/files/company_tickers.json"
+SEC_SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK{cik:010d}.json"
+SEC_ARCHIVE_URL = "https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/"
+
+# Filing types we scan
+SEC_FORMS = frozenset({"10-K", "10-Q", "8-K", "S-1"})
+
+# SEC allows 10 requests per second per client; stay just under it.
+# Shared by all instances since the limit applies to the whole process.
+SEC_RATE_LIMITER = TokenBucket(8, 1.0)
+
+# Visible text nodes, used when no main content can be extracted
+_VISIBLE_TEXT = etree.XPath("//text()[not(ancestor::script or ancestor::style)]")
+
+# Links to HTML documents in an SEC filing index (case-insensitive match)
+SEC_DOCUMENT_LINKS = "table.tableFile a[href*='.htm' i]"
+
+# Keywords that might indicate investor documents
+IR_DOC_KEYWORDS = (
+    "annual report", "annual-report", "10-k", "10k",
+    "investor presentation", "investor-presentation",
+    "earnings", "financial results", "quarterly report",
+    "investor day", "strategic priorities", "earnings call transcript",
+    "investor briefing", "shareholder letter", "annual meeting",
+    "capital markets day", "business strategy", "growth strategy",
+    "digital transformation", "technology roadmap",
+    "shareholder"
+)
+
+# Common IR page paths, based on common corporate website structures
+IR_PATHS = (
+    "/investor-relations",
+    "/investors",
+    "/investor",
+    "/ir",
+    "/financials",
+    "/annual-reports",
+    "/quarterly-results",
+    "/financial-information",
+    "/about/investors",
+    "/about/investor-relations",
+    # Additional patterns observed in Fortune 500 companies
+    "/en-us/investor",
+    "/en/investor",
+    "/company/investor-relations",
+    "/company/investors",
+    "/corporate/investor-relations",
+    "/corporate/investors",
+    "/about/ir",
+    "/msft",              # Microsoft-specific pattern
+    "/investor/default",  # Microsoft-specific pattern
+    "/en-us/investor/default",
+    # Additional patterns for international companies
+    "/relations/investor",
+    "/invest",
+    "/shareholder-information",
+    "/financial-reports"
+)
+
+# Common news page paths
+NEWS_PATHS = (
+    "/news",
+    "/press",
+    "/press-releases",
+    "/newsroom",
+    "/press-room",
+    "/media",
+    "/media-center",
+    "/about/news",
+    "/about/press",
+    "/corporate/news",
+    "/company/news",
+    "/company/newsroom",
+    "/about-us/news",
+    "/en/news",
+    "/en/newsroom",
+    "/en-us/news",
+    "/news-events",
+    "/news-insights",
+    "/blog",
+    "/company-updates"
+)
+
+# Document file extensions linked from investor relations pages
+IR_DOC_EXTENSIONS = (".pdf", ".ppt", ".pptx", ".doc", ".docx")
+
+
+# Links whose text or href mention a document keyword, or whose href has a
+# document extension. Matching runs in libxml2 instead of per link in Python.
+IR_DOC_LINKS = etree.XPath(
+    "//a[@href and not(starts-with(@href, '#')) and ({})]".format(" or ".join(
+        [f"contains({lowercase_xpath('string(.)')}, '{keyword}')" for keyword in IR_DOC_KEYWORDS] +
+        [f"contains({lowercase_xpath('@href')}, '{keyword}')" for keyword in IR_DOC_KEYWORDS + IR_DOC_EXTENSIONS]
+    ))
+)
+
+# News item containers, tried in order until one pattern matches
+NEWS_CONTAINERS = (
+    etree.XPath("//*[{} or self::article]".format(" or ".join(
+        has_class_xpath(name) for name in ("news-item", "press-release", "article", "news-article")
+    ))),
+    etree.XPath("//*[contains(@class, 'news') or contains(@class, 'article') or contains(@class, 'press')]"),
+    etree.XPath("//*[{}]".format(" or ".join(
+        has_class_xpath(name) for name in ("post", "entry", "media-item")
+    ))),
+)
+
+# Date elements inside a news item container
+NEWS_DATES = etree.XPath(
+    f".//*[{has_class_xpath('date')} or {has_class_xpath('time')} "
+    "or contains(@class, 'date') or contains(@class, 'time')]"
+)
+
+# Links that may point at news articles; the path is checked exactly afterwards
+NEWS_LINK_CANDIDATES = etree.XPath(
+    "//a[contains(@href, 'news') or contains(@href, 'press') "
+    "or contains(@href, 'release') or contains(@href, 'article')]"
+)
+
+# Block elements treated as paragraphs when streaming SEC documents
+SEC_BLOCK_TAGS = ("p", "div", "li", "td")
+
+# Paragraph boundaries in extracted document text
+_PARAGRAPH_RE = re.compile(r"\n+")
+
+# Customer-focused terms that make a data technology mention relevant in news
+CUSTOMER_TERMS = ("customer", "user", "experience", "journey", "personalization", "segment")
+
+
+def _build_snippet(paragraphs: List[str], max_length: int = 800) -> str:
+    """
+    Join the first 3 paragraphs into a snippet of at most max_length characters.
+    
+    Only as much of each paragraph as can still fit is copied, so very long
+    paragraphs never build a large intermediate string.
+    
+    Args:
+        paragraphs: Relevant paragraphs in document order
+        max_length: Maximum snippet length
+        
+    Returns:
+        Snippet, ending in "..." if it was truncated
+    """
+    snippet = ""
+    for i, paragraph in enumerate(paragraphs[:3]):
+        if i:
+            snippet += " ... "
+        if len(snippet) > max_length:
+            break
+        # Keep one character past the limit to know whether to truncate
+        snippet += paragraph[:max_length + 1 - len(snippet)]
+    
+    if len(snippet) > max_length:
+        snippet = snippet[:max_length - 3] + "..."
+    
+    return snippet
+
+
+def _extract_text(content: bytes) -> str:
+    """
+    Extract the main text content from an HTML document.
+    
+    The document is parsed once with lxml and the tree is shared by
+    trafilatura's fast mode, which skips the slower readability and jusText
+    fallback extractors, and the plain-text fallback.
+    
+    Args:
+        content: Raw HTML bytes
+        
+    Returns:
+        Extracted text
+    """
+    tree = parse_html(content)
+    if tree is None:
+        return ""
+    
+    text = trafilatura.extract(tree, fast=True, include_comments=False)
+    
+    if not text:
+        # Fallback to all visible text on the page
+        text = "".join(_VISIBLE_TEXT(tree))
+    
+    return text
+
+
 class BusinessDocumentsSource(DataSourceBase):
     """
     Scans business documents including 10-K reports, annual reports,
     investor presentations, and recent news for CDP-related signals.
     """
     
+    # Cleaned company names and CIKs from SEC_COMPANIES_URL, loaded once per process
+    _sec_companies: ClassVar[Optional[List[Tuple[str, int]]]] = None
+    
+    # Company list download in progress per event loop, awaited by every
+    # concurrent lookup so the file is fetched once
+    _sec_companies_loads: ClassVar["weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Future]"] = (
+        weakref.WeakKeyDictionary()
+    )
+    
+    __slots__ = ("max_docs_per_source", "max_age_days", "_cdp_keywords_lower", "_doc_matcher", "_website_cache")
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the business documents source.
@@ -36,6 +242,22 @@ class BusinessDocumentsSource(DataSourceBase):
         self.max_docs_per_source = config.get("max_docs_per_source", 5)
         self.max_age_days = config.get("max_age_days", 365)  # Default to 1 year
         
+        # CDP concepts and vendors, lowercased once for matching against cleaned text
+        self._cdp_keywords_lower = tuple(
+            dict.fromkeys(keyword.lower() for keyword in self._cdp + self._vendors)
+        )
+        
+        # Compile document keywords once
+        self._doc_matcher = KeywordMatcher({
+            "cdp": self._cdp_keywords_lower,
+            "vendor": [keyword.lower() for keyword in self._vendors],
+            "tech": [keyword.lower() for keyword in self._tech],
+            "customer": CUSTOMER_TERMS,
+        })
+        
+        # Website lookups by company, shared by the concurrent gather methods
+        self._website_cache: Dict[str, asyncio.Future] = {}
+        
     async def gather_signals(self, company: str) -> List[Dict[str, Any]]:
         """
         Gather signals from business documents and news sources.
@@ -82,159 +304,265 @@ class BusinessDocumentsSource(DataSourceBase):
         """
         signals = []
         
-        # Use SEC EDGAR search
         try:
-            # Formulate search URL
-            search_url = f"https://www.sec.gov/cgi-bin/browse-edgar?company={quote(company)}&owner=exclude&action=getcompany"
+            cik = await self._find_sec_cik(company)
+            filing_links = await self._list_sec_filings(cik) if cik is not None else []
             
-            response = await self.make_request(
-                search_url,
-                headers={
-                    "User-Agent": "CDPSignalScanner research.tool@example.com"  # SEC requires a user-agent
-                }
+            if not filing_links:
+                logger.info(f"No SEC filings found for {company}")
+                return signals
+            
+            # Process the filings concurrently; the SEC rate limiter paces the requests
+            results = await asyncio.gather(
+                *(self._process_sec_filing(filing, company) for filing in filing_links)
             )
+            signals.extend(signal for signal in results if signal)
+        
+        except Exception as e:
+            logger.error(f"Error gathering SEC filings for {company}: {str(e)}")
+        
+        return signals
+    
+    async def _find_sec_cik(self, company: str) -> Optional[int]:
+        """
+        Look up the SEC Central Index Key (CIK) of a company.
+        
+        Like EDGAR's company search, the first registered name starting with
+        the company name wins.
+        
+        Args:
+            company: Company name
+            
+        Returns:
+            CIK, or None if no SEC registrant matches
+        """
+        companies = BusinessDocumentsSource._sec_companies
+        if companies is None:
+            loads = BusinessDocumentsSource._sec_companies_loads
+            loop = asyncio.get_running_loop()
+            load = loads.get(loop)
+            if load is None:
+                load = asyncio.ensure_future(self._load_sec_companies())
+                loads[loop] = load
+            companies = await load
+        
+        name = self.clean_text(company)
+        if not name:
+            return None
+        
+        return next((cik for title, cik in companies if title.startswith(name)), None)
+    
+    async def _load_sec_companies(self) -> List[Tuple[str, int]]:
+        """
+        Download the SEC company list and keep it for the rest of the process.
+        
+        A failed download is not kept, so a later lookup tries again.
+        
+        Returns:
+            Cleaned company names and CIKs
+        """
+        try:
+            response = await self._sec_request(SEC_COMPANIES_URL)
+            companies = [
+                (self.clean_text(entry.get("title", "")), int(entry["cik_str"]))
+                for entry in load_json(response.content).values()
+            ]
+            BusinessDocumentsSource._sec_companies = companies
+            return companies
+        finally:
+            BusinessDocumentsSource._sec_companies_loads.pop(asyncio.get_running_loop(), None)
+    
+    async def _list_sec_filings(self, cik: int) -> List[Dict[str, Any]]:
+        """
+        List a company's recent filings of the types we scan.
+        
+        Uses the EDGAR submissions JSON, whose recent filings are stored as
+        parallel arrays, instead of scraping the HTML filing index.
+        
+        Args:
+            cik: Company CIK
             
-            # Parse results with BeautifulSoup
-            soup = BeautifulSoup(response.text, "html.parser")
-            filing_tables = soup.select(".tableFile2")
+        Returns:
+            Up to max_docs_per_source filing dictionaries with type, date, the
+            filing index url and the primary document_url (None if unknown)
+        """
+        response = await self._sec_request(SEC_SUBMISSIONS_URL.format(cik=cik))
+        recent = load_json(response.content).get("filings", {}).get("recent", {})
+        
+        # Oldest filing date still considered recent enough
+        cutoff = date.today() - timedelta(days=self.max_age_days)
+        
+        filing_links = []
+        for form, filing_date, accession, primary_document in zip(
+            recent.get("form", []),
+            recent.get("filingDate", []),
+            recent.get("accessionNumber", []),
+            recent.get("primaryDocument", []),
+        ):
+            if form not in SEC_FORMS:
+                continue
             
-            if not filing_tables:
-                logger.info(f"No SEC filings found for {company}")
-                return signals
+            try:
+                if date.fromisoformat(filing_date) < cutoff:
+                    continue
+            except ValueError:
+                # Skip if date parsing fails
+                continue
             
-            # Look for 10-K (annual) and 10-Q (quarterly) reports
-            filing_links = []
-            
-            for table in filing_tables:
-                rows = table.select("tr")
-                for row in rows:
-                    cells = row.select("td")
-                    if len(cells) >= 4:
-                        filing_type = cells[0].get_text().strip()
-                        filing_date = cells[3].get_text().strip()
-                        
-                        # Check if this is a report we're interested in and if it's recent enough
-                        if filing_type in ["10-K", "10-Q", "8-K", "S-1"]:
-                            try:
-                                date = datetime.strptime(filing_date, "%Y-%m-%d")
-                                if (datetime.now() - date).days <= self.max_age_days:
-                                    # Find the document link
-                                    doc_links = row.select("a[id^='documentsbutton']")
-                                    if doc_links:
-                                        doc_link = doc_links[0]["href"]
-                                        filing_links.append({
-                                            "type": filing_type,
-                                            "date": filing_date,
-                                            "url": urljoin("https://www.sec.gov", doc_link)
-                                        })
-                                        
-                                        # Limit the number of filings we process
-                                        if len(filing_links) >= self.max_docs_per_source:
-                                            break
-                            except ValueError:
-                                # Skip if date parsing fails
-                                continue
-            
-            # Process each filing to extract relevant content
-            for filing in filing_links:
-                try:
-                    # Get the filing page
-                    filing_page = await self.make_request(
-                        filing["url"],
-                        headers={
-                            "User-Agent": "CDPSignalScanner research.tool@example.com"
-                        }
-                    )
-                    
-                    # Find the actual document link (usually an HTML or text file)
-                    filing_soup = BeautifulSoup(filing_page.text, "html.parser")
-                    document_links = filing_soup.select("table.tableFile a")
-                    
-                    # Look for the main document
-                    doc_url = None
-                    for link in document_links:
-                        if ".htm" in link["href"].lower() and not "_def" in link["href"].lower():
-                            doc_url = urljoin("https://www.sec.gov", link["href"])
-                            break
-                    
-                    if not doc_url:
-                        continue
-                    
-                    # Get the actual document
-                    doc_response = await self.make_request(
-                        doc_url,
-                        headers={
-                            "User-Agent": "CDPSignalScanner research.tool@example.com"
-                        }
-                    )
-                    
-                    # Extract text with trafilatura for better content extraction
-                    doc_text = trafilatura.extract(doc_response.text)
-                    
-                    if not doc_text:
-                        # Fallback to basic extraction
-                        doc_soup = BeautifulSoup(doc_response.text, "html.parser")
-                        doc_text = doc_soup.get_text()
-                    
-                    # Look for CDP-related content
-                    doc_text_lower = self.clean_text(doc_text)
-                    
-                    # Check for CDP-related keywords
-                    cdp_keywords = self.config["keywords"]["cdp_related"] + self.config["keywords"]["cdp_vendors"]
-                    
-                    # Find paragraphs containing CDP keywords
-                    paragraphs = re.split(r'\n+', doc_text)
-                    relevant_paragraphs = []
-                    
-                    for paragraph in paragraphs:
-                        paragraph = paragraph.strip()
-                        if len(paragraph) < 20:  # Skip very short paragraphs
-                            continue
-                            
-                        cleaned_para = self.clean_text(paragraph)
-                        
-                        # Check if paragraph contains any CDP keywords
-                        if any(keyword.lower() in cleaned_para for keyword in cdp_keywords):
-                            relevant_paragraphs.append(paragraph)
-                            
-                            # Limit the number of paragraphs
-                            if len(relevant_paragraphs) >= 5:
-                                break
-                    
-                    # If we found relevant content, create a signal
-                    if relevant_paragraphs:
-                        snippet = " ... ".join(relevant_paragraphs[:3])  # First 3 paragraphs only
-                        
-                        if len(snippet) > 800:
-                            snippet = snippet[:797] + "..."
-                        
-                        signal = {
-                            "source": f"SEC Filing ({filing['type']})",
-                            "source_url": doc_url,
-                            "filing_date": filing["date"],
-                            "snippet": snippet,
-                            "raw_data": {
-                                "filing_type": filing["type"],
-                                "filing_date": filing["date"],
-                                "relevant_paragraphs": relevant_paragraphs
-                            }
-                        }
-                        
-                        # Classify the signal
-                        signal["signal_category"] = self.classify_signal(signal)
-                        signals.append(signal)
+            folder = SEC_ARCHIVE_URL.format(cik=cik, accession=accession.replace("-", ""))
+            filing_links.append({
+                "type": form,
+                "date": filing_date,
+                "url": f"{folder}{accession}-index.htm",
+                "document_url": urljoin(folder, primary_document) if primary_document else None
+            })
+            
+            # Limit the number of filings we process
+            if len(filing_links) >= self.max_docs_per_source:
+                break
+        
+        return filing_links
+    
+    async def _process_sec_filing(self, filing: Dict[str, str], company: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a single SEC filing and build a signal from its CDP-related content.
+        
+        Args:
+            filing: Filing dictionary with type, date, url and document_url
+            company: Company name
+            
+        Returns:
+            Signal dictionary, or None if the filing has no relevant content
+        """
+        try:
+            # Fall back to the filing index page when the primary document is unknown
+            doc_url = filing["document_url"] or await self._find_sec_main_document(filing["url"])
+            
+            if not doc_url:
+                return None
+            
+            # Stream the actual document, stopping once enough paragraphs
+            # containing CDP keywords are found
+            relevant_paragraphs, keyword_groups = await self._stream_sec_paragraphs(doc_url)
+            
+            # If we found relevant content, create a signal
+            if not relevant_paragraphs:
+                return None
+            
+            snippet = _build_snippet(relevant_paragraphs)  # First 3 paragraphs only
+            
+            signal = {
+                "source": f"SEC Filing ({filing['type']})",
+                "source_url": doc_url,
+                "filing_date": filing["date"],
+                "snippet": snippet,
+                "raw_data": {
+                    "filing_type": filing["type"],
+                    "filing_date": filing["date"],
+                    "relevant_paragraphs": relevant_paragraphs
+                }
+            }
+            
+            # Classify the signal, reusing the keyword hits found above
+            signal["signal_category"] = self.classify_signal(signal, keyword_groups)
+            return signal
+        
+        except Exception as e:
+            logger.warning(f"Error processing SEC filing {filing['url']} for {company}: {str(e)}")
+            return None
+    
+    async def _sec_request(self, url: str) -> httpx.Response:
+        """
+        Make a request to SEC EDGAR within its rate limit.
+        
+        Every attempt, including retries, takes a token from SEC_RATE_LIMITER.
+        
+        Args:
+            url: SEC URL to request
+            
+        Returns:
+            HTTP response
+        """
+        return await self.make_request(url, rate_limiter=SEC_RATE_LIMITER, headers=SEC_HEADERS)
+    
+    async def _find_sec_main_document(self, index_url: str) -> Optional[str]:
+        """
+        Find the main document of a filing from its index page.
+        
+        Args:
+            index_url: Filing index URL
+            
+        Returns:
+            Main document URL, or None if none was found
+        """
+        filing_page = await self._sec_request(index_url)
+        
+        # Find the actual document link (usually an HTML or text file)
+        filing_soup = BeautifulSoup(filing_page.content, "lxml")
+        
+        # Look for the main document: the first HTML link that isn't a definition file
+        return next(
+            (
+                urljoin("https://www.sec.gov", link["href"])
+                for link in filing_soup.select(SEC_DOCUMENT_LINKS)
+                if "_def" not in link["href"].lower()
+            ),
+            None
+        )
+    
+    async def _stream_sec_paragraphs(self, url: str) -> Tuple[List[str], Set[str]]:
+        """
+        Stream an SEC document and collect the paragraphs that mention CDP keywords.
+        
+        Filings can be many megabytes of HTML, so the body is parsed as it
+        arrives and the download is closed as soon as 5 relevant paragraphs
+        have been found.
+        
+        Args:
+            url: SEC document URL
+            
+        Returns:
+            Up to 5 relevant paragraphs in document order, and the keyword
+            groups found in the snippet built from them
+        """
+        relevant_paragraphs = []
+        
+        def collect(events) -> bool:
+            for _, element in events:
+                paragraph = " ".join("".join(element.itertext()).split())
                 
-                except Exception as e:
-                    logger.warning(f"Error processing SEC filing {filing['url']} for {company}: {str(e)}")
+                # Drop the element so enclosing blocks don't repeat its text
+                element.clear(keep_tail=True)
+                
+                if len(paragraph) < 20:  # Skip very short paragraphs
                     continue
+                
+                if "cdp" in self._doc_matcher.find_groups(self.clean_text(paragraph)):
+                    relevant_paragraphs.append(paragraph)
                     
-                # Sleep briefly between requests to be polite to SEC servers
-                await asyncio.sleep(1)
+                    # Limit the number of paragraphs
+                    if len(relevant_paragraphs) >= 5:
+                        return True
+            return False
         
-        except Exception as e:
-            logger.error(f"Error gathering SEC filings for {company}: {str(e)}")
+        await SEC_RATE_LIMITER.acquire()
+        async with self.client.stream("GET", url, headers=SEC_HEADERS) as response:
+            response.raise_for_status()
+            parser = etree.HTMLPullParser(
+                events=("end",),
+                tag=SEC_BLOCK_TAGS,
+                encoding=response.charset_encoding
+            )
+            
+            async for chunk in response.aiter_bytes(65536):
+                parser.feed(chunk)
+                if collect(parser.read_events()):
+                    break
+            else:
+                parser.close()
+                collect(parser.read_events())
         
-        return signals
+        return relevant_paragraphs, self._snippet_groups(relevant_paragraphs)
     
     async def _gather_investor_relations(self, company: str) -> List[Dict[str, Any]]:
         """
@@ -256,47 +584,10 @@ class BusinessDocumentsSource(DataSourceBase):
                 logger.info(f"Could not find website for {company}, skipping investor relations scan")
                 return signals
             
-            # Common IR page patterns - enhanced based on common corporate website structures
-            ir_patterns = [
-                "/investor-relations",
-                "/investors",
-                "/investor",
-                "/ir",
-                "/financials",
-                "/annual-reports",
-                "/quarterly-results",
-                "/financial-information",
-                "/about/investors",
-                "/about/investor-relations",
-                # Additional patterns observed in Fortune 500 companies
-                "/en-us/investor",
-                "/en/investor",
-                "/company/investor-relations",
-                "/company/investors",
-                "/corporate/investor-relations",
-                "/corporate/investors",
-                "/about/ir",
-                "/msft",              # Microsoft-specific pattern
-                "/investor/default",  # Microsoft-specific pattern
-                "/en-us/investor/default",
-                # Additional patterns for international companies
-                "/relations/investor",
-                "/invest",
-                "/shareholder-information",
-                "/financial-reports"
-            ]
-            
-            # Try each pattern to find the IR page
-            ir_url = None
-            for pattern in ir_patterns:
-                test_url = urljoin(company_website, pattern)
-                try:
-                    response = await self.make_request(test_url, method="HEAD", timeout=5.0, follow_redirects=True)
-                    if response.status_code < 400:
-                        ir_url = test_url
-                        break
-                except:
-                    continue
+            # Probe all patterns at once to find the IR page
+            ir_url = await self._first_reachable_url(
+                [urljoin(company_website, path) for path in IR_PATHS]
+            )
             
             if not ir_url:
                 logger.info(f"No investor relations page found for {company}")
@@ -304,142 +595,106 @@ class BusinessDocumentsSource(DataSourceBase):
             
             # Scrape the IR page for documents
             response = await self.make_request(ir_url, follow_redirects=True)
-            soup = BeautifulSoup(response.text, "html.parser")
+            tree = parse_html(response.content)
+            if tree is None:
+                return signals
             
             # Look for links to annual reports, presentations, etc.
             doc_links = []
             
-            # Keywords that might indicate investor documents
-            doc_keywords = [
-                "annual report", "annual-report", "10-k", "10k",
-                "investor presentation", "investor-presentation",
-                "earnings", "financial results", "quarterly report",
-                "investor day", "strategic priorities", "earnings call transcript",
-                "investor briefing", "shareholder letter", "annual meeting",
-                "capital markets day", "business strategy", "growth strategy",
-                "digital transformation", "technology roadmap",
-                "investor day", "shareholder"
-            ]
-            
-            # Find links that might be documents
-            for a in soup.find_all("a"):
+            # Find links whose text or href contains document keywords, or
+            # that point at a PDF or other document type
+            for a in IR_DOC_LINKS(tree):
                 href = a.get("href")
-                text = a.get_text().lower().strip()
-                
                 if not href:
                     continue
                 
-                # Check if the link or its text contains document keywords
-                is_doc_link = any(keyword in text or keyword in href.lower() for keyword in doc_keywords)
-                
-                # Check if it's a PDF or other document type
-                is_document_format = any(ext in href.lower() for ext in [".pdf", ".ppt", ".pptx", ".doc", ".docx"])
-                
-                if (is_doc_link or is_document_format) and not "#" == href[0]:
-                    full_url = href if href.startswith(("http://", "https://")) else urljoin(ir_url, href)
-                    doc_links.append({
-                        "url": full_url,
-                        "title": text if text else "Document",
-                        "type": "PDF" if ".pdf" in href.lower() else "Presentation" if any(ext in href.lower() for ext in [".ppt", ".pptx"]) else "Document"
-                    })
-            
-            # Process the most promising documents
+                text = a.text_content().lower().strip()
+                full_url = href if href.startswith(("http://", "https://")) else urljoin(ir_url, href)
+                doc_links.append({
+                    "url": full_url,
+                    "title": text if text else "Document",
+                    "type": "PDF" if ".pdf" in href.lower() else "Presentation" if any(ext in href.lower() for ext in [".ppt", ".pptx"]) else "Document"
+                })
+            
+            # Process the most promising documents concurrently
             doc_links = doc_links[:self.max_docs_per_source]
             
-            for doc in doc_links:
-                try:
-                    # For PDFs and presentations, we need special handling
-                    if doc["type"] in ["PDF", "Presentation"]:
-                        # For now, we'll just record the link as we can't easily parse these
-                        # A future enhancement could download and parse these with specialized libraries
-                        
-                        # Record as a potential signal based on title
-                        cdp_keywords = self.config["keywords"]["cdp_related"] + self.config["keywords"]["cdp_vendors"]
-                        title_lower = doc["title"].lower()
-                        
-                        if any(keyword.lower() in title_lower for keyword in cdp_keywords):
-                            signal = {
-                                "source": f"Investor {doc['type']}",
-                                "source_url": doc["url"],
-                                "snippet": f"Document Title: {doc['title']} - This {doc['type'].lower()} may contain CDP-related information but requires manual review",
-                                "raw_data": {
-                                    "document_type": doc["type"],
-                                    "document_title": doc["title"]
-                                }
-                            }
-                            
-                            # Classify the signal
-                            signal["signal_category"] = self.classify_signal(signal)
-                            signals.append(signal)
-                    else:
-                        # For HTML documents, we can try to scrape them
-                        try:
-                            response = await self.make_request(doc["url"], follow_redirects=True)
-                            
-                            # Extract text with trafilatura for better content extraction
-                            doc_text = trafilatura.extract(response.text)
-                            
-                            if not doc_text:
-                                # Fallback to basic extraction
-                                doc_soup = BeautifulSoup(response.text, "html.parser")
-                                doc_text = doc_soup.get_text()
-                            
-                            # Check for CDP-related keywords
-                            cdp_keywords = self.config["keywords"]["cdp_related"] + self.config["keywords"]["cdp_vendors"]
-                            doc_text_lower = self.clean_text(doc_text)
-                            
-                            # Find paragraphs containing CDP keywords
-                            paragraphs = re.split(r'\n+', doc_text)
-                            relevant_paragraphs = []
-                            
-                            for paragraph in paragraphs:
-                                paragraph = paragraph.strip()
-                                if len(paragraph) < 20:  # Skip very short paragraphs
-                                    continue
-                                    
-                                cleaned_para = self.clean_text(paragraph)
-                                
-                                # Check if paragraph contains any CDP keywords
-                                if any(keyword.lower() in cleaned_para for keyword in cdp_keywords):
-                                    relevant_paragraphs.append(paragraph)
-                                    
-                                    # Limit the number of paragraphs
-                                    if len(relevant_paragraphs) >= 5:
-                                        break
-                            
-                            # If we found relevant content, create a signal
-                            if relevant_paragraphs:
-                                snippet = " ... ".join(relevant_paragraphs[:3])  # First 3 paragraphs only
-                                
-                                if len(snippet) > 800:
-                                    snippet = snippet[:797] + "..."
-                                
-                                signal = {
-                                    "source": f"Investor Document ({doc['title']})",
-                                    "source_url": doc["url"],
-                                    "snippet": snippet,
-                                    "raw_data": {
-                                        "document_title": doc["title"],
-                                        "relevant_paragraphs": relevant_paragraphs
-                                    }
-                                }
-                                
-                                # Classify the signal
-                                signal["signal_category"] = self.classify_signal(signal)
-                                signals.append(signal)
-                        except Exception as e:
-                            logger.warning(f"Error processing investor document {doc['url']}: {str(e)}")
-                except Exception as e:
-                    logger.warning(f"Error processing investor document {doc['url']}: {str(e)}")
-                
-                # Sleep briefly between requests
-                await asyncio.sleep(1)
-                
+            results = await asyncio.gather(
+                *(self._process_investor_document(doc) for doc in doc_links)
+            )
+            signals.extend(signal for signal in results if signal)
+            
         except Exception as e:
             logger.error(f"Error gathering investor relations documents for {company}: {str(e)}")
         
         return signals
     
+    async def _process_investor_document(self, doc: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Build a signal from a single investor relations document.
+        
+        Args:
+            doc: Document dictionary with url, title and type
+            
+        Returns:
+            Signal dictionary, or None if the document has no relevant content
+        """
+        try:
+            # For PDFs and presentations, we need special handling
+            if doc["type"] in ["PDF", "Presentation"]:
+                # For now, we'll just record the link as we can't easily parse these
+                # A future enhancement could download and parse these with specialized libraries
+                
+                # Record as a potential signal based on title
+                keyword_groups = self._doc_matcher.find_groups(doc["title"].lower())
+                
+                if "cdp" not in keyword_groups:
+                    return None
+                
+                signal = {
+                    "source": f"Investor {doc['type']}",
+                    "source_url": doc["url"],
+                    "snippet": f"Document Title: {doc['title']} - This {doc['type'].lower()} may contain CDP-related information but requires manual review",
+                    "raw_data": {
+                        "document_type": doc["type"],
+                        "document_title": doc["title"]
+                    }
+                }
+            else:
+                # For HTML documents, we can try to scrape them
+                response = await self.make_request(doc["url"], follow_redirects=True)
+                
+                # Extract the main document text
+                doc_text = _extract_text(response.content)
+                
+                # Find paragraphs containing CDP keywords
+                relevant_paragraphs, keyword_groups = self._find_relevant_paragraphs(doc_text)
+                
+                # If we found relevant content, create a signal
+                if not relevant_paragraphs:
+                    return None
+                
+                snippet = _build_snippet(relevant_paragraphs)  # First 3 paragraphs only
+                
+                signal = {
+                    "source": f"Investor Document ({doc['title']})",
+                    "source_url": doc["url"],
+                    "snippet": snippet,
+                    "raw_data": {
+                        "document_title": doc["title"],
+                        "relevant_paragraphs": relevant_paragraphs
+                    }
+                }
+            
+            # Classify the signal, reusing the keyword hits found above
+            signal["signal_category"] = self.classify_signal(signal, keyword_groups)
+            return signal
+        
+        except Exception as e:
+            logger.warning(f"Error processing investor document {doc['url']}: {str(e)}")
+            return None
+    
     async def _gather_recent_news(self, company: str) -> List[Dict[str, Any]]:
         """
         Gather signals from recent news about the company.
@@ -461,46 +716,17 @@ class BusinessDocumentsSource(DataSourceBase):
                 logger.info(f"Could not find website for {company}, skipping news scan")
                 return signals
             
-            # Common news page patterns
-            news_patterns = [
-                "/news",
-                "/press",
-                "/press-releases",
-                "/newsroom",
-                "/press-room",
-                "/media",
-                "/media-center",
-                "/about/news",
-                "/about/press",
-                "/corporate/news",
-                "/company/news",
-                "/company/newsroom",
-                "/about-us/news",
-                "/en/news",
-                "/en/newsroom",
-                "/en-us/news",
-                "/news-events",
-                "/news-insights",
-                "/blog",
-                "/company-updates"
-            ]
-            
-            # Try each pattern to find the news page
-            news_url = None
-            for pattern in news_patterns:
-                test_url = urljoin(company_website, pattern)
-                try:
-                    response = await self.make_request(test_url, method="HEAD", timeout=5.0, follow_redirects=True)
-                    if response.status_code < 400:
-                        news_url = test_url
-                        break
-                except:
-                    continue
+            # Probe all patterns at once to find the news page
+            news_url = await self._first_reachable_url(
+                [urljoin(company_website, path) for path in NEWS_PATHS]
+            )
             
             if news_url:
                 # Scrape the news page for recent articles
                 response = await self.make_request(news_url, follow_redirects=True)
-                soup = BeautifulSoup(response.text, "html.parser")
+                tree = parse_html(response.content)
+                if tree is None:
+                    return signals
                 
                 # Look for news articles
                 article_links = []
@@ -509,25 +735,28 @@ class BusinessDocumentsSource(DataSourceBase):
                 # Try a variety of common patterns
                 
                 # 1. Look for article or news item containers
-                article_containers = (
-                    soup.select(".news-item, .press-release, .article, article, .news-article") or
-                    soup.select("[class*=news], [class*=article], [class*=press]") or
-                    soup.select(".post, .entry, .media-item")
-                )
+                article_containers = []
+                for find_containers in NEWS_CONTAINERS:
+                    article_containers = find_containers(tree)
+                    if article_containers:
+                        break
                 
                 if article_containers:
                     for container in article_containers[:self.max_docs_per_source]:
-                        link = container.find("a")
-                        if link and link.get("href"):
-                            title = link.get_text().strip() or container.find("h2") or container.find("h3")
-                            title = title.get_text().strip() if hasattr(title, "get_text") else str(title)
+                        link = next(container.iterdescendants("a"), None)
+                        if link is not None and link.get("href"):
+                            title = link.text_content().strip()
+                            if not title:
+                                heading = next(container.iterdescendants("h2"), None)
+                                if heading is None:
+                                    heading = next(container.iterdescendants("h3"), None)
+                                title = heading.text_content().strip() if heading is not None else ""
                             
                             # Try to find a date
-                            date_elem = (
-                                container.select_one(".date, .time, [class*=date], [class*=time]") or
-                                container.find("time")
-                            )
-                            date = date_elem.get_text().strip() if date_elem else ""
+                            date_elem = next(iter(NEWS_DATES(container)), None)
+                            if date_elem is None:
+                                date_elem = next(container.iterdescendants("time"), None)
+                            date = date_elem.text_content().strip() if date_elem is not None else ""
                             
                             href = link.get("href")
                             full_url = href if href.startswith(("http://", "https://")) else urljoin(news_url, href)
@@ -539,7 +768,7 @@ class BusinessDocumentsSource(DataSourceBase):
                             })
                 else:
                     # 2. If we didn't find containers, just look for links that might be news
-                    for a in soup.find_all("a"):
+                    for a in NEWS_LINK_CANDIDATES(tree):
                         href = a.get("href")
                         if not href:
                             continue
@@ -547,7 +776,7 @@ class BusinessDocumentsSource(DataSourceBase):
                         # Heuristics to identify news links
                         path_parts = href.split("/")
                         if any(part in ["news", "press", "release", "article"] for part in path_parts):
-                            title = a.get_text().strip()
+                            title = a.text_content().strip()
                             
                             if title and len(title) > 10:  # Skip very short or empty titles
                                 full_url = href if href.startswith(("http://", "https://")) else urljoin(news_url, href)
@@ -557,87 +786,67 @@ class BusinessDocumentsSource(DataSourceBase):
                                     "date": ""
                                 })
                 
-                # Process the news articles
+                # Process the news articles concurrently
                 article_links = article_links[:self.max_docs_per_source]
                 
-                for article in article_links:
-                    try:
-                        response = await self.make_request(article["url"], follow_redirects=True)
-                        
-                        # Extract text with trafilatura for better content extraction
-                        article_text = trafilatura.extract(response.text)
-                        
-                        if not article_text:
-                            # Fallback to basic extraction
-                            article_soup = BeautifulSoup(response.text, "html.parser")
-                            article_text = article_soup.get_text()
-                        
-                        # Check for CDP-related keywords
-                        cdp_keywords = self.config["keywords"]["cdp_related"] + self.config["keywords"]["cdp_vendors"]
-                        data_tech_keywords = self.config["keywords"]["data_tech"]
-                        article_text_lower = self.clean_text(article_text)
-                        
-                        # Find paragraphs containing CDP keywords
-                        paragraphs = re.split(r'\n+', article_text)
-                        relevant_paragraphs = []
-                        
-                        for paragraph in paragraphs:
-                            paragraph = paragraph.strip()
-                            if len(paragraph) < 20:  # Skip very short paragraphs
-                                continue
-                                
-                            cleaned_para = self.clean_text(paragraph)
-                            
-                            # Check if paragraph contains any CDP keywords
-                            if any(keyword.lower() in cleaned_para for keyword in cdp_keywords):
-                                relevant_paragraphs.append(paragraph)
-                                
-                                # Limit the number of paragraphs
-                                if len(relevant_paragraphs) >= 5:
-                                    break
-                                    
-                            # Also check for data tech keywords in combination with customer terms
-                            elif any(tech.lower() in cleaned_para for tech in self.config["keywords"]["data_tech"]):
-                                customer_terms = ["customer", "user", "experience", "journey", "personalization", "segment"]
-                                if any(term.lower() in cleaned_para for term in customer_terms):
-                                    relevant_paragraphs.append(paragraph)
-                                    
-                                    # Limit the number of paragraphs
-                                    if len(relevant_paragraphs) >= 5:
-                                        break
-                        
-                        # If we found relevant content, create a signal
-                        if relevant_paragraphs:
-                            snippet = " ... ".join(relevant_paragraphs[:3])  # First 3 paragraphs only
-                            
-                            if len(snippet) > 800:
-                                snippet = snippet[:797] + "..."
-                            
-                            signal = {
-                                "source": f"Company News ({article['date']})" if article["date"] else "Company News",
-                                "source_url": article["url"],
-                                "snippet": f"{article['title']}: {snippet}",
-                                "raw_data": {
-                                    "article_title": article["title"],
-                                    "article_date": article["date"],
-                                    "relevant_paragraphs": relevant_paragraphs
-                                }
-                            }
-                            
-                            # Classify the signal
-                            signal["signal_category"] = self.classify_signal(signal)
-                            signals.append(signal)
-                    except Exception as e:
-                        logger.warning(f"Error processing news article {article['url']}: {str(e)}")
-                    
-                    # Sleep briefly between requests
-                    await asyncio.sleep(1)
+                results = await asyncio.gather(
+                    *(self._process_news_article(article) for article in article_links)
+                )
+                signals.extend(signal for signal in results if signal)
             
         except Exception as e:
             logger.error(f"Error gathering news for {company}: {str(e)}")
         
         return signals
     
+    async def _process_news_article(self, article: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a single news article and build a signal from its relevant content.
+        
+        Args:
+            article: Article dictionary with url, title and date
+            
+        Returns:
+            Signal dictionary, or None if the article has no relevant content
+        """
+        try:
+            response = await self.make_request(article["url"], follow_redirects=True)
+            
+            # Extract the main article text
+            article_text = _extract_text(response.content)
+            
+            # Find paragraphs containing CDP keywords, or data tech
+            # keywords in combination with customer terms
+            relevant_paragraphs, keyword_groups = self._find_relevant_paragraphs(article_text, include_tech=True)
+            
+            # If we found relevant content, create a signal
+            if not relevant_paragraphs:
+                return None
+            
+            snippet = _build_snippet(relevant_paragraphs)  # First 3 paragraphs only
+            
+            # The article title is part of the snippet too
+            keyword_groups |= self._doc_matcher.find_groups(self.clean_text(article["title"]))
+            
+            signal = {
+                "source": f"Company News ({article['date']})" if article["date"] else "Company News",
+                "source_url": article["url"],
+                "snippet": f"{article['title']}: {snippet}",
+                "raw_data": {
+                    "article_title": article["title"],
+                    "article_date": article["date"],
+                    "relevant_paragraphs": relevant_paragraphs
+                }
+            }
+            
+            # Classify the signal, reusing the keyword hits found above
+            signal["signal_category"] = self.classify_signal(signal, keyword_groups)
+            return signal
+        
+        except Exception as e:
+            logger.warning(f"Error processing news article {article['url']}: {str(e)}")
+            return None
+    
     async def _gather_analyst_reports(self, company: str) -> List[Dict[str, Any]]:
         """
         Gather signals from analyst reports.
@@ -657,7 +866,7 @@ class BusinessDocumentsSource(DataSourceBase):
         
         try:
             # Check for analyst mentions in recent articles
-            cdp_related = "+OR+".join([f'"{k}"' for k in self.config["keywords"]["cdp_related"][:5]])
+            cdp_related = "+OR+".join([f'"{k}"' for k in self._cdp[:5]])
             query = f"{company}+({cdp_related})+analyst+report+OR+research"
             
             # See if there are any public results with our CSE ID
@@ -668,7 +877,7 @@ class BusinessDocumentsSource(DataSourceBase):
                 
                 try:
                     response = await self.make_request(url)
-                    soup = BeautifulSoup(response.text, "html.parser")
+                    soup = BeautifulSoup(response.content, "lxml")
                     
                     # Find search result items
                     result_containers = (
@@ -719,10 +928,84 @@ class BusinessDocumentsSource(DataSourceBase):
         
         return signals
     
+    def _find_relevant_paragraphs(self, text: str, include_tech: bool = False) -> Tuple[List[str], Set[str]]:
+        """
+        Find the paragraphs of a document that mention CDP keywords.
+        
+        The whole document is cleaned and scanned first, so documents without
+        any keyword skip the per-paragraph pass entirely.
+        
+        Args:
+            text: Document text
+            include_tech: Also accept paragraphs that combine a data technology
+                keyword with a customer-focused term
+            
+        Returns:
+            Up to 5 relevant paragraphs in document order, and the keyword
+            groups found in the snippet built from them
+        """
+        groups = self._doc_matcher.find_groups(self.clean_text(text))
+        has_tech = include_tech and "tech" in groups and "customer" in groups
+        if "cdp" not in groups and not has_tech:
+            return [], set()
+        
+        relevant_paragraphs = []
+        for paragraph in _PARAGRAPH_RE.split(text):
+            paragraph = paragraph.strip()
+            if len(paragraph) < 20:  # Skip very short paragraphs
+                continue
+            
+            para_groups = self._doc_matcher.find_groups(self.clean_text(paragraph))
+            if "cdp" in para_groups or (has_tech and {"tech", "customer"} <= para_groups):
+                relevant_paragraphs.append(paragraph)
+                
+                # Limit the number of paragraphs
+                if len(relevant_paragraphs) >= 5:
+                    break
+        
+        return relevant_paragraphs, self._snippet_groups(relevant_paragraphs)
+    
+    def _snippet_groups(self, paragraphs: List[str]) -> Set[str]:
+        """
+        Find the keyword groups in the snippet built from relevant paragraphs.
+        
+        The snippet keeps at most 800 characters, so keywords further into a
+        long paragraph must not count towards its classification.
+        
+        Args:
+            paragraphs: Relevant paragraphs in document order
+            
+        Returns:
+            Keyword groups found in the snippet
+        """
+        if not paragraphs:
+            return set()
+        return self._doc_matcher.find_groups(self.clean_text(_build_snippet(paragraphs)))
+    
     async def _find_company_website(self, company: str) -> Optional[str]:
         """
         Try to find the company's primary website.
         
+        The lookup runs once per company; concurrent and later callers await
+        the same result.
+        
+        Args:
+            company: Company name
+            
+        Returns:
+            Company website URL or None if not found
+        """
+        lookup = self._website_cache.get(company)
+        if lookup is None:
+            lookup = asyncio.ensure_future(self._resolve_company_website(company))
+            self._website_cache[company] = lookup
+        
+        return await lookup
+    
+    async def _resolve_company_website(self, company: str) -> Optional[str]:
+        """
+        Probe common domain patterns for the company's website.
+        
         Args:
             company: Company name
             
@@ -740,13 +1023,5 @@ class BusinessDocumentsSource(DataSourceBase):
             f"https://www.{company_dash}.com"
         ]
         
-        for domain in domains:
-            try:
-                response = await self.make_request(domain, method="HEAD", timeout=5.0, follow_redirects=True)
-                if response.status_code < 400:
-                    return domain
-            except:
-                continue
-        
-        # If we couldn't find the website, return None
-        return None
\ No newline at end of file
+        # Returns None if we couldn't find the website
+        return await self._first_reachable_url(domains)
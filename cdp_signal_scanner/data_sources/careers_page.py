@@ -5,23 +5,248 @@ Company careers page scraper for CDP Signal Scanner.
 import os
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, List, Any, Optional, Tuple
 import httpx
-from bs4 import BeautifulSoup
 import re
 from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+from lxml import etree
 
 from .base import DataSourceBase
+from ..utils import KeywordMatcher, load_json, lowercase_xpath, parse_html
 
 logger = logging.getLogger(__name__)
 
+# Keyword groups used to spot job titles and relevant roles
+JOB_TERM_GROUPS = {
+    "title": (
+        'manager', 'director', 'engineer', 'developer', 'specialist',
+        'analyst', 'coordinator', 'lead', 'head', 'chief', 'vp', 'president',
+        'officer', 'cto', 'ceo', 'cmo', 'cio', 'marketing', 'data', 'product',
+        'senior', 'junior', 'associate', 'principal', 'staff', 'intern'
+    ),
+    "analytics_role": ("analytics engineer", "data scientist"),
+    "focus": ("growth", "marketing", "customer"),
+    "data_role": ("data", "analytics", "customer insights", "audience", "segmentation"),
+    "customer": ("customer", "user", "audience", "segment", "profile", "personalization"),
+}
+
+# robots.txt rules are reused for 6 hours; sites whose robots.txt could not
+# be fetched are rechecked after 5 minutes
+ROBOTS_TTL = 6 * 60 * 60
+ROBOTS_FAILURE_TTL = 5 * 60
+ROBOTS_CACHE_SIZE = 1024
+
+# Only the first 500 KiB of a robots.txt is parsed, the minimum RFC 9309
+# asks crawlers to honour; anything past it is ignored as major crawlers do
+ROBOTS_MAX_BYTES = 500 * 1024
+
+# Network location of an http(s) URL, as urlparse would report it
+_HTTP_NETLOC_RE = re.compile(r"https?://([^/?#]*)", re.IGNORECASE)
+
+# Distinct job snippets whose classification is kept per scan
+CLASSIFY_CACHE_SIZE = 8192
+
+# HTML pages outside this size range are not parsed: smaller ones are error
+# stubs and larger ones would stall the scan for seconds
+MIN_PAGE_BYTES = 512
+MAX_PAGE_BYTES = 2_000_000
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# Maximum concurrent sitemap and job page fetches per source
+SITEMAP_FETCH_CONCURRENCY = 5
+
+# Job listing candidates on a careers page: headings, list items and
+# elements with a job-like class, found in document order in one pass
+HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5"})
+JOB_CLASS_NAMES = ("job", "position", "opening", "vacancy", "career")
+JOB_CANDIDATES = etree.XPath("//*[{}]".format(" or ".join(
+    [f"self::{tag}" for tag in sorted(HEADING_TAGS)] + ["self::li"] +
+    [f"contains({lowercase_xpath('@class')}, '{name}')" for name in JOB_CLASS_NAMES]
+)))
+
+# Lookups relative to a job listing element
+_ENCLOSING_LINK = etree.XPath("ancestor::a[1]")
+_FIRST_LINK = etree.XPath("(.//a)[1]")
+_FIRST_HEADING = etree.XPath("(.//*[self::h1 or self::h2 or self::h3 or self::h4 or self::h5])[1]")
+_FIRST_PARAGRAPH = etree.XPath("(.//p)[1]")
+_NEXT_PARAGRAPH = etree.XPath("(descendant::p|following::p)[1]")
+
+# Paths commonly used for careers pages, in order of preference
+CAREERS_PATHS = (
+    "/careers", "/jobs", "/work-with-us", "/join-us", "/join-our-team",
+    "/about/careers", "/about/jobs", "/company/careers", "/company/jobs",
+    "/en/careers", "/en/jobs"
+)
+
+# Link text that points from a homepage to its careers page
+CAREERS_KEYWORDS = ("career", "job", "join", "work with us", "position")
+
+# First homepage link whose text mentions a careers keyword, matched in libxml2
+CAREERS_LINK = etree.XPath("(//a[@href and ({})])[1]".format(" or ".join(
+    f"contains({lowercase_xpath('string(.)')}, '{keyword}')" for keyword in CAREERS_KEYWORDS
+)))
+
+
+def _sitemap_locs(content: bytes) -> Tuple[List[str], List[str]]:
+    """
+    Stream the <loc> entries out of a sitemap or sitemap index.
+    
+    Each <sitemap> or <url> entry is discarded once read, so large sitemaps
+    are never held in memory as a whole tree.
+    
+    Args:
+        content: Raw sitemap XML
+        
+    Returns:
+        Tuple of (sub-sitemap URLs, page URLs)
+    """
+    sitemaps = []
+    pages = []
+    
+    try:
+        for _, elem in etree.iterparse(
+            BytesIO(content), tag=("{*}sitemap", "{*}url"), recover=True, resolve_entities=False
+        ):
+            loc = elem.findtext("{*}loc")
+            if loc:
+                (sitemaps if etree.QName(elem).localname == "sitemap" else pages).append(loc.strip())
+            
+            # Drop the finished entry and any already processed siblings
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    except etree.XMLSyntaxError:
+        # Keep whatever was read before the document broke off
+        pass
+    
+    return sitemaps, pages
+
+
+def _job_page_summary(content: bytes) -> Optional[Tuple[str, str]]:
+    """
+    Read the title and meta description of a job page.
+    
+    Args:
+        content: Raw HTML of the job page
+        
+    Returns:
+        Tuple of (title, description), or None if the page could not be parsed
+    """
+    tree = parse_html(content)
+    if tree is None:
+        return None
+    
+    title_elem = tree.find('.//title')
+    title = title_elem.text_content() if title_elem is not None else ""
+    
+    meta_desc = tree.find(".//meta[@name='description']")
+    description = meta_desc.get('content', "") if meta_desc is not None else ""
+    
+    return title, description
+
+
+def _is_html(content_type: str) -> bool:
+    """
+    Check if a Content-Type header allows the body to be parsed as HTML.
+    
+    Args:
+        content_type: Content-Type header value, or "" if missing
+        
+    Returns:
+        True for HTML types or a missing header
+    """
+    return not content_type or content_type.lower().startswith(HTML_CONTENT_TYPES)
+
+
+@lru_cache(maxsize=4096)
+def _domain_matches(url: str, company_slug: str) -> bool:
+    """
+    Check if a URL's domain matches a company name.
+    
+    Cached because search results repeat the same URLs across a batch scan.
+    
+    Args:
+        url: URL to check
+        company_slug: Lowercased company name without spaces, commas or dots
+        
+    Returns:
+        True if the company name is in the domain or vice versa
+    """
+    if not url:
+        return False
+    
+    # Read the host straight out of http(s) URLs, falling back to urlparse
+    match = _HTTP_NETLOC_RE.match(url)
+    if match:
+        domain = match.group(1).lower()
+    else:
+        try:
+            domain = urlparse(url).netloc.lower()
+        except ValueError:
+            return False
+    
+    # Remove www. prefix
+    if domain.startswith("www."):
+        domain = domain[4:]
+    
+    # Check if company name is in domain, or the domain's first label in the name
+    return company_slug in domain or domain.partition('.')[0] in company_slug
+
+
+@lru_cache(maxsize=1024)
+def _candidate_urls(company_slug: str, company_slug_dash: str) -> Tuple[str, ...]:
+    """
+    Build the common website URL patterns for a company.
+    
+    Args:
+        company_slug: Lowercased company name without spaces
+        company_slug_dash: Lowercased company name with spaces replaced by dashes
+        
+    Returns:
+        Candidate website URLs in order of preference
+    """
+    return (
+        f"https://{company_slug}.com",
+        f"https://www.{company_slug}.com",
+        f"https://{company_slug}.ai",
+        f"https://www.{company_slug}.ai",
+        f"https://{company_slug}.co",
+        f"https://www.{company_slug}.co",
+        f"https://{company_slug}.io",
+        f"https://www.{company_slug}.io",
+        f"https://{company_slug_dash}.com",
+        f"https://www.{company_slug_dash}.com"
+    )
+
+
+@lru_cache(maxsize=4096)
+def _base_url(url: str) -> str:
+    """
+    Get the scheme and host part of a URL.
+    
+    Args:
+        url: URL to split
+        
+    Returns:
+        Base URL such as https://example.com
+    """
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
 
 class CareersPageSource(DataSourceBase):
     """
     Scrapes company career pages to identify hiring signals related to CDPs.
-    Uses BeautifulSoup for HTML parsing and respects robots.txt.
+    Uses lxml for HTML parsing and respects robots.txt.
     """
     
+    __slots__ = ("robots_cache", "_job_matcher", "_sitemap_semaphore", "_classify_snippet")
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the careers page scraper.
@@ -30,7 +255,28 @@ class CareersPageSource(DataSourceBase):
             config: Configuration dictionary
         """
         super().__init__(config)
-        self.robots_cache = {}  # Cache for robots.txt rules
+        # LRU cache of robots.txt rules: base URL -> (parser or None, expiry)
+        self.robots_cache = OrderedDict()
+        
+        # Every keyword group the relevance rules use, compiled into one
+        # matcher so a title or description is scanned once
+        self._job_matcher = KeywordMatcher({
+            "persona": self._personas,
+            "cdp": self._cdp + self._vendors + self._tech,
+            **JOB_TERM_GROUPS,
+        })
+        
+        # Per source instance, so one company's site never gets more than
+        # SITEMAP_FETCH_CONCURRENCY fetches at once while other scans run freely
+        self._sitemap_semaphore = asyncio.Semaphore(SITEMAP_FETCH_CONCURRENCY)
+        
+        # Careers pages repeat boilerplate titles, so each distinct
+        # "title description" snippet is classified only once per scan
+        self._classify_snippet = type(self).get_shared_cache(
+            config, "classify_snippet",
+            lambda snippet: self.classify_signal({"snippet": snippet}),
+            CLASSIFY_CACHE_SIZE,
+        )
     
     async def gather_signals(self, company: str) -> List[Dict[str, Any]]:
         """
@@ -66,11 +312,14 @@ class CareersPageSource(DataSourceBase):
                         logger.info(f"Scraping careers page: {careers_url}")
                         response = await self.make_request(careers_url)
                         
-                        # Parse HTML
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        # Look for job listings
-                        job_listings = await self._extract_job_listings(soup, careers_url)
+                        # Look for job listings, skipping pages not worth parsing
+                        job_listings = []
+                        if not _is_html(response.headers.get("content-type", "")):
+                            logger.info(f"Careers page {careers_url} is not HTML, skipping")
+                        elif not MIN_PAGE_BYTES <= len(response.content) <= MAX_PAGE_BYTES:
+                            logger.info(f"Careers page {careers_url} is {len(response.content)} bytes, skipping")
+                        else:
+                            job_listings = await self._extract_job_listings(response.content, careers_url)
                         
                         # Process each job listing
                         for job in job_listings:
@@ -90,9 +339,7 @@ class CareersPageSource(DataSourceBase):
                                         "title": title,
                                         "description": description[:300] + "..." if len(description) > 300 else description
                                     },
-                                    "signal_category": self.classify_signal({
-                                        "snippet": f"{title} {description}"
-                                    })
+                                    "signal_category": self._classify_snippet(f"{title} {description}")
                                 }
                                 signals.append(signal)
                         
@@ -136,6 +383,7 @@ class CareersPageSource(DataSourceBase):
             List of possible company website URLs
         """
         urls = []
+        search_urls = []
         
         try:
             # Clean company name for various formats
@@ -144,18 +392,7 @@ class CareersPageSource(DataSourceBase):
             company_slug_dash = clean_company.lower().replace(" ", "-")
             
             # Add common URL patterns
-            urls.extend([
-                f"https://{company_slug}.com",
-                f"https://www.{company_slug}.com",
-                f"https://{company_slug}.ai",
-                f"https://www.{company_slug}.ai",
-                f"https://{company_slug}.co",
-                f"https://www.{company_slug}.co",
-                f"https://{company_slug}.io",
-                f"https://www.{company_slug}.io",
-                f"https://{company_slug_dash}.com",
-                f"https://www.{company_slug_dash}.com"
-            ])
+            urls.extend(_candidate_urls(company_slug, company_slug_dash))
             
             # Use Google CSE API if available
             google_api_key = os.getenv("GOOGLE_API_KEY")
@@ -167,19 +404,20 @@ class CareersPageSource(DataSourceBase):
                 
                 try:
                     response = await self.make_request(url)
-                    data = response.json()
+                    data = load_json(response.content)
                     
                     # Extract results that look like company websites
                     for item in data.get("items", []):
                         link = item.get("link", "")
                         # Check if it's likely a company domain
-                        if self._is_likely_company_domain(link, clean_company):
-                            urls.insert(0, link)  # Add to beginning of list (higher priority)
+                        if _domain_matches(link, company_slug):
+                            search_urls.append(link)
                 except Exception as e:
                     logger.warning(f"Error using Google CSE for {company}: {str(e)}")
             
-            # Return de-duplicated list of URLs
-            return list(dict.fromkeys(urls))  # Preserves order while removing duplicates
+            # Search results come first (higher priority), in their ranked order.
+            # Return de-duplicated list of URLs.
+            return list(dict.fromkeys(search_urls + urls))  # Preserves order while removing duplicates
                 
         except Exception as e:
             logger.warning(f"Error finding websites for {company}: {str(e)}")
@@ -198,37 +436,6 @@ class CareersPageSource(DataSourceBase):
         websites = await self._find_all_company_websites(company)
         return websites[0] if websites else None
     
-    def _is_likely_company_domain(self, url: str, company: str) -> bool:
-        """
-        Check if a URL is likely to be the company's domain.
-        
-        Args:
-            url: URL to check
-            company: Company name
-            
-        Returns:
-            True if likely a company domain
-        """
-        if not url:
-            return False
-        
-        try:
-            # Parse the URL
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
-            # Remove www. prefix
-            if domain.startswith("www."):
-                domain = domain[4:]
-            
-            # Clean company name for comparison
-            clean_company = company.lower().replace(" ", "").replace(",", "").replace(".", "")
-            
-            # Check if company name is in domain
-            return clean_company in domain or domain.split('.')[0] in clean_company
-        except:
-            return False
-    
     async def _find_careers_page(self, company_url: str) -> Optional[str]:
         """
         Find the careers page URL for a company.
@@ -239,40 +446,22 @@ class CareersPageSource(DataSourceBase):
         Returns:
             Careers page URL or None if not found
         """
-        common_careers_paths = [
-            "/careers", "/jobs", "/work-with-us", "/join-us", "/join-our-team",
-            "/about/careers", "/about/jobs", "/company/careers", "/company/jobs",
-            "/en/careers", "/en/jobs"
-        ]
-        
-        # Check all common paths
-        for path in common_careers_paths:
-            try:
-                careers_url = urljoin(company_url, path)
-                response = await self.client.head(
-                    careers_url, 
-                    follow_redirects=True,
-                    timeout=5.0
-                )
-                
-                if response.status_code == 200:
-                    return careers_url
-            except:
-                continue
+        # Check all common paths concurrently
+        careers_url = await self._first_reachable_url(
+            [urljoin(company_url, path) for path in CAREERS_PATHS]
+        )
+        if careers_url:
+            return careers_url
         
         # If no common path works, look for careers links on the homepage
         try:
             response = await self.make_request(company_url)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            tree = parse_html(response.content)
             
             # Look for links with careers-related text
-            careers_keywords = ["career", "job", "join", "work with us", "position"]
-            for link in soup.find_all('a', href=True):
-                href = link.get('href', '')
-                link_text = link.get_text().lower()
-                
-                if any(keyword in link_text for keyword in careers_keywords):
-                    return urljoin(company_url, href)
+            links = CAREERS_LINK(tree) if tree is not None else []
+            if links:
+                return urljoin(company_url, links[0].get('href'))
         except:
             pass
         
@@ -289,127 +478,138 @@ class CareersPageSource(DataSourceBase):
             True if scraping is allowed
         """
         try:
-            # Parse the URL
-            parsed = urlparse(url)
-            base_url = f"{parsed.scheme}://{parsed.netloc}"
+            base_url = _base_url(url)
             
             # Check cache first
-            if base_url in self.robots_cache:
-                return self.robots_cache[base_url]
+            entry = self.robots_cache.get(base_url)
+            if entry is not None and entry[1] > time.monotonic():
+                self.robots_cache.move_to_end(base_url)
+                rules = entry[0]
+            else:
+                rules = await self._fetch_robots(base_url)
+            
+            # No rules means robots.txt is missing or unreadable, so scraping is allowed
+            if rules is None:
+                return True
             
-            # Fetch robots.txt
-            robots_url = f"{base_url}/robots.txt"
-            try:
-                response = await self.client.get(robots_url, timeout=5.0)
-                
-                if response.status_code == 200:
-                    robots_txt = response.text
-                    
-                    # Extract user-agent and disallow rules
-                    user_agent_lines = [line.strip() for line in robots_txt.split('\n') 
-                                    if line.strip().lower().startswith('user-agent:')]
-                    disallow_lines = [line.strip() for line in robots_txt.split('\n') 
-                                   if line.strip().lower().startswith('disallow:')]
-                    
-                    # Check if our user-agent or * is disallowed from the URL path
-                    path = parsed.path or '/'
-                    
-                    for disallow in disallow_lines:
-                        # Extract disallowed path
-                        disallowed_path = disallow.split(':', 1)[1].strip()
-                        
-                        # Check if our path matches the disallowed path
-                        if disallowed_path and path.startswith(disallowed_path):
-                            self.robots_cache[base_url] = False
-                            return False
-            except:
-                # If robots.txt doesn't exist or can't be parsed, assume we can scrape
-                pass
-            
-            # If we get here, scraping is allowed
-            self.robots_cache[base_url] = True
-            return True
+            user_agent = self.config.get("scraping", {}).get("headers", {}).get("User-Agent", "*")
+            return rules.can_fetch(user_agent, url)
             
         except Exception as e:
             logger.warning(f"Error checking robots.txt for {url}: {str(e)}")
             # Be conservative and allow scraping on error
             return True
     
-    async def _extract_job_listings(self, soup: BeautifulSoup, careers_url: str) -> List[Dict[str, Any]]:
+    async def _fetch_robots(self, base_url: str) -> Optional[RobotFileParser]:
+        """
+        Fetch and parse a site's robots.txt and cache the result.
+        
+        Args:
+            base_url: Scheme and host of the site
+            
+        Returns:
+            Parsed rules, or None if robots.txt could not be fetched
+        """
+        rules = None
+        ttl = ROBOTS_FAILURE_TTL
+        try:
+            response = await self.client.get(f"{base_url}/robots.txt", timeout=5.0)
+            if response.status_code == 200:
+                rules = RobotFileParser()
+                robots_txt = response.content[:ROBOTS_MAX_BYTES].decode("utf-8", "replace")
+                rules.parse(robots_txt.splitlines())
+                ttl = ROBOTS_TTL
+        except httpx.HTTPError:
+            # If robots.txt can't be fetched, assume we can scrape
+            pass
+        
+        self.robots_cache[base_url] = (rules, time.monotonic() + ttl)
+        self.robots_cache.move_to_end(base_url)
+        if len(self.robots_cache) > ROBOTS_CACHE_SIZE:
+            self.robots_cache.popitem(last=False)
+        
+        return rules
+    
+    async def _extract_job_listings(self, content: bytes, careers_url: str) -> List[Dict[str, Any]]:
         """
         Extract job listings from a careers page.
         
+        Parsing runs in a worker thread so other scans keep making progress.
+        
         Args:
-            soup: BeautifulSoup object for the careers page
+            content: Raw HTML of the careers page
             careers_url: URL of the careers page for resolving relative links
             
         Returns:
             List of job dictionaries
         """
-        job_listings = []
+        return await asyncio.to_thread(self._parse_job_listings, content, careers_url)
+    
+    def _parse_job_listings(self, content: bytes, careers_url: str) -> List[Dict[str, Any]]:
+        """
+        Parse job listings out of a careers page.
         
-        # Look for common job listing patterns
-        # 1. Look for job titles in headings
-        for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5']):
-            title = heading.get_text().strip()
+        Args:
+            content: Raw HTML of the careers page
+            careers_url: URL of the careers page for resolving relative links
             
-            # Check if heading looks like a job title
-            if self._is_likely_job_title(title):
-                # Find a nearby link
-                link = heading.find_parent('a') or heading.find('a')
-                url = urljoin(careers_url, link['href']) if link and link.has_attr('href') else careers_url
-                
-                # Try to find a description
-                description = ""
-                next_p = heading.find_next('p')
-                if next_p:
-                    description = next_p.get_text().strip()
-                
-                job_listings.append({
-                    'title': title,
-                    'url': url,
-                    'description': description
-                })
+        Returns:
+            List of job dictionaries
+        """
+        job_listings = []
         
-        # 2. Look for job listings in list items
-        for li in soup.find_all('li'):
-            # Check if list item contains a job title
-            title = li.get_text().strip()
-            if self._is_likely_job_title(title):
-                # Find a link
-                link = li.find('a')
-                url = urljoin(careers_url, link['href']) if link and link.has_attr('href') else careers_url
-                
-                job_listings.append({
-                    'title': title,
-                    'url': url,
-                    'description': ""
-                })
+        tree = parse_html(content)
+        if tree is None:
+            return job_listings
         
-        # 3. Look for job listings in divs with common job listing classes
-        job_classes = ['job', 'position', 'opening', 'vacancy', 'career']
-        for class_name in job_classes:
-            for element in soup.find_all(class_=lambda c: c and class_name in c.lower()):
-                # Try to find a title
-                title_elem = element.find(['h1', 'h2', 'h3', 'h4', 'h5']) or element
-                title = title_elem.get_text().strip()
-                
-                # Find a link
-                link = element.find('a')
-                url = urljoin(careers_url, link['href']) if link and link.has_attr('href') else careers_url
-                
-                # Try to find a description
-                description = ""
-                desc_elem = element.find('p')
-                if desc_elem:
-                    description = desc_elem.get_text().strip()
-                
+        def link_url(links: List[Any]) -> str:
+            href = links[0].get('href') if links else None
+            return urljoin(careers_url, href) if href is not None else careers_url
+        
+        # An element can match several patterns, e.g. a heading with a job
+        # class, so keep only the first listing for each title and link
+        seen = set()
+        
+        def add_listing(title: str, url: str, description: str):
+            if (title, url) not in seen:
+                seen.add((title, url))
                 job_listings.append({
                     'title': title,
                     'url': url,
                     'description': description
                 })
         
+        for element in JOB_CANDIDATES(tree):
+            tag = element.tag
+            
+            # 1. Job titles in headings, with a nearby link and description
+            if tag in HEADING_TAGS:
+                title = element.text_content().strip()
+                if self._is_likely_job_title(title):
+                    next_p = _NEXT_PARAGRAPH(element)
+                    add_listing(
+                        title,
+                        link_url(_ENCLOSING_LINK(element) or _FIRST_LINK(element)),
+                        next_p[0].text_content().strip() if next_p else ""
+                    )
+            
+            # 2. Job titles in list items
+            elif tag == 'li':
+                title = element.text_content().strip()
+                if self._is_likely_job_title(title):
+                    add_listing(title, link_url(_FIRST_LINK(element)), "")
+            
+            # 3. Elements with common job listing classes
+            class_name = (element.get('class') or "").lower()
+            if any(name in class_name for name in JOB_CLASS_NAMES):
+                title_elem = _FIRST_HEADING(element)
+                desc_elem = _FIRST_PARAGRAPH(element)
+                add_listing(
+                    (title_elem[0] if title_elem else element).text_content().strip(),
+                    link_url(_FIRST_LINK(element)),
+                    desc_elem[0].text_content().strip() if desc_elem else ""
+                )
+        
         return job_listings
     
     def _is_likely_job_title(self, text: str) -> bool:
@@ -422,19 +622,9 @@ class CareersPageSource(DataSourceBase):
         Returns:
             True if likely a job title
         """
-        # Common job title words
-        job_title_words = [
-            'manager', 'director', 'engineer', 'developer', 'specialist',
-            'analyst', 'coordinator', 'lead', 'head', 'chief', 'vp', 'president',
-            'officer', 'cto', 'ceo', 'cmo', 'cio', 'marketing', 'data', 'product',
-            'senior', 'junior', 'associate', 'principal', 'staff', 'intern'
-        ]
-        
-        # Clean and lowercase text
-        clean_text = self.clean_text(text)
-        
-        # Check if it contains job title words
-        return any(word in clean_text for word in job_title_words)
+        # Check if it contains job title words. These are plain words, so
+        # lowercasing finds the same matches as clean_text.
+        return self._job_matcher.contains(text.lower(), "title")
     
     def _is_relevant_job(self, title: str, description: str) -> bool:
         """
@@ -447,34 +637,27 @@ class CareersPageSource(DataSourceBase):
         Returns:
             True if job is relevant
         """
-        # Clean and lowercase text for matching
-        clean_title = self.clean_text(title)
-        clean_desc = self.clean_text(description)
-        
-        combined_text = f"{clean_title} {clean_desc}"
+        # Find every keyword group in the cleaned title
+        title_groups = self._job_matcher.find_groups(self.clean_text(title))
         
         # Check if it's a target persona
-        if any(persona in clean_title for persona in self.config["keywords"]["target_personas"]):
+        if "persona" in title_groups:
             return True
-            
+        
+        desc_groups = self._job_matcher.find_groups(self.clean_text(description))
+        
         # Analytics Engineer and Data Scientist roles can be highly relevant
-        if "analytics engineer" in clean_title or "data scientist" in clean_title:
-            if any(keyword in clean_title or keyword in clean_desc 
-                  for keyword in ["growth", "marketing", "customer"]):
-                return True
-                
-        # Check if title contains data roles we're specifically interested in
-        data_roles = ["data", "analytics", "customer insights", "audience", "segmentation"]
-        if any(role in clean_title for role in data_roles):
-            # Look for customer-focused terms in the description
-            customer_terms = ["customer", "user", "audience", "segment", "profile", "personalization"]
-            if any(term in clean_desc for term in customer_terms):
+        if "analytics_role" in title_groups:
+            if "focus" in title_groups or "focus" in desc_groups:
                 return True
         
-        # Check if any CDP-related keywords are in the title or description
-        cdp_keywords = self.config["keywords"]["cdp_related"] + self.config["keywords"]["cdp_vendors"] + self.config["keywords"]["data_tech"]
+        # Check if title contains data roles we're specifically interested in,
+        # with customer-focused terms in the description
+        if "data_role" in title_groups and "customer" in desc_groups:
+            return True
         
-        return any(keyword in combined_text for keyword in cdp_keywords)
+        # Check if any CDP-related keywords are in the title or description
+        return "cdp" in title_groups or "cdp" in desc_groups
     
     async def _scan_sitemap(self, company_url: str) -> List[Dict[str, Any]]:
         """
@@ -502,74 +685,114 @@ class CareersPageSource(DataSourceBase):
                 return signals
             
             # Parse the sitemap
-            soup = BeautifulSoup(response.text, 'xml')
+            sub_sitemaps, direct_urls = await asyncio.to_thread(_sitemap_locs, response.content)
             
             # Look for URLs in the sitemap
             urls = []
             
-            # Check for sitemap index
-            for sitemap in soup.find_all('sitemap'):
-                loc = sitemap.find('loc')
-                if loc:
-                    try:
-                        # Fetch and parse the sub-sitemap
-                        sub_url = loc.get_text().strip()
-                        sub_response = await self.client.get(sub_url, timeout=10.0)
-                        if sub_response.status_code == 200:
-                            sub_soup = BeautifulSoup(sub_response.text, 'xml')
-                            for url in sub_soup.find_all('url'):
-                                loc = url.find('loc')
-                                if loc:
-                                    urls.append(loc.get_text().strip())
-                    except:
-                        continue
+            # Fetch and parse the sub-sitemaps of a sitemap index concurrently
+            sub_responses = await asyncio.gather(
+                *(self._fetch_sitemap_page(sub_url) for sub_url in sub_sitemaps),
+                return_exceptions=True,
+            )
+            for sub_response in sub_responses:
+                if not isinstance(sub_response, BaseException) and sub_response.status_code == 200:
+                    sub_locs = await asyncio.to_thread(_sitemap_locs, sub_response.content)
+                    urls.extend(sub_locs[1])
             
             # Check for direct URLs
-            for url in soup.find_all('url'):
-                loc = url.find('loc')
-                if loc:
-                    urls.append(loc.get_text().strip())
+            urls.extend(direct_urls)
             
             # Filter URLs for potential job pages
             job_keywords = ['career', 'job', 'position', 'opening', 'vacancy']
             job_urls = [url for url in urls if any(keyword in url.lower() for keyword in job_keywords)]
             
-            # Process each job URL
-            for job_url in job_urls[:20]:  # Limit to 20 URLs to avoid overloading
-                try:
-                    job_response = await self.client.get(job_url, timeout=10.0)
-                    if job_response.status_code == 200:
-                        job_soup = BeautifulSoup(job_response.text, 'html.parser')
-                        
-                        # Extract the title from the page
-                        title = job_soup.title.get_text() if job_soup.title else ""
-                        
-                        # Extract a description
-                        description = ""
-                        meta_desc = job_soup.find('meta', attrs={'name': 'description'})
-                        if meta_desc and meta_desc.has_attr('content'):
-                            description = meta_desc['content']
-                        
-                        # Check if the page is relevant
-                        if self._is_relevant_job(title, description):
-                            signal = {
-                                "source": "Company Sitemap",
-                                "source_url": job_url,
-                                "snippet": title,
-                                "raw_data": {
-                                    "title": title,
-                                    "description": description
-                                },
-                                "signal_category": self.classify_signal({
-                                    "snippet": f"{title} {description}"
-                                })
-                            }
-                            signals.append(signal)
-                except:
+            # Fetch the job pages concurrently, limited to 20 URLs to avoid overloading
+            job_pages = await asyncio.gather(
+                *(self._fetch_job_page(job_url) for job_url in job_urls[:20]),
+                return_exceptions=True,
+            )
+            
+            fetched = [
+                (job_url, job_page) for job_url, job_page in zip(job_urls, job_pages)
+                if isinstance(job_page, bytes)
+            ]
+            
+            # Parse the job pages in worker threads so the event loop stays free
+            summaries = await asyncio.gather(
+                *(asyncio.to_thread(_job_page_summary, job_page) for _, job_page in fetched)
+            )
+            
+            for (job_url, _), summary in zip(fetched, summaries):
+                if summary is None:
                     continue
+                title, description = summary
+                
+                # Check if the page is relevant
+                if self._is_relevant_job(title, description):
+                    signal = {
+                        "source": "Company Sitemap",
+                        "source_url": job_url,
+                        "snippet": title,
+                        "raw_data": {
+                            "title": title,
+                            "description": description
+                        },
+                        "signal_category": self._classify_snippet(f"{title} {description}")
+                    }
+                    signals.append(signal)
             
             return signals
             
         except Exception as e:
             logger.warning(f"Error scanning sitemap for {company_url}: {str(e)}")
             return signals
+    
+    async def _fetch_sitemap_page(self, url: str) -> httpx.Response:
+        """
+        Fetch a sub-sitemap listed in a sitemap index.
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            HTTP response
+        """
+        async with self._sitemap_semaphore:
+            return await self.client.get(url, timeout=10.0)
+    
+    async def _fetch_job_page(self, url: str) -> Optional[bytes]:
+        """
+        Fetch a job page found through a sitemap, if it is worth parsing.
+        
+        The body is streamed so pages that are not HTML or are too large are
+        dropped without downloading them in full.
+        
+        Args:
+            url: URL of the job page
+            
+        Returns:
+            Page HTML, or None if the page failed or was skipped
+        """
+        async with self._sitemap_semaphore:
+            async with self.client.stream("GET", url, timeout=10.0) as response:
+                if response.status_code != 200:
+                    return None
+                if not _is_html(response.headers.get("content-type", "")):
+                    logger.debug(f"Skipping non-HTML job page {url}")
+                    return None
+                if int(response.headers.get("content-length") or 0) > MAX_PAGE_BYTES:
+                    logger.debug(f"Skipping oversized job page {url}")
+                    return None
+                
+                content = bytearray()
+                async for chunk in response.aiter_bytes():
+                    content += chunk
+                    if len(content) > MAX_PAGE_BYTES:
+                        logger.debug(f"Skipping oversized job page {url}")
+                        return None
+        
+        if len(content) < MIN_PAGE_BYTES:
+            logger.debug(f"Skipping near-empty job page {url}")
+            return None
+        return bytes(content)
@@ -5,14 +5,167 @@ Google Custom Search Engine data source for CDP Signal Scanner.
 import os
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional
+import time
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Sequence, Set
 import httpx
 from urllib.parse import quote
+from lxml import etree
 
 from .base import DataSourceBase
+from ..utils import KeywordMatcher, TokenBucket, has_class_xpath, load_json, parse_html
 
 logger = logging.getLogger(__name__)
 
+# Fixed keyword groups used to judge search result relevance
+RESULT_TERM_GROUPS = {
+    "customer": ("customer", "user", "experience", "journey", "personalization", "segment"),
+    "exec": ("appoint", "hire", "join", "name", "chief", "vp", "director", "head of"),
+    "department": ("data", "analytics", "marketing", "digital", "customer experience", "technology"),
+    "growth": ("funding", "series", "raised", "expansion", "launches", "growth"),
+    "tech_indicator": ("platform", "solution", "technology", "software", "data-driven", "analytics"),
+    # Phrases that strongly indicate CDP interest on their own
+    "strong": (
+        "unified customer data",
+        "customer 360",
+        "single customer view",
+        "first-party data strategy",
+        "data activation",
+        "personalization strategy"
+    ),
+}
+
+# Result items on a public CSE page, tried in order until one pattern matches:
+# ".gsc-webResult .gsc-result", then ".gs-result", then ".gsc-result"
+CSE_RESULT_CONTAINERS = (
+    etree.XPath(f"//*[{has_class_xpath('gsc-webResult')}]//*[{has_class_xpath('gsc-result')}]"),
+    etree.XPath(f"//*[{has_class_xpath('gs-result')}]"),
+    etree.XPath(f"//*[{has_class_xpath('gsc-result')}]"),
+)
+
+# Title, snippet and title link inside a result item (first match only)
+CSE_RESULT_TITLE = etree.XPath(f"(.//*[{has_class_xpath('gs-title')}])[1]")
+CSE_RESULT_SNIPPET = etree.XPath(f"(.//*[{has_class_xpath('gs-snippet')}])[1]")
+CSE_RESULT_LINK = etree.XPath(f"(.//a[{has_class_xpath('gs-title')}])[1]")
+
+# Seconds API queries are skipped after Google reports the quota as exhausted
+QUOTA_COOLDOWN = 600
+
+# Monotonic time until which API queries are skipped, shared by all sources
+# since the quota applies to the API key
+_quota_exhausted_until = 0.0
+
+# Distinct search results whose relevance is kept per scan
+RELEVANCE_CACHE_SIZE = 10_000
+
+# Keywords combined into one OR query, and Google's limit on query words
+QUERY_MAX_TERMS = 8
+QUERY_MAX_WORDS = 32
+
+# Extra fallback search terms alongside the configured keywords
+PERSONALIZATION_TERMS = ("real-time personalization", "customer journey", "personalized experience")
+
+# Public CSE pages scraped at once by the fallback search, and the pause
+# before each request
+FALLBACK_CONCURRENCY = 4
+FALLBACK_DELAY = 0.25
+
+
+def _merge_unique(results: List[Dict[str, Any]], signals: List[Dict[str, Any]], seen_urls: Set[str]):
+    """
+    Append signals whose URL has not been seen yet.
+    
+    Args:
+        results: New signals
+        signals: Collected signals, extended in place
+        seen_urls: URLs already collected, updated in place
+    """
+    for signal in results:
+        url = signal.get("source_url", "")
+        if url and url not in seen_urls:
+            seen_urls.add(url)
+            signals.append(signal)
+
+
+def _or_queries(company: str, terms: Sequence[str]) -> List[str]:
+    """
+    Combine keyword queries into as few OR queries as the limits allow.
+    
+    Each query reads ``"company" ("term 1" OR "term 2" ...)`` and holds at
+    most QUERY_MAX_TERMS terms and QUERY_MAX_WORDS words, counting the ORs.
+    Terms repeated with different case are searched once.
+    
+    Args:
+        company: Company name
+        terms: Keywords to search alongside the company name
+        
+    Returns:
+        Search queries, covering the terms in order
+    """
+    company_words = len(company.split())
+    
+    queries = []
+    seen = set()
+    batch: List[str] = []
+    words = company_words
+    for term in terms:
+        if term.lower() in seen:
+            continue
+        seen.add(term.lower())
+        
+        term_words = len(term.split()) + (1 if batch else 0)
+        if batch and (len(batch) >= QUERY_MAX_TERMS or words + term_words > QUERY_MAX_WORDS):
+            queries.append(_or_query(company, batch))
+            batch, words = [], company_words
+            term_words = len(term.split())
+        batch.append(term)
+        words += term_words
+    if batch:
+        queries.append(_or_query(company, batch))
+    return queries
+
+
+def _or_query(company: str, terms: List[str]) -> str:
+    """
+    Build a single query matching the company and any of the terms.
+    
+    Args:
+        company: Company name
+        terms: Keywords, at least one
+        
+    Returns:
+        Search query
+    """
+    if len(terms) == 1:
+        return f'"{company}" "{terms[0]}"'
+    return f'"{company}" (' + " OR ".join(f'"{term}"' for term in terms) + ")"
+
+
+def _trip_quota_breaker():
+    """
+    Skip Google CSE API queries for the next QUOTA_COOLDOWN seconds.
+    """
+    global _quota_exhausted_until
+    _quota_exhausted_until = time.monotonic() + QUOTA_COOLDOWN
+
+
+@lru_cache(maxsize=None)
+def _query_rate_limiter(rate_limit: float) -> TokenBucket:
+    """
+    Get the process-wide limiter for Google CSE queries.
+    
+    The quota applies to the API key, so every source shares one limiter.
+    Queries start at least 60 / rate_limit seconds apart with no burst,
+    which keeps any one-minute window within the quota.
+    
+    Args:
+        rate_limit: Allowed queries per minute
+        
+    Returns:
+        Shared rate limiter
+    """
+    return TokenBucket(1, 60 / rate_limit)
+
 
 class GoogleCSESource(DataSourceBase):
     """
@@ -20,6 +173,8 @@ class GoogleCSESource(DataSourceBase):
     news, blogs, press releases, and product pages related to CDPs.
     """
     
+    __slots__ = ("api_key", "cse_id", "_result_matcher", "_is_relevant_result")
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the Google CSE data source.
@@ -31,6 +186,22 @@ class GoogleCSESource(DataSourceBase):
         self.api_key = os.getenv("GOOGLE_API_KEY")
         self.cse_id = os.getenv("GOOGLE_CSE_ID")
         
+        # All relevance keyword groups in one matcher, so each result is scanned
+        # once. Keywords must start a word, so "chief" does not match "mischief"
+        # while stems like "appoint" still match "appointed".
+        self._result_matcher = KeywordMatcher({
+            "vendor": [vendor.lower() for vendor in self._vendors],
+            "concept": [concept.lower() for concept in self._cdp],
+            "data_tech": [tech.lower() for tech in self._tech],
+            **RESULT_TERM_GROUPS,
+        }, word_start=True)
+        
+        # The same result often comes back for several queries and companies,
+        # so each distinct (title, snippet) pair is judged only once per scan
+        self._is_relevant_result = type(self).get_shared_cache(
+            config, "is_relevant_result", self._result_relevance, RELEVANCE_CACHE_SIZE
+        )
+        
         if not self.api_key:
             logger.warning("GOOGLE_API_KEY not found in environment variables")
         if not self.cse_id:
@@ -58,21 +229,20 @@ class GoogleCSESource(DataSourceBase):
             logger.error("Skipping Google CSE scan: API key or CSE ID not set")
             return signals
         
+        # While the quota breaker is open every API query fails, so skip
+        # queuing them on the rate limiter and go straight to the fallback
+        if time.monotonic() < _quota_exhausted_until:
+            return await self._fallback_search(company)
+        
         try:
             # Create search queries based on signals we're looking for
             queries = []
             
-            # Add CDP vendor related queries
-            for vendor in self.config["keywords"]["cdp_vendors"]:
-                queries.append(f'"{company}" "{vendor}"')
-            
-            # Add CDP concept related queries
-            for concept in self.config["keywords"]["cdp_related"]:
-                queries.append(f'"{company}" "{concept}"')
-            
-            # Add data tech related queries
-            for tech in self.config["keywords"]["data_tech"]:
-                queries.append(f'"{company}" "{tech}"')
+            # Add CDP vendor, CDP concept and data tech queries, several
+            # keywords per query
+            queries.extend(_or_queries(company, self._vendors))
+            queries.extend(_or_queries(company, self._cdp))
+            queries.extend(_or_queries(company, self._tech))
             
             # Add executive movement queries
             queries.append(f'"{company}" "appoints" "chief" OR "vp" OR "director"')
@@ -82,28 +252,33 @@ class GoogleCSESource(DataSourceBase):
             queries.append(f'"{company}" "funding" OR "series" OR "raised"')
             queries.append(f'"{company}" "expansion" OR "launches" OR "growth"')
             
-            # Process each query with rate limiting
-            for i, query in enumerate(queries):
-                # Apply rate limiting as Google CSE has strict quotas
-                if i > 0:
-                    # Wait according to the rate limit in config
-                    rate_limit = self.config["api"]["google_cse"]["rate_limit"]
-                    await asyncio.sleep(60 / rate_limit)  # Convert to seconds
-                
-                results = await self._search_google(query)
-                signals.extend(results)
+            # Keywords shared between lists would otherwise repeat a query
+            queries = list(dict.fromkeys(queries))
             
-            # Deduplicate signals by URL
-            unique_signals = []
+            # Run the queries concurrently; the limiter paces their start
+            # times since Google CSE has strict quotas
+            rate_limiter = _query_rate_limiter(self.config["api"]["google_cse"]["rate_limit"])
+            tasks = [
+                asyncio.create_task(self._search_google(query, rate_limiter))
+                for query in queries
+            ]
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            
+            # A quota error stops the remaining queries and triggers the fallback
+            for task in pending:
+                task.cancel()
+            errors = [task.exception() for task in done if task.exception() is not None]
+            if errors:
+                raise errors[0]
+            
+            # Keep the first signal for each URL
             seen_urls = set()
-            for signal in signals:
-                url = signal.get("source_url", "")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_signals.append(signal)
+            for task in tasks:
+                _merge_unique(task.result(), signals, seen_urls)
+            self._categorize(signals)
             
-            logger.info(f"Found {len(unique_signals)} unique signals from Google CSE for {company}")
-            return unique_signals
+            logger.info(f"Found {len(signals)} unique signals from Google CSE for {company}")
+            return signals
             
         except Exception as e:
             logger.error(f"Error fetching Google CSE data for {company}: {str(e)}")
@@ -113,30 +288,46 @@ class GoogleCSESource(DataSourceBase):
                 return await self._fallback_search(company)
             raise
     
-    async def _search_google(self, query: str) -> List[Dict[str, Any]]:
+    async def _search_google(self, query: str, rate_limiter: Optional[TokenBucket] = None) -> List[Dict[str, Any]]:
         """
         Search Google using Custom Search API.
         
+        Once Google answers 429 or reports the quota as exhausted, every
+        query fails fast with a quota error for QUOTA_COOLDOWN seconds
+        instead of waiting on more rejected requests.
+        
         Args:
             query: Search query
+            rate_limiter: Limiter enforcing the Google CSE quota, acquired
+                before every attempt including retries
             
         Returns:
-            List of signal dictionaries
+            List of relevant, not yet classified signal dictionaries
         """
         signals = []
         
         try:
+            if time.monotonic() < _quota_exhausted_until:
+                raise Exception("Google CSE API quota exceeded, skipping query")
+            
             # Prepare the Google CSE request
             encoded_query = quote(query)
             url = f"https://www.googleapis.com/customsearch/v1?key={self.api_key}&cx={self.cse_id}&q={encoded_query}"
             
-            response = await self.make_request(url)
-            data = response.json()
+            try:
+                response = await self.make_request(url, rate_limiter=rate_limiter)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 429:
+                    _trip_quota_breaker()
+                    raise Exception(f"Google CSE API quota exceeded: {str(e)}") from e
+                raise
+            data = load_json(response.content)
             
             # Check if we hit quota limits
             if "error" in data:
                 error = data["error"]
                 if error.get("code") == 429 or "quota" in error.get("message", "").lower():
+                    _trip_quota_breaker()
                     raise Exception(f"Google CSE API quota exceeded: {error.get('message')}")
             
             # Process the search results
@@ -152,14 +343,13 @@ class GoogleCSESource(DataSourceBase):
                     signal = {
                         "source": "Google CSE",
                         "source_url": link,
+                        # The snippet already carries the title and result
+                        # snippet, so raw_data only records the search, as
+                        # the fallback scraper does
                         "snippet": f"{title} - {snippet}",
                         "raw_data": {
-                            "title": title,
-                            "snippet": snippet,
+                            "keywords": query
                         },
-                        "signal_category": self.classify_signal({
-                            "snippet": f"{title} {snippet}"
-                        })
                     }
                     signals.append(signal)
             
@@ -171,10 +361,29 @@ class GoogleCSESource(DataSourceBase):
             logger.warning(f"Error in Google CSE search for query '{query}': {str(e)}")
             return []
     
-    def _is_relevant_result(self, title: str, snippet: str) -> bool:
+    def _categorize(self, signals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Set the signal category on collected signals in one batch.
+        
+        Search helpers leave signals unclassified so duplicates found by
+        several queries are dropped before classification.
+        
+        Args:
+            signals: Signals to classify, updated in place
+            
+        Returns:
+            The same signals
+        """
+        for signal, category in zip(signals, self.classify_signals(signals)):
+            signal["signal_category"] = category
+        return signals
+    
+    def _result_relevance(self, title: str, snippet: str) -> bool:
         """
         Check if a search result is relevant to our CDP signal search.
         
+        Called through the memoized ``_is_relevant_result``.
+        
         Args:
             title: Result title
             snippet: Result snippet
@@ -186,56 +395,26 @@ class GoogleCSESource(DataSourceBase):
         clean_title = self.clean_text(title)
         clean_snippet = self.clean_text(snippet)
         
-        combined_text = f"{clean_title} {clean_snippet}"
-        
-        # Check for CDP vendors
-        if any(vendor.lower() in combined_text for vendor in self.config["keywords"]["cdp_vendors"]):
-            return True
-        
-        # Check for CDP concepts
-        if any(concept.lower() in combined_text for concept in self.config["keywords"]["cdp_related"]):
-            return True
-        
-        # Check for combined data tech + customer terms
-        data_tech_terms = [tech.lower() for tech in self.config["keywords"]["data_tech"]]
-        customer_terms = ["customer", "user", "experience", "journey", "personalization", "segment"]
-        
-        if any(tech in combined_text for tech in data_tech_terms) and any(term in combined_text for term in customer_terms):
-            return True
-        
-        # Check for executive movements related to data, marketing or customer experience
-        exec_keywords = ["appoint", "hire", "join", "name", "chief", "vp", "director", "head of"]
-        target_departments = ["data", "analytics", "marketing", "digital", "customer experience", "technology"]
+        hits = self._result_matcher.find_groups(f"{clean_title} {clean_snippet}")
         
-        if any(keyword in combined_text for keyword in exec_keywords) and any(dept in combined_text for dept in target_departments):
+        # CDP vendors, CDP concepts and strong CDP indicators count on their own
+        if not hits.isdisjoint(("vendor", "concept", "strong")):
             return True
         
-        # Check for funding and growth with tech indicators
-        growth_keywords = ["funding", "series", "raised", "expansion", "launches", "growth"]
-        tech_indicators = ["platform", "solution", "technology", "software", "data-driven", "analytics"]
-        
-        if any(keyword in combined_text for keyword in growth_keywords) and any(indicator in combined_text for indicator in tech_indicators):
-            return True
-            
-        # Special case: check for phrases that strongly indicate CDP interest
-        strong_indicators = [
-            "unified customer data", 
-            "customer 360", 
-            "single customer view",
-            "first-party data strategy",
-            "data activation",
-            "personalization strategy"
-        ]
-        
-        if any(indicator in combined_text for indicator in strong_indicators):
-            return True
-        
-        return False
+        # Data tech with customer terms, executive moves in data, marketing or
+        # customer experience, and funding or growth with tech indicators
+        return (
+            ("data_tech" in hits and "customer" in hits)
+            or ("exec" in hits and "department" in hits)
+            or ("growth" in hits and "tech_indicator" in hits)
+        )
     
     async def _fallback_search(self, company: str) -> List[Dict[str, Any]]:
         """
         Fallback search method when Google CSE quota is exhausted.
-        Uses a more targeted approach with fewer queries.
+        Uses a more targeted approach with fewer queries, or scrapes the
+        public CSE page while the quota breaker is open, since API queries
+        fail fast until then.
         
         Args:
             company: Company name
@@ -245,14 +424,18 @@ class GoogleCSESource(DataSourceBase):
         """
         signals = []
         
+        if time.monotonic() < _quota_exhausted_until:
+            logger.info(f"Google CSE API quota exhausted, scraping public CSE results for {company}")
+            return await self._fallback_search_without_api(company)
+        
         try:
             # Create a single targeted query to minimize API usage
-            cdp_vendors = " OR ".join([f'"{vendor}"' for vendor in self.config["keywords"]["cdp_vendors"][:3]])
-            cdp_terms = " OR ".join([f'"{term}"' for term in self.config["keywords"]["cdp_related"][:3]])
+            cdp_vendors = " OR ".join([f'"{vendor}"' for vendor in self._vendors[:3]])
+            cdp_terms = " OR ".join([f'"{term}"' for term in self._cdp[:3]])
             
             query = f'"{company}" ({cdp_vendors}) OR ({cdp_terms})'
             results = await self._search_google(query)
-            signals.extend(results)
+            signals.extend(self._categorize(results))
             
             return signals
             
@@ -263,7 +446,7 @@ class GoogleCSESource(DataSourceBase):
     async def _fallback_search_without_api(self, company: str) -> List[Dict[str, Any]]:
         """
         Fallback search method when Google API key is not available but CSE ID is.
-        Uses BeautifulSoup to scrape results from the public CSE interface.
+        Uses lxml to scrape results from the public CSE interface.
         
         Args:
             company: Company name
@@ -279,100 +462,117 @@ class GoogleCSESource(DataSourceBase):
             
         try:
             # Create targeted keyword lists for our search
-            cdp_related_keywords = self.config["keywords"]["cdp_related"][:8]  # Increased from 5
-            cdp_vendors = self.config["keywords"]["cdp_vendors"][:8]  # Increased from 5
-            data_tech_keywords = self.config["keywords"]["data_tech"][:5]  # Added data tech keywords
-            personalization_terms = ["real-time personalization", "customer journey", "personalized experience"]
-            
-            # Try to find signals for each keyword group
-            for keyword_group, group_name in [
-                (cdp_vendors, "CDP Vendors"),
-                (cdp_related_keywords, "CDP Concepts"),
-                (data_tech_keywords, "Data Technologies"),
-                (personalization_terms, "Personalization")
-            ]:
-                for keyword in keyword_group:
-                    # Create search query
-                    query = f"{company} {keyword}"
-                    logger.info(f"Performing fallback search for: {query}")
-                    
-                    # Use direct CSE search URL
-                    encoded_query = quote(query)
-                    url = f"https://cse.google.com/cse?cx={self.cse_id}&q={encoded_query}"
-                    
-                    try:
-                        response = await self.make_request(url)
-                        
-                        # Use BeautifulSoup to parse the response
-                        from bs4 import BeautifulSoup
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        # Find search result items
-                        results = []
-                        
-                        # Look for search results in common CSE formats
-                        result_containers = soup.select('.gsc-webResult .gsc-result')
-                        if not result_containers:
-                            result_containers = soup.select('.gs-result')
-                        if not result_containers:
-                            result_containers = soup.select('.gsc-result')
-                        
-                        for result in result_containers:
-                            try:
-                                # Extract title, snippet and link
-                                title_elem = result.select_one('.gs-title')
-                                snippet_elem = result.select_one('.gs-snippet')
-                                link_elem = result.select_one('a.gs-title')
-                                
-                                if title_elem and link_elem:
-                                    title = title_elem.get_text().strip()
-                                    snippet = snippet_elem.get_text().strip() if snippet_elem else ""
-                                    link = link_elem.get('href', '')
-                                    
-                                    # Skip if no link is found
-                                    if not link or not title:
-                                        continue
-                                        
-                                    # Check if the result is relevant
-                                    if self._is_relevant_result(title, snippet):
-                                        signal = {
-                                            "source": "Google CSE (Fallback)",
-                                            "source_url": link,
-                                            "snippet": f"{title} - {snippet}",
-                                            "raw_data": {
-                                                "title": title,
-                                                "snippet": snippet,
-                                                "keywords": f"{keyword} (from {group_name})"
-                                            },
-                                            "signal_category": self.classify_signal({
-                                                "snippet": f"{title} {snippet}"
-                                            })
-                                        }
-                                        results.append(signal)
-                            except Exception as e:
-                                logger.warning(f"Error processing search result: {str(e)}")
-                        
-                        logger.info(f"Found {len(results)} results for query '{query}'")
-                        signals.extend(results)
-                    
-                    except Exception as e:
-                        logger.warning(f"Error in fallback search for query '{query}': {str(e)}")
-                        
-                    # Add a small delay between requests to be polite
-                    await asyncio.sleep(2)
+            cdp_related_keywords = self._cdp[:8]  # Increased from 5
+            cdp_vendors = self._vendors[:8]  # Increased from 5
+            data_tech_keywords = self._tech[:5]  # Added data tech keywords
+            
+            # One (keyword, group) pair per query
+            searches = [
+                (keyword, group_name)
+                for keyword_group, group_name in [
+                    (cdp_vendors, "CDP Vendors"),
+                    (cdp_related_keywords, "CDP Concepts"),
+                    (data_tech_keywords, "Data Technologies"),
+                    (PERSONALIZATION_TERMS, "Personalization")
+                ]
+                for keyword in keyword_group
+            ]
+            
+            # Scrape a few pages at a time, with a short pause before each
+            # request to stay polite
+            semaphore = asyncio.Semaphore(FALLBACK_CONCURRENCY)
             
-            # Return unique signals
-            unique_signals = []
+            async def scrape(keyword: str, group_name: str) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    await asyncio.sleep(FALLBACK_DELAY)
+                    return await self._scrape_fallback_query(company, keyword, group_name)
+            
+            results_per_query = await asyncio.gather(
+                *(scrape(keyword, group_name) for keyword, group_name in searches)
+            )
+            
+            # Deduplicate by URL, keeping the first query's signal
             seen_urls = set()
-            for signal in signals:
-                url = signal.get("source_url", "")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_signals.append(signal)
+            for results in results_per_query:
+                _merge_unique(results, signals, seen_urls)
+            self._categorize(signals)
             
-            logger.info(f"Found {len(unique_signals)} unique signals from fallback CSE search for {company}")
-            return unique_signals
+            logger.info(f"Found {len(signals)} unique signals from fallback CSE search for {company}")
+            return signals
             
         except Exception as e:
             logger.error(f"Error in fallback search without API for {company}: {str(e)}")
             return []
+    
+    async def _scrape_fallback_query(self, company: str, keyword: str, group_name: str) -> List[Dict[str, Any]]:
+        """
+        Scrape one query from the public CSE interface.
+        
+        Args:
+            company: Company name
+            keyword: Keyword searched alongside the company name
+            group_name: Name of the keyword group, recorded on each signal
+            
+        Returns:
+            List of relevant, not yet classified signal dictionaries, empty
+            if the request failed
+        """
+        # Create search query
+        query = f"{company} {keyword}"
+        logger.info(f"Performing fallback search for: {query}")
+        
+        # Use direct CSE search URL
+        encoded_query = quote(query)
+        url = f"https://cse.google.com/cse?cx={self.cse_id}&q={encoded_query}"
+        
+        results = []
+        try:
+            response = await self.make_request(url)
+            
+            # Parse the response with lxml
+            tree = parse_html(response.content)
+            
+            # Look for search results in common CSE formats
+            result_containers = []
+            if tree is not None:
+                for find_containers in CSE_RESULT_CONTAINERS:
+                    result_containers = find_containers(tree)
+                    if result_containers:
+                        break
+            
+            for result in result_containers:
+                try:
+                    # Extract title, snippet and link
+                    title_elem = CSE_RESULT_TITLE(result)
+                    snippet_elem = CSE_RESULT_SNIPPET(result)
+                    link_elem = CSE_RESULT_LINK(result)
+                    
+                    if title_elem and link_elem:
+                        title = title_elem[0].text_content().strip()
+                        snippet = snippet_elem[0].text_content().strip() if snippet_elem else ""
+                        link = link_elem[0].get('href', '')
+                        
+                        # Skip if no link is found
+                        if not link or not title:
+                            continue
+                            
+                        # Check if the result is relevant
+                        if self._is_relevant_result(title, snippet):
+                            signal = {
+                                "source": "Google CSE (Fallback)",
+                                "source_url": link,
+                                "snippet": f"{title} - {snippet}",
+                                "raw_data": {
+                                    "keywords": f"{keyword} (from {group_name})"
+                                },
+                            }
+                            results.append(signal)
+                except Exception as e:
+                    logger.warning(f"Error processing search result: {str(e)}")
+            
+            logger.info(f"Found {len(results)} results for query '{query}'")
+        
+        except Exception as e:
+            logger.warning(f"Error in fallback search for query '{query}': {str(e)}")
+        
+        return results
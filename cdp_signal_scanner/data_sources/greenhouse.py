@@ -5,15 +5,42 @@ Greenhouse Job Board API data source for CDP Signal Scanner.
 import os
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 import json
 
 from .base import DataSourceBase
+from ..utils import KeywordMatcher, LookupCache, load_json
 
 logger = logging.getLogger(__name__)
 
+# Fixed keyword groups used to judge job relevance
+JOB_TERM_GROUPS = {
+    "analytics_role": ("analytics engineer", "data scientist"),
+    "focus": ("growth", "marketing", "customer"),
+    "data_role": ("data", "analytics", "customer insights", "audience", "segmentation"),
+    "department": ("marketing", "data", "analytics", "engineering", "product", "growth"),
+    "customer": ("customer", "user", "audience", "segment", "profile", "personalization"),
+    # Target areas and roles that together make a composite target persona
+    "area": ("data", "analytics", "marketing", "customer", "audience", "growth"),
+    "role": ("lead", "manager", "director", "vp", "head", "specialist", "engineer", "analyst"),
+}
+
+# Build board token slugs in a single pass: punctuation is dropped and spaces
+# are either dropped or turned into dashes
+_SLUG_TABLE = str.maketrans({" ": None, ",": None, ".": None})
+_DASH_SLUG_TABLE = str.maketrans({" ": "-", ",": None, ".": None})
+
+# Distinct job titles and departments whose keyword groups are kept per scan
+KEYWORD_GROUPS_CACHE_SIZE = 4096
+
+# Found tokens are remembered for a week, missing boards for an hour
+TOKEN_CACHE_TTL = 7 * 24 * 60 * 60
+TOKEN_MISS_CACHE_TTL = 60 * 60
+
+# Distinguishes "not cached" from a cached None (no board found)
+_NOT_CACHED = object()
+
 
 class GreenhouseSource(DataSourceBase):
     """
@@ -21,6 +48,8 @@ class GreenhouseSource(DataSourceBase):
     hiring signals related to CDPs.
     """
     
+    __slots__ = ("_job_matcher", "_token_cache", "_keyword_groups")
+    
     GREENHOUSE_API_URL = "https://boards-api.greenhouse.io/v1/boards/{token}/jobs"
     
     # Common Greenhouse board tokens for companies
@@ -29,6 +58,17 @@ class GreenhouseSource(DataSourceBase):
         # Add more common token patterns here
     ]
     
+    # Candidate token patterns in probing order, built once from COMMON_TOKENS:
+    # both slugs, then each slug with a suffix, then each slug with a prefix
+    TOKEN_TEMPLATES = (
+        "{slug}",
+        "{dash}",
+        *(f"{{slug}}{suffix}" for suffix in COMMON_TOKENS),
+        *(f"{{dash}}{suffix}" for suffix in COMMON_TOKENS),
+        *(f"{prefix}{{slug}}" for prefix in COMMON_TOKENS),
+        *(f"{prefix}{{dash}}" for prefix in COMMON_TOKENS),
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the Greenhouse data source.
@@ -37,6 +77,27 @@ class GreenhouseSource(DataSourceBase):
             config: Configuration dictionary
         """
         super().__init__(config)
+        
+        # Lowercased keyword groups compiled once, so each text is scanned once
+        self._job_matcher = KeywordMatcher({
+            "persona": self._personas,
+            "cdp": [keyword.lower() for keyword in self._cdp + self._vendors],
+            "data_tech": [tech.lower() for tech in self._tech],
+            **JOB_TERM_GROUPS,
+        })
+        
+        # Board token lookups cached across scans, enabled by scraping.lookup_cache_dir
+        cache_dir = config.get("scraping", {}).get("lookup_cache_dir")
+        self._token_cache = LookupCache(cache_dir) if cache_dir else None
+        
+        # Boards repeat the same titles and departments across many jobs and
+        # companies, so each distinct string is cleaned and scanned only once
+        # per scan
+        self._keyword_groups = type(self).get_shared_cache(
+            config, "keyword_groups",
+            lambda text: frozenset(self._job_matcher.find_groups(self.clean_text(text))),
+            KEYWORD_GROUPS_CACHE_SIZE,
+        )
     
     async def get_greenhouse_token(self, company: str) -> Optional[str]:
         """
@@ -49,31 +110,46 @@ class GreenhouseSource(DataSourceBase):
             Greenhouse board token or None if not found
         """
         # Try common patterns for the token
-        company_slug = company.lower().replace(" ", "").replace(",", "").replace(".", "")
-        company_slug_with_dash = company.lower().replace(" ", "-").replace(",", "").replace(".", "")
-        
-        potential_tokens = [
-            company_slug,
-            company_slug_with_dash,
-            *[f"{company_slug}{suffix}" for suffix in self.COMMON_TOKENS],
-            *[f"{company_slug_with_dash}{suffix}" for suffix in self.COMMON_TOKENS],
-            *[f"{suffix}{company_slug}" for suffix in self.COMMON_TOKENS],
-            *[f"{suffix}{company_slug_with_dash}" for suffix in self.COMMON_TOKENS],
-        ]
-        
-        # Try each token until one works
-        for token in potential_tokens:
-            try:
-                url = self.GREENHOUSE_API_URL.format(token=token)
-                response = await self.client.get(url)
-                if response.status_code == 200:
-                    logger.info(f"Found Greenhouse token for {company}: {token}")
-                    return token
-            except httpx.HTTPError:
-                pass
-        
-        logger.info(f"No Greenhouse token found for {company}")
-        return None
+        company_lower = company.lower()
+        company_slug = company_lower.translate(_SLUG_TABLE)
+        company_slug_with_dash = company_lower.translate(_DASH_SLUG_TABLE)
+        
+        # Reuse an earlier lookup, including one that found no board
+        cache_key = f"greenhouse-token:{company_slug}"
+        if self._token_cache is not None:
+            cached = self._token_cache.get(cache_key, _NOT_CACHED)
+            if cached is not _NOT_CACHED:
+                return cached
+        
+        potential_tokens = dict.fromkeys(
+            template.format(slug=company_slug, dash=company_slug_with_dash)
+            for template in self.TOKEN_TEMPLATES
+        )
+        
+        # Probe every token concurrently with HEAD, so no board listing is
+        # downloaded; the first working one in TOKEN_TEMPLATES order wins and
+        # the remaining probes are cancelled
+        urls = {
+            self.GREENHOUSE_API_URL.format(token=token): token
+            for token in potential_tokens
+        }
+        statuses: Dict[str, int] = {}
+        board_url = await self._first_reachable_url(list(urls), head=True, statuses=statuses)
+        token = urls[board_url] if board_url else None
+        
+        if token:
+            logger.info(f"Found Greenhouse token for {company}: {token}")
+        else:
+            logger.info(f"No Greenhouse token found for {company}")
+        
+        # A miss is only remembered when every candidate answered 404, so a
+        # timeout or server error does not hide the board on later scans
+        definitive = token is not None or (
+            len(statuses) == len(urls) and all(status == 404 for status in statuses.values())
+        )
+        if self._token_cache is not None and definitive:
+            self._token_cache.set(cache_key, token, TOKEN_CACHE_TTL if token else TOKEN_MISS_CACHE_TTL)
+        return token
     
     async def gather_signals(self, company: str) -> List[Dict[str, Any]]:
         """
@@ -97,7 +173,7 @@ class GreenhouseSource(DataSourceBase):
             # Fetch jobs from Greenhouse API
             url = self.GREENHOUSE_API_URL.format(token=token)
             response = await self.make_request(url)
-            data = response.json()
+            data = load_json(response.content)
             
             if "jobs" not in data:
                 logger.warning(f"Unexpected Greenhouse API response for {company}")
@@ -107,19 +183,18 @@ class GreenhouseSource(DataSourceBase):
             for job in data["jobs"]:
                 # Extract relevant information
                 title = job.get("title", "")
-                location = job.get("location", {}).get("name", "")
-                department = job.get("departments", [{}])[0].get("name", "") if job.get("departments") else ""
-                job_url = job.get("absolute_url", "")
-                
-                # Combine information into a snippet
-                snippet = f"{title} - {department} - {location}"
+                departments = job.get("departments")
+                department = departments[0].get("name", "") if departments else ""
                 
                 # Check if job is related to our target personas or keywords
                 if self._is_relevant_job(title, department, job.get("content", "")):
+                    location = (job.get("location") or {}).get("name", "")
+                    
                     signal = {
                         "source": "Greenhouse",
-                        "source_url": job_url,
-                        "snippet": snippet,
+                        "source_url": job.get("absolute_url", ""),
+                        # Combine information into a snippet
+                        "snippet": f"{title} - {department} - {location}",
                         "raw_data": {
                             "title": title,
                             "department": department,
@@ -140,6 +215,12 @@ class GreenhouseSource(DataSourceBase):
         """
         Check if a job is relevant to our CDP signal search.
         
+        Keyword groups for titles and departments are cached per distinct
+        string, so repeated titles and the persona check in gather_signals
+        cost a cache lookup. The description, usually the longest text, is
+        only cleaned and scanned when the title and department do not decide
+        the match.
+        
         Args:
             title: Job title
             department: Job department
@@ -148,76 +229,64 @@ class GreenhouseSource(DataSourceBase):
         Returns:
             True if job is relevant
         """
-        # Clean and lowercase text for matching
-        clean_title = self.clean_text(title)
-        clean_dept = self.clean_text(department)
-        clean_content = self.clean_text(content) if content else ""
+        title_groups = self._keyword_groups(title)
         
         # Check if it's a target persona
-        if self._is_target_persona(clean_title):
+        if self._is_target_persona(title, title_groups):
             return True
         
-        # Analytics Engineer and Data Scientist roles can be highly relevant
-        if "analytics engineer" in clean_title or "data scientist" in clean_title:
-            if any(keyword in clean_title or keyword in clean_dept or keyword in clean_content 
-                  for keyword in ["growth", "marketing", "customer"]):
-                return True
-        
         # Check if title contains data roles we're specifically interested in
-        data_roles = ["data", "analytics", "customer insights", "audience", "segmentation"]
-        if any(role in clean_title for role in data_roles):
+        if "data_role" in title_groups:
             return True
         
+        dept_groups = self._keyword_groups(department)
+        content_groups = None
+        
+        # Analytics Engineer and Data Scientist roles can be highly relevant
+        if "analytics_role" in title_groups:
+            if "focus" in title_groups or "focus" in dept_groups:
+                return True
+            content_groups = self._job_matcher.find_groups(self.clean_text(content))
+            if "focus" in content_groups:
+                return True
+        
         # Check if department is relevant
-        relevant_departments = ["marketing", "data", "analytics", "engineering", "product", "growth"]
-        if any(dept in clean_dept for dept in relevant_departments):
-            # Check if any CDP-related keywords are in the title or content
-            cdp_keywords = self.config["keywords"]["cdp_related"] + self.config["keywords"]["cdp_vendors"]
-            data_tech = self.config["keywords"]["data_tech"]
-            
+        if "department" in dept_groups:
             # Check title for CDP keywords
-            if any(keyword in clean_title for keyword in cdp_keywords):
+            if "cdp" in title_groups:
                 return True
-                
+            
             # Check for combinations of data technologies and customer-focused terms in content
-            if clean_content and any(tech in clean_content for tech in data_tech):
-                customer_terms = ["customer", "user", "audience", "segment", "profile", "personalization"]
-                if any(term in clean_content for term in customer_terms):
-                    return True
+            if content_groups is None:
+                content_groups = self._job_matcher.find_groups(self.clean_text(content))
+            if "data_tech" in content_groups and "customer" in content_groups:
+                return True
         
         return False
     
-    def _is_target_persona(self, title: str) -> bool:
+    def _is_target_persona(self, title: str, keyword_groups: Optional[Set[str]] = None) -> bool:
         """
         Check if a job title matches one of our target personas.
         
         Args:
             title: Job title to check
+            keyword_groups: Keyword groups already found in the title by the
+                caller, to skip rescanning it
             
         Returns:
             True if it's a target persona
         """
-        clean_title = self.clean_text(title)
+        groups = keyword_groups
+        if groups is None:
+            groups = self._keyword_groups(title)
         
         # Direct match with predefined target personas
-        if any(persona in clean_title for persona in self.config["keywords"]["target_personas"]):
+        if "persona" in groups:
             return True
-            
-        # Special case for data science roles in marketing/growth
-        if ("data scientist" in clean_title or "analytics engineer" in clean_title):
-            if "growth" in clean_title or "marketing" in clean_title or "customer" in clean_title:
-                return True
-                
-        # Check for composite roles that combine target areas
-        target_areas = ["data", "analytics", "marketing", "customer", "audience", "growth"]
-        target_roles = ["lead", "manager", "director", "vp", "head", "specialist", "engineer", "analyst"]
         
-        # Count how many target areas are in the title
-        area_matches = sum(1 for area in target_areas if area in clean_title)
-        role_matches = sum(1 for role in target_roles if role in clean_title)
+        # Special case for data science roles in marketing/growth
+        if "analytics_role" in groups and "focus" in groups:
+            return True
         
         # If we have both a role and an area match, it's likely a target persona
-        if area_matches >= 1 and role_matches >= 1:
-            return True
-            
-        return False
+        return "area" in groups and "role" in groups
@@ -5,20 +5,40 @@ Indeed job search data source for CDP Signal Scanner using SerpAPI.
 import os
 import logging
 import asyncio
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from urllib.parse import quote
 
 from .base import DataSourceBase
+from ..utils import KeywordMatcher, TokenBucket, load_json
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _serpapi_rate_limiter(rate_limit: float) -> TokenBucket:
+    """
+    Get the process-wide limiter for SerpAPI queries.
+    
+    The limit applies to the API key, so every source shares one limiter.
+    
+    Args:
+        rate_limit: Allowed queries per second
+        
+    Returns:
+        Shared rate limiter
+    """
+    return TokenBucket(rate_limit, 1.0)
+
+
 class IndeedSource(DataSourceBase):
     """
     Fetches job listings from Indeed using SerpAPI to identify
     hiring signals related to CDPs.
     """
     
+    __slots__ = ("api_key", "_keyword_matcher")
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the Indeed data source.
@@ -28,6 +48,9 @@ class IndeedSource(DataSourceBase):
         """
         super().__init__(config)
         self.api_key = os.getenv("SERPAPI_API_KEY")
+        
+        # CDP, vendor and data tech keywords compiled once for job relevance
+        self._keyword_matcher = KeywordMatcher({"keyword": self._cdp + self._vendors + self._tech})
         if not self.api_key:
             logger.warning("SERPAPI_API_KEY not found in environment variables")
     
@@ -41,59 +64,57 @@ class IndeedSource(DataSourceBase):
         Returns:
             List of signal dictionaries
         """
-        signals = []
-        
         if not self.api_key:
             logger.error("Skipping Indeed scan: SERPAPI_API_KEY not set")
-            return signals
+            return []
         
         try:
             # Create search queries based on target personas and CDP keywords
             queries = []
             
             # Create queries for each target persona
-            for persona in self.config["keywords"]["target_personas"]:
+            for persona in self._personas:
                 queries.append(f"{persona} {company}")
             
             # Add queries for CDP-related keywords
-            for keyword in self.config["keywords"]["cdp_related"]:
+            for keyword in self._cdp:
                 queries.append(f"{keyword} {company}")
             
             # Add queries for CDP vendors
-            for vendor in self.config["keywords"]["cdp_vendors"]:
+            for vendor in self._vendors:
                 queries.append(f"{vendor} {company}")
             
-            # Process each query with rate limiting
-            for i, query in enumerate(queries):
-                # Respect rate limits to avoid 429 errors
-                if i > 0:
-                    await asyncio.sleep(1)  # Simple rate limiting
-                
-                results = await self._search_indeed(query)
-                signals.extend(results)
+            # Run the queries concurrently; the shared limiter keeps them
+            # within the SerpAPI rate limit to avoid 429 errors
+            rate_limiter = _serpapi_rate_limiter(self.config["api"]["serpapi"]["rate_limit"])
+            results_per_query = await asyncio.gather(
+                *(self._search_indeed(query, rate_limiter) for query in queries)
+            )
             
-            # Deduplicate signals by URL
-            unique_signals = []
-            seen_urls = set()
-            for signal in signals:
-                url = signal.get("source_url", "")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    unique_signals.append(signal)
+            # Deduplicate signals by URL in one pass; the dict keeps the first
+            # signal for each URL in query order
+            unique_signals: Dict[str, Dict[str, Any]] = {}
+            for results in results_per_query:
+                for signal in results:
+                    url = signal.get("source_url", "")
+                    if url:
+                        unique_signals.setdefault(url, signal)
             
             logger.info(f"Found {len(unique_signals)} unique signals from Indeed for {company}")
-            return unique_signals
+            return list(unique_signals.values())
             
         except Exception as e:
             logger.error(f"Error fetching Indeed data for {company}: {str(e)}")
             raise
     
-    async def _search_indeed(self, query: str) -> List[Dict[str, Any]]:
+    async def _search_indeed(self, query: str, rate_limiter: Optional[TokenBucket] = None) -> List[Dict[str, Any]]:
         """
         Search Indeed using SerpAPI.
         
         Args:
             query: Search query
+            rate_limiter: Limiter enforcing the SerpAPI rate limit, acquired
+                before every attempt including retries
             
         Returns:
             List of signal dictionaries
@@ -105,8 +126,8 @@ class IndeedSource(DataSourceBase):
             encoded_query = quote(query)
             url = f"https://serpapi.com/search.json?engine=google_jobs&q={encoded_query}&api_key={self.api_key}"
             
-            response = await self.make_request(url)
-            data = response.json()
+            response = await self.make_request(url, rate_limiter=rate_limiter)
+            data = load_json(response.content)
             
             # Process the search results
             jobs_results = data.get("jobs_results", [])
@@ -162,10 +183,8 @@ class IndeedSource(DataSourceBase):
         combined_text = f"{clean_title} {clean_desc}"
         
         # Check if it's a target persona
-        if any(persona in clean_title for persona in self.config["keywords"]["target_personas"]):
+        if self._persona_matcher.contains(clean_title, "persona"):
             return True
         
         # Check if any CDP-related keywords are in the title or description
-        cdp_keywords = self.config["keywords"]["cdp_related"] + self.config["keywords"]["cdp_vendors"] + self.config["keywords"]["data_tech"]
-        
-        return any(keyword in combined_text for keyword in cdp_keywords)
+        return self._keyword_matcher.contains(combined_text, "keyword")
@@ -13,7 +13,13 @@ import pandas as pd
 import click
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from .config import load_config
+from .data_sources.base import DataSourceBase
 from .data_sources.greenhouse import GreenhouseSource
 from .data_sources.indeed import IndeedSource
 from .data_sources.careers_page import CareersPageSource
@@ -32,6 +38,18 @@ logger = logging.getLogger("cdp-signal-scanner")
 load_dotenv()
 
 
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create an event loop for a scan, using uvloop when it is installed.
+    
+    Returns:
+        New event loop
+    """
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
 async def scan_company(company: str, config: dict, scorer: SignalScorer) -> List[dict]:
     """
     Scan a single company for CDP signals across all data sources.
@@ -120,19 +138,31 @@ async def scan_companies(companies: List[str]) -> pd.DataFrame:
     
     # Scan all companies
     all_results = []
-    company_scores = {}
     
-    for company in companies:
-        results = await scan_company(company, config, scorer)
+    # Scan several companies at once so their network waits overlap
+    semaphore = asyncio.Semaphore(max(1, config["scraping"].get("company_concurrency", 8)))
+    
+    async def scan_bounded(company: str) -> List[dict]:
+        async with semaphore:
+            return await scan_company(company, config, scorer)
+    
+    try:
+        company_results = await asyncio.gather(
+            *(scan_bounded(company) for company in companies),
+            return_exceptions=True,
+        )
+    finally:
+        # Release the HTTP connection pool shared by this scan's data sources
+        await DataSourceBase.close_shared(config)
+    
+    for company, results in zip(companies, company_results):
+        if isinstance(results, BaseException):
+            logger.error(f"Error scanning {company}: {str(results)}")
+            results = []
         
-        # Add company to each result and track total score
-        company_total_score = 0
+        # Add company to each result
         for result in results:
             result["account"] = company
-            company_total_score += result.get("score", 0)
-        
-        # Store company's total score for later sorting
-        company_scores[company] = company_total_score
         all_results.extend(results)
     
     # Convert to DataFrame
@@ -147,10 +177,13 @@ async def scan_companies(companies: List[str]) -> pd.DataFrame:
     df = pd.DataFrame(all_results)
     
     # Add total company score to each row
-    df["total_company_score"] = df["account"].map(company_scores)
+    df["total_company_score"] = df.groupby("account")["score"].transform("sum")
     
-    # Sort by total company score (descending) and then by individual signal score (descending)
-    df = df.sort_values(by=["total_company_score", "score"], ascending=[False, False])
+    # Sort by total company score (descending) and then by individual signal
+    # score (descending); the stable sort keeps discovery order for ties
+    df = df.sort_values(
+        by=["total_company_score", "score"], ascending=[False, False], kind="mergesort"
+    )
     
     # Ensure the DataFrame has all required columns
     required_columns = ["account", "signal_category", "snippet", "score", "source_url"]
@@ -158,9 +191,6 @@ async def scan_companies(companies: List[str]) -> pd.DataFrame:
         if col not in df.columns:
             df[col] = pd.Series("", index=df.index)
     
-    # Sort by score (descending)
-    df = df.sort_values("score", ascending=False)
-    
     return df
 
 
@@ -199,9 +229,9 @@ def main(companies: Optional[str], file: Optional[str], output: str):
     # Run the scan
     logger.info(f"Starting scan for {len(company_list)} companies")
     
-    # Create event loop and run scan
-    loop = asyncio.get_event_loop()
-    results_df = loop.run_until_complete(scan_companies(company_list))
+    # Run the scan on a fresh event loop
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        results_df = runner.run(scan_companies(company_list))
     
     # Save results to CSV
     results_df.to_csv(output, index=False)
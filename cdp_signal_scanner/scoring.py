@@ -3,10 +3,33 @@ Signal scoring and classification module for CDP Signal Scanner.
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
+from .utils import KeywordMatcher, clean_text
+
 logger = logging.getLogger(__name__)
 
+# Distinct (category, snippet) pairs whose score is kept per scorer
+SCORE_CACHE_SIZE = 16384
+
+# Keyword groups that earn extra points, matched against the cleaned snippet
+SCORING_TERM_GROUPS = {
+    "cdp": (
+        "customer data platform", "cdp", "data integration", "customer 360",
+        "unified data", "real-time personalization", "data orchestration",
+        "customer journey", "omnichannel", "first-party data"
+    ),
+    "vendor": (
+        "segment", "mparticle", "rudderstack", "tealium",
+        "adobe real-time cdp", "blueconic", "lytics", "treasure data"
+    ),
+    "unified": (
+        "customer 360", "unified data", "real-time personalization",
+        "single view of customer", "data unification", "identity resolution"
+    ),
+}
+
 
 class SignalScorer:
     """
@@ -26,6 +49,26 @@ class SignalScorer:
             scoring_config: Dictionary of scoring rules and their point values
         """
         self.scoring_config = scoring_config
+        
+        # All scoring keyword groups in one matcher, so each snippet is scanned once
+        self._matcher = KeywordMatcher(SCORING_TERM_GROUPS)
+        
+        # The score depends only on the category and snippet, and the same
+        # job or article is often found several times
+        self._score_cached = lru_cache(maxsize=SCORE_CACHE_SIZE)(self._score)
+        
+        # Points per category, resolved from the config once: (keyword group
+        # that earns the higher points, points with it, points without it)
+        config = scoring_config
+        executive_points = config.get("executive_move_target_persona", 4)
+        funding_points = config.get("funding_or_expansion", 2)
+        self._category_points = {
+            "hiring_target_persona": ("cdp", config.get("hiring_target_persona_with_cdp_keywords", 5), 2),
+            "executive_move": (None, executive_points, executive_points),
+            "technology_signal": ("vendor", config.get("explicit_cdp_vendor_mention", 4), 2),
+            "growth_funding": (None, funding_points, funding_points),
+        }
+        self._unified_points = config.get("unified_data_concepts", 3)
         logger.info("Initialized signal scorer with config: %s", scoring_config)
     
     def score_signal(self, signal: Dict[str, Any]) -> int:
@@ -35,40 +78,40 @@ class SignalScorer:
         Args:
             signal: Signal dictionary to score
             
+        Returns:
+            Numeric score indicating the signal's strength
+        """
+        return self._score_cached(signal.get("signal_category", "other"), signal.get("snippet", ""))
+    
+    def _score(self, category: str, snippet: str) -> int:
+        """
+        Score a signal category and snippet. Called through the memoized
+        score_signal.
+        
+        Args:
+            category: Signal category
+            snippet: Signal snippet
+            
         Returns:
             Numeric score indicating the signal's strength
         """
         score = 0
-        category = signal.get("signal_category", "other")
-        snippet = signal.get("snippet", "").lower()
+        snippet = snippet.lower()
         
         # Clean the snippet to improve matching
         snippet = self._clean_text(snippet)
+        groups = self._matcher.find_groups(snippet)
         
-        # Score based on signal category
-        if category == "hiring_target_persona":
-            # Check if it also has CDP keywords
-            if self._contains_cdp_keywords(snippet):
-                score += self.scoring_config.get("hiring_target_persona_with_cdp_keywords", 5)
-            else:
-                score += 2  # Base score for hiring a target persona
-        
-        elif category == "executive_move":
-            score += self.scoring_config.get("executive_move_target_persona", 4)
-        
-        elif category == "technology_signal":
-            # Check for explicit CDP vendor mentions
-            if self._contains_cdp_vendor(snippet):
-                score += self.scoring_config.get("explicit_cdp_vendor_mention", 4)
-            else:
-                score += 2  # Base score for technology signal
-        
-        elif category == "growth_funding":
-            score += self.scoring_config.get("funding_or_expansion", 2)
+        # Score based on signal category, with higher points for hiring signals
+        # with CDP keywords and technology signals naming a CDP vendor
+        points = self._category_points.get(category)
+        if points is not None:
+            group, with_group, without_group = points
+            score = with_group if group in groups else without_group
         
         # Additional points for specific keywords or concepts
-        if self._contains_unified_data_concepts(snippet):
-            score += self.scoring_config.get("unified_data_concepts", 3)
+        if "unified" in groups:
+            score += self._unified_points
         
         # If we didn't score anything but it's a valid signal, give it a base score of 1
         if score == 0 and category != "other":
@@ -87,20 +130,7 @@ class SignalScorer:
         Returns:
             Cleaned text
         """
-        if not text:
-            return ""
-        
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Replace punctuation with spaces
-        for char in ",.!?;:()[]{}\"'":
-            text = text.replace(char, " ")
-        
-        # Remove extra whitespace
-        text = " ".join(text.split())
-        
-        return text
+        return clean_text(text)
     
     def _contains_cdp_keywords(self, text: str) -> bool:
         """
@@ -112,12 +142,7 @@ class SignalScorer:
         Returns:
             True if text contains CDP keywords
         """
-        cdp_keywords = [
-            "customer data platform", "cdp", "data integration", "customer 360",
-            "unified data", "real-time personalization", "data orchestration",
-            "customer journey", "omnichannel", "first-party data"
-        ]
-        return any(keyword in text for keyword in cdp_keywords)
+        return self._matcher.contains(text, "cdp")
     
     def _contains_cdp_vendor(self, text: str) -> bool:
         """
@@ -129,11 +154,7 @@ class SignalScorer:
         Returns:
             True if text contains CDP vendor mentions
         """
-        cdp_vendors = [
-            "segment", "mparticle", "rudderstack", "tealium", 
-            "adobe real-time cdp", "blueconic", "lytics", "treasure data"
-        ]
-        return any(vendor in text for vendor in cdp_vendors)
+        return self._matcher.contains(text, "vendor")
     
     def _contains_unified_data_concepts(self, text: str) -> bool:
         """
@@ -145,8 +166,4 @@ class SignalScorer:
         Returns:
             True if text contains unified data concepts
         """
-        concepts = [
-            "customer 360", "unified data", "real-time personalization",
-            "single view of customer", "data unification", "identity resolution"
-        ]
-        return any(concept in text for concept in concepts)
+        return self._matcher.contains(text, "unified")
@@ -2,15 +2,63 @@
 Utility functions for CDP Signal Scanner.
 """
 
+import hashlib
+import json
 import logging
+import os
+import pickle
 import re
-from typing import Dict, List, Any, Set, Optional
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any, Set, Optional
 from urllib.parse import urlparse
 import httpx
 import asyncio
+from bs4.dammit import UnicodeDammit
+import lxml.html
+from lxml import etree
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Common legal suffixes removed from company names, compiled once
+_LEGAL_SUFFIX_RE = re.compile(
+    "|".join([
+        r"\bInc\b", r"\bInc\.\b", r"\bCorp\b", r"\bCorp\.\b",
+        r"\bLLC\b", r"\bL\.L\.C\.\b", r"\bLtd\b", r"\bLtd\.\b",
+        r"\bLimited\b", r"\bLLC\.\b", r"\bCorporation\b", r"\bCompany\b",
+        r"\bGmbH\b", r"\bAG\b", r"\bS\.A\.\b", r"\bPlc\b", r"\bGroup\b"
+    ]),
+    re.IGNORECASE,
+)
+_NAME_PUNCT_RE = re.compile(r'[,\.\'"]')
+
+# Maps punctuation stripped by clean_text to spaces in a single pass
+_PUNCT_TABLE = str.maketrans({c: " " for c in ",.!?;:()[]{}\"'"})
+
+
+def clean_text(text: str) -> str:
+    """
+    Normalize text for keyword matching.
+    
+    Shared by the data sources and the scorer so both match keywords
+    against identically cleaned text.
+    
+    Args:
+        text: Text to clean
+        
+    Returns:
+        Lowercased text with punctuation replaced by spaces and whitespace
+        collapsed
+    """
+    if not text:
+        return ""
+    return " ".join(text.lower().translate(_PUNCT_TABLE).split())
+
 
 def clean_company_name(company: str) -> str:
     """
@@ -23,22 +71,11 @@ def clean_company_name(company: str) -> str:
         Cleaned company name
     """
     # Remove common legal suffixes
-    suffixes = [
-        r"\bInc\b", r"\bInc\.\b", r"\bCorp\b", r"\bCorp\.\b", 
-        r"\bLLC\b", r"\bL\.L\.C\.\b", r"\bLtd\b", r"\bLtd\.\b",
-        r"\bLimited\b", r"\bLLC\.\b", r"\bCorporation\b", r"\bCompany\b",
-        r"\bGmbH\b", r"\bAG\b", r"\bS\.A\.\b", r"\bPlc\b", r"\bGroup\b"
-    ]
-    
-    clean = company
-    for suffix in suffixes:
-        clean = re.sub(suffix, "", clean, flags=re.IGNORECASE)
+    clean = _LEGAL_SUFFIX_RE.sub("", company)
     
     # Remove punctuation and excess whitespace
-    clean = re.sub(r'[,\.\'"]', '', clean)
-    clean = re.sub(r'\s+', ' ', clean).strip()
-    
-    return clean
+    clean = _NAME_PUNCT_RE.sub("", clean)
+    return " ".join(clean.split())
 
 
 def guess_company_domain(company: str) -> List[str]:
@@ -216,3 +253,437 @@ def extract_keywords(text: str, keywords: List[str]) -> List[str]:
             found.append(keyword)
     
     return found
+
+
+def lowercase_xpath(expr: str) -> str:
+    """
+    Wrap an XPath 1.0 string expression so it evaluates to lowercase ASCII.
+    
+    Args:
+        expr: XPath string expression
+        
+    Returns:
+        XPath expression for the lowercased string
+    """
+    return f"translate({expr}, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+
+def has_class_xpath(name: str) -> str:
+    """
+    Build an XPath 1.0 test for an element having a CSS class.
+    
+    Args:
+        name: Class name
+        
+    Returns:
+        XPath predicate, the equivalent of the CSS selector ``.name``
+    """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+@lru_cache(maxsize=None)
+def _html_parser(encoding: Optional[str]) -> lxml.html.HTMLParser:
+    """
+    Get a reusable lxml HTML parser for a document encoding.
+    
+    Args:
+        encoding: Document encoding, or None to let lxml decide
+        
+    Returns:
+        HTML parser
+    """
+    return lxml.html.HTMLParser(encoding=encoding)
+
+
+def parse_html(content: bytes) -> Optional[lxml.html.HtmlElement]:
+    """
+    Parse an HTML document with lxml.
+    
+    Args:
+        content: Raw HTML bytes
+        
+    Returns:
+        Root element, or None if the document could not be parsed
+    """
+    # Detect the encoding the same way BeautifulSoup does (BOM, declared
+    # charset, then charset detection) but let lxml decode the bytes
+    encoding = UnicodeDammit(content, is_html=True).original_encoding
+    
+    try:
+        return lxml.html.document_fromstring(content, parser=_html_parser(encoding))
+    except (etree.ParserError, ValueError, LookupError):
+        return None
+
+
+def load_json(content: bytes) -> Any:
+    """
+    Parse a JSON response body.
+    
+    Uses orjson when it is installed and falls back to the standard
+    library parser.
+    
+    Args:
+        content: Raw JSON bytes
+        
+    Returns:
+        Parsed JSON document
+        
+    Raises:
+        ValueError: If the content is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class KeywordMatcher:
+    """
+    Multi-pattern substring matcher over named keyword groups.
+    
+    All keywords are compiled into a single regex alternation so a text is
+    scanned once in C to find every position where some keyword starts,
+    instead of running one Python-level substring search per keyword.
+    Matching follows plain ``keyword in text`` semantics, or with
+    ``word_start`` only counts keywords that start at a word boundary, so
+    "chief" matches "chief officer" but not "mischief".
+    
+    Attributes:
+        patterns (Dict[str, re.Pattern]): Compiled alternation per group
+    """
+    
+    def __init__(self, groups: Dict[str, Iterable[str]], word_start: bool = False):
+        """
+        Compile the keyword groups.
+        
+        Args:
+            groups: Mapping of group name to the keywords in that group
+            word_start: Only match keywords that start at a word boundary
+        """
+        prefix = r"\b" if word_start else ""
+        self.patterns = {}
+        for name, keywords in groups.items():
+            # Longest first so overlapping alternatives prefer the full phrase
+            unique = sorted(set(keywords), key=len, reverse=True)
+            if unique:
+                self.patterns[name] = re.compile(prefix + "(?:" + "|".join(map(re.escape, unique)) + ")")
+        
+        # Named group per keyword group so a hit reports which group matched
+        self._group_names = {f"g{i}": name for i, name in enumerate(self.patterns)}
+        self._combined = re.compile(
+            "|".join(
+                f"(?P<g{i}>{pattern.pattern})"
+                for i, pattern in enumerate(self.patterns.values())
+            )
+        ) if self.patterns else None
+    
+    def find_groups(self, text: str) -> Set[str]:
+        """
+        Find which keyword groups occur in a text.
+        
+        Args:
+            text: Text to scan
+            
+        Returns:
+            Set of group names with at least one keyword in the text
+        """
+        found = set()
+        if not text or self._combined is None:
+            return found
+        
+        remaining = dict(self.patterns)
+        pos = 0
+        while remaining:
+            match = self._combined.search(text, pos)
+            if match is None:
+                break
+            
+            name = self._group_names[match.lastgroup]
+            found.add(name)
+            remaining.pop(name, None)
+            
+            # Other groups may also have a keyword starting at the same offset
+            start = match.start()
+            for name, pattern in list(remaining.items()):
+                if pattern.match(text, start):
+                    found.add(name)
+                    del remaining[name]
+            pos = start + 1
+        
+        return found
+    
+    def contains(self, text: str, group: str) -> bool:
+        """
+        Check if any keyword of a single group occurs in a text.
+        
+        Args:
+            text: Text to scan
+            group: Name of the keyword group
+            
+        Returns:
+            True if the text contains a keyword from the group
+        """
+        pattern = self.patterns.get(group)
+        return bool(text) and pattern is not None and pattern.search(text) is not None
+
+
+class TokenBucket:
+    """
+    Async token bucket rate limiter.
+    
+    Allows bursts of up to ``rate`` requests and a sustained rate of ``rate``
+    requests per ``period`` seconds. A slot is only reserved once the wait
+    for it is over, so callers cancelled while waiting do not hold slots
+    back from later ones. No lock is needed, since a caller that finds its
+    slot taken on waking simply waits for the next one.
+    """
+    
+    def __init__(self, rate: float, period: float = 1.0):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate: Number of requests allowed per period
+            period: Length of the period in seconds
+        """
+        self.rate = rate
+        self.period = period
+        self._interval = period / rate
+        self._burst = period - self._interval
+        self._next_slot = 0.0
+    
+    async def acquire(self):
+        """
+        Wait until a request may be made under the rate limit.
+        """
+        while True:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            delay = slot - now - self._burst
+            if delay > 0:
+                await asyncio.sleep(delay)
+            
+            # Another caller may have taken the slot during the sleep
+            if self._next_slot <= slot:
+                self._next_slot = slot + self._interval
+                return
+
+
+class HTTPCache:
+    """
+    On-disk cache of GET responses revalidated with conditional requests.
+    
+    Responses that carry an ETag or Last-Modified validator are stored under
+    ``base_path``. Later requests for the same URL send If-None-Match and
+    If-Modified-Since, and a 304 reply is answered from the stored body.
+    With a TTL, every successful response is stored and served without a
+    request until it is ``ttl`` seconds old, keyed by the full URL.
+    
+    Entries are pickled and URLs may carry API keys, so ``base_path`` must
+    be a trusted directory that no one else can write to.
+    
+    Attributes:
+        base_path (str): Directory holding the cached responses
+        ttl (float): Seconds a stored response is served without a request,
+            0 to always revalidate
+    """
+    
+    def __init__(self, base_path: str, ttl: float = 0):
+        """
+        Initialize the cache.
+        
+        Args:
+            base_path: Directory holding the cached responses
+            ttl: Seconds a stored response is served without a request
+        """
+        self.base_path = base_path
+        self.ttl = ttl
+    
+    def _path(self, url: str) -> str:
+        return os.path.join(self.base_path, hashlib.sha256(url.encode("utf-8")).hexdigest())
+    
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the cached entry for a URL.
+        
+        Args:
+            url: Request URL
+            
+        Returns:
+            Cached entry, or None if the URL is not cached
+        """
+        try:
+            with open(self._path(url), "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+    
+    def conditional_headers(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Build the revalidation headers for a cached entry.
+        
+        Args:
+            entry: Cached entry
+            
+        Returns:
+            Conditional request headers
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+    
+    def store(self, url: str, response: httpx.Response):
+        """
+        Store a successful response if it can be reused later.
+        
+        Args:
+            url: Request URL
+            response: Response with its body already read
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != 200 or not (etag or last_modified or self.ttl > 0):
+            return
+        if "no-store" in response.headers.get("Cache-Control", "").lower():
+            return
+        
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            # The stored body is already decoded, so drop the framing headers
+            "headers": [
+                (name, value) for name, value in response.headers.multi_items()
+                if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+            ],
+            "content": response.content,
+            "stored_at": time.time(),
+        }
+        self._write(url, entry)
+    
+    def refresh(self, url: str, entry: Dict[str, Any]):
+        """
+        Restart the TTL of an entry after the server confirmed it is current.
+        
+        Args:
+            url: Request URL
+            entry: Cached entry
+        """
+        if self.ttl > 0:
+            self._write(url, {**entry, "stored_at": time.time()})
+    
+    def _write(self, url: str, entry: Dict[str, Any]):
+        try:
+            os.makedirs(self.base_path, exist_ok=True)
+            with open(self._path(url), "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.debug(f"Could not write HTTP cache entry for {url}: {str(e)}")
+    
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """
+        Check whether an entry can be served without a request.
+        
+        Args:
+            entry: Cached entry
+            
+        Returns:
+            True if the entry is younger than the TTL
+        """
+        return self.ttl > 0 and time.time() - entry.get("stored_at", 0) < self.ttl
+    
+    def cached(self, entry: Dict[str, Any], url: str) -> httpx.Response:
+        """
+        Build the response for a fresh entry.
+        
+        Args:
+            entry: Cached entry
+            url: Request URL
+            
+        Returns:
+            Response carrying the cached headers and body
+        """
+        return httpx.Response(
+            200,
+            headers=entry["headers"],
+            content=entry["content"],
+            request=httpx.Request("GET", url),
+        )
+    
+    def revalidated(self, entry: Dict[str, Any], response: httpx.Response) -> httpx.Response:
+        """
+        Rebuild the full response for a 304 Not Modified reply.
+        
+        Args:
+            entry: Cached entry
+            response: The 304 response
+            
+        Returns:
+            Response carrying the cached status, headers and body
+        """
+        return httpx.Response(
+            200,
+            headers=entry["headers"],
+            content=entry["content"],
+            request=response.request,
+        )
+
+
+class LookupCache:
+    """
+    On-disk key-value cache whose entries expire after a per-entry TTL.
+    
+    Used to remember the outcome of slow lookups, including negative ones,
+    across scans. Values are pickled, one file per key under ``base_path``,
+    so it must be a trusted directory that no one else can write to.
+    
+    Attributes:
+        base_path (str): Directory holding the cached entries
+    """
+    
+    def __init__(self, base_path: str):
+        """
+        Initialize the cache.
+        
+        Args:
+            base_path: Directory holding the cached entries
+        """
+        self.base_path = base_path
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.base_path, hashlib.sha256(key.encode("utf-8")).hexdigest())
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get the cached value for a key.
+        
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+            
+        Returns:
+            Cached value, or default
+        """
+        try:
+            with open(self._path(key), "rb") as f:
+                expires_at, value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return default
+        return value if expires_at > time.time() else default
+    
+    def set(self, key: str, value: Any, ttl: float):
+        """
+        Store a value for a key.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds until the entry expires
+        """
+        try:
+            os.makedirs(self.base_path, exist_ok=True)
+            with open(self._path(key), "wb") as f:
+                pickle.dump((time.time() + ttl, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.debug(f"Could not write lookup cache entry for {key}: {str(e)}")
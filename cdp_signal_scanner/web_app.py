@@ -15,7 +15,7 @@ from pathlib import Path
 import pandas as pd
 from flask import Flask, render_template, request, redirect, url_for, flash, send_file
 
-from cdp_signal_scanner.main import scan_companies
+from cdp_signal_scanner.main import new_event_loop, scan_companies
 
 app = Flask(__name__)
 app.secret_key = os.getenv("FLASK_SECRET_KEY", "dev_key_for_cdp_scanner")
@@ -139,7 +139,7 @@ def api_scan():
     
     # Run the scan asynchronously
     def run_scan_task():
-        loop = asyncio.new_event_loop()
+        loop = new_event_loop()
         asyncio.set_event_loop(loop)
         try:
             # Run the scan
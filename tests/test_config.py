@@ -0,0 +1,58 @@
+"""
+Unit tests for the configuration module.
+"""
+
+import os
+import pytest
+from cdp_signal_scanner.config import DEFAULT_CONFIG, clear_config_cache, deep_update, load_config
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Point CONFIG_PATH at a temporary config file."""
+    path = tmp_path / "config.yml"
+    path.write_text("scoring:\n  funding_or_expansion: 7\n")
+    monkeypatch.setenv("CONFIG_PATH", str(path))
+    clear_config_cache()
+    yield path
+    clear_config_cache()
+
+
+def test_load_config_merges_file_values(config_file):
+    """Test that file values override the defaults."""
+    config = load_config()
+    assert config["scoring"]["funding_or_expansion"] == 7
+    assert "keywords" in config
+
+
+def test_load_config_cache_returns_independent_copies(config_file):
+    """Test that cached configs can be mutated without affecting later loads."""
+    first = load_config()
+    first["scoring"]["funding_or_expansion"] = 99
+
+    second = load_config()
+    assert second["scoring"]["funding_or_expansion"] == 7
+
+
+def test_load_config_reloads_when_file_changes(config_file):
+    """Test that a modified config file invalidates the cache."""
+    assert load_config()["scoring"]["funding_or_expansion"] == 7
+
+    config_file.write_text("scoring:\n  funding_or_expansion: 8\n")
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_config()["scoring"]["funding_or_expansion"] == 8
+
+
+def test_load_config_does_not_mutate_defaults(config_file):
+    """Test that merging file values leaves DEFAULT_CONFIG untouched."""
+    load_config()
+    assert DEFAULT_CONFIG["scoring"]["funding_or_expansion"] == 2
+
+
+def test_deep_update_merges_nested_dicts():
+    """Test that nested dicts are merged and other values replaced."""
+    source = {"a": {"b": 1, "c": {"d": 2}}, "e": [1]}
+    deep_update(source, {"a": {"c": {"d": 3, "f": 4}}, "e": [2]})
+    assert source == {"a": {"b": 1, "c": {"d": 3, "f": 4}}, "e": [2]}
@@ -3,14 +3,68 @@ Unit tests for data source modules.
 """
 
 import pytest
+import pytest_asyncio
 import httpx
 from unittest.mock import patch, MagicMock
 import asyncio
 import json
+from datetime import date, timedelta
 from bs4 import BeautifulSoup
 
+from cdp_signal_scanner.data_sources import business_documents, google_cse
 from cdp_signal_scanner.data_sources.base import DataSourceBase
+from cdp_signal_scanner.data_sources.business_documents import (
+    BusinessDocumentsSource, IR_DOC_LINKS, NEWS_CONTAINERS, NEWS_DATES, _build_snippet, _extract_text,
+)
+from cdp_signal_scanner.data_sources.careers_page import CAREERS_LINK, CareersPageSource, _domain_matches, _sitemap_locs
+from cdp_signal_scanner.data_sources.google_cse import GoogleCSESource, _or_queries
 from cdp_signal_scanner.data_sources.greenhouse import GreenhouseSource
+from cdp_signal_scanner.data_sources.indeed import IndeedSource
+from cdp_signal_scanner.utils import parse_html
+
+# Keyword lists for tests that only need a single vendor match
+SEGMENT_KEYWORDS = {"cdp_vendors": ["segment"], "cdp_related": [], "data_tech": []}
+
+
+class StubSource(DataSourceBase):
+    """Concrete data source for exercising the base class."""
+    
+    async def gather_signals(self, company):
+        return []
+
+
+def make_config(keywords=None, api=None, **scraping):
+    """
+    Build a minimal source configuration for tests.
+    
+    Args:
+        keywords: Keyword lists, empty by default
+        api: API settings, empty by default
+        **scraping: Overrides for the scraping settings
+        
+    Returns:
+        Configuration dictionary
+    """
+    return {
+        "scraping": {"timeout": 10, "max_retries": 1, "headers": {"User-Agent": "Test"}, **scraping},
+        "api": api or {},
+        "keywords": keywords or {},
+    }
+
+
+@pytest_asyncio.fixture
+async def mock_transport():
+    """Route a source's HTTP client through a mock handler, closing it after the test."""
+    clients = []
+    
+    def attach(source, handler):
+        source.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(source.client)
+        return source.client
+    
+    yield attach
+    for client in clients:
+        await client.aclose()
 
 
 # Test classification logic in the base class
@@ -75,13 +129,12 @@ async def test_greenhouse_token_finder():
     
     source = GreenhouseSource(config)
     
-    # Mock the HTTP client's get method
-    async def mock_get(url, *args, **kwargs):
-        if url in mock_responses:
-            return mock_responses[url]
-        return httpx.Response(404)
+    # Mock the HTTP client's transport
+    def handler(request):
+        response = mock_responses.get(str(request.url))
+        return httpx.Response(response.status_code) if response else httpx.Response(404)
     
-    source.client.get = mock_get
+    source.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
     
     # Test finding a valid token
     token = await source.get_greenhouse_token("Acme")
@@ -90,6 +143,35 @@ async def test_greenhouse_token_finder():
     # Test with a company that doesn't have a Greenhouse board
     token = await source.get_greenhouse_token("Nonexistent")
     assert token is None
+    
+    await source.client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_greenhouse_token_misses_are_cached_only_when_definitive(tmp_path, mock_transport):
+    """Test that a failed probe keeps a missing board out of the lookup cache."""
+    source = GreenhouseSource(make_config(lookup_cache_dir=str(tmp_path)))
+    probes = []
+    outage = True
+    
+    def handler(request):
+        probes.append(str(request.url))
+        if outage and request.url.path == "/v1/boards/acme/jobs":
+            raise httpx.ConnectError("connection reset", request=request)
+        return httpx.Response(404)
+    
+    mock_transport(source, handler)
+    
+    # The network error leaves the lookup uncached, so it is probed again
+    assert await source.get_greenhouse_token("Acme") is None
+    first = len(probes)
+    outage = False
+    assert await source.get_greenhouse_token("Acme") is None
+    assert len(probes) == 2 * first
+    
+    # Every candidate answered 404, so the miss is served from the cache
+    assert await source.get_greenhouse_token("Acme") is None
+    assert len(probes) == 2 * first
 
 
 # Test job relevance logic in Greenhouse source
@@ -123,3 +205,796 @@ def test_greenhouse_job_relevance():
     assert source._is_target_persona("director data platform") is True
     assert source._is_target_persona("vp marketing operations") is True
     assert source._is_target_persona("software engineer") is False
+
+
+def test_greenhouse_keyword_groups_shared_across_sources():
+    """Test that Greenhouse sources of one scan share title keyword groups."""
+    config = make_config({"cdp_vendors": ["segment"]})
+    first, second = GreenhouseSource(config), GreenhouseSource(config)
+    
+    assert "cdp" in first._keyword_groups("Segment Engineer")
+    hits = first._keyword_groups.cache_info().hits
+    assert "cdp" in second._keyword_groups("Segment Engineer")
+    assert second._keyword_groups.cache_info().hits == hits + 1
+
+
+# Test retry logic in the base class
+@pytest.mark.asyncio
+async def test_make_request_retries_transient_errors():
+    """Test that make_request retries failed requests before succeeding."""
+    source = StubSource(make_config(max_retries=3))
+    request = httpx.Request("GET", "https://example.com")
+    attempts = []
+    
+    async def mock_request(method, url, **kwargs):
+        attempts.append(url)
+        if len(attempts) < 3:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, request=request)
+    
+    source.client.request = mock_request
+    
+    with patch("cdp_signal_scanner.data_sources.base.asyncio.sleep") as mock_sleep:
+        mock_sleep.return_value = None
+        response = await source.make_request("https://example.com")
+    
+    assert response.status_code == 200
+    assert len(attempts) == 3
+
+
+@pytest.mark.asyncio
+async def test_close_shared_leaves_overlapping_scans_open():
+    """Test that finishing one scan keeps another scan's shared client open."""
+    first_config, second_config = make_config(), make_config()
+    second_started = asyncio.Event()
+    first_finished = asyncio.Event()
+    
+    async def first_scan():
+        client = StubSource(first_config).client
+        await second_started.wait()
+        await DataSourceBase.close_shared(first_config)
+        first_finished.set()
+        return client
+    
+    async def second_scan():
+        client = StubSource(second_config).client
+        second_started.set()
+        await first_finished.wait()
+        
+        # Sources created after the other scan finished share the open client
+        assert StubSource(second_config).client is client
+        assert not client.is_closed
+        await DataSourceBase.close_shared(second_config)
+        return client
+    
+    first_client, second_client = await asyncio.gather(first_scan(), second_scan())
+    
+    assert first_client is not second_client
+    assert first_client.is_closed and second_client.is_closed
+
+
+def test_classify_signals_batch():
+    """Test that batch classification matches per-signal classification."""
+    source = StubSource(make_config({
+        "target_personas": ["vp marketing"],
+        "cdp_vendors": ["segment"],
+        "data_tech": ["snowflake"],
+    }))
+    signals = [
+        {"snippet": "ACME Corp appointed a new VP Marketing."},
+        {"snippet": "ACME Corp chooses Snowflake."},
+        {"snippet": "ACME Corp announces Series B funding."},
+        {},
+    ]
+    
+    assert source.classify_signals(signals) == [
+        "executive_move",
+        "technology_signal",
+        "growth_funding",
+        "other",
+    ]
+
+
+def test_business_documents_extract_text():
+    """Test main text extraction from raw HTML bytes."""
+    paragraph = "ACME Corp is building a customer data platform with Segment. " * 3
+    html = f"<html><body><nav>Home</nav><article><p>{paragraph}</p></article></body></html>"
+    
+    assert "customer data platform" in _extract_text(html.encode("utf-8"))
+    assert _extract_text(b"<html><body><p>Short</p></body></html>").strip() == "Short"
+
+
+def test_business_documents_relevant_paragraphs():
+    """Test that only paragraphs mentioning CDP keywords are kept."""
+    source = BusinessDocumentsSource(make_config({
+        "cdp_related": ["customer data platform"],
+        "cdp_vendors": ["Segment"],
+        "data_tech": ["snowflake"],
+    }))
+    text = (
+        "We rolled out a Customer Data Platform across all regions.\n"
+        "Revenue grew in the fourth quarter of the year.\n"
+        "Snowflake now powers our customer journey analytics.\n"
+        "Short"
+    )
+    
+    assert source._find_relevant_paragraphs(text) == (
+        ["We rolled out a Customer Data Platform across all regions."],
+        {"cdp", "customer"},
+    )
+    assert source._find_relevant_paragraphs(text, include_tech=True) == (
+        [
+            "We rolled out a Customer Data Platform across all regions.",
+            "Snowflake now powers our customer journey analytics.",
+        ],
+        {"cdp", "tech", "customer"},
+    )
+    assert source._find_relevant_paragraphs("Revenue grew in the fourth quarter.") == ([], set())
+
+
+def test_business_documents_groups_come_from_snippet():
+    """Test that keywords cut from a long paragraph's snippet don't classify it."""
+    source = BusinessDocumentsSource(make_config({
+        "cdp_related": ["customer data platform"],
+        "data_tech": ["snowflake"],
+    }))
+    paragraph = "We rolled out a customer data platform " + "across every region " * 55 + "on Snowflake."
+    assert paragraph.index("Snowflake") > 1000
+    
+    paragraphs, keyword_groups = source._find_relevant_paragraphs(paragraph)
+    signal = {"snippet": _build_snippet(paragraphs)}
+    
+    assert paragraphs == [paragraph]
+    assert "tech" not in keyword_groups
+    assert source.classify_signal(signal, keyword_groups) == source.classify_signal(signal) == "other"
+
+
+@pytest.mark.asyncio
+async def test_business_documents_first_reachable_url(mock_transport):
+    """Test that URL probes keep the preference order of the candidates."""
+    source = BusinessDocumentsSource(make_config())
+    ranges = []
+    
+    def handler(request):
+        ranges.append(request.headers.get("Range"))
+        status = 404 if request.url.path == "/ir" else 206
+        return httpx.Response(status)
+    
+    mock_transport(source, handler)
+    
+    urls = ["https://example.com/ir", "https://example.com/investors", "https://example.com/investor"]
+    assert await source._first_reachable_url(urls) == "https://example.com/investors"
+    assert await source._first_reachable_url(urls[:1]) is None
+    assert set(ranges) == {"bytes=0-0"}
+
+
+@pytest.mark.asyncio
+async def test_business_documents_website_lookup_is_shared(mock_transport):
+    """Test that concurrent website lookups for a company probe only once."""
+    source = BusinessDocumentsSource(make_config())
+    probed = []
+    
+    def handler(request):
+        probed.append(str(request.url))
+        return httpx.Response(200)
+    
+    mock_transport(source, handler)
+    
+    websites = await asyncio.gather(
+        source._find_company_website("Acme Corp"),
+        source._find_company_website("Acme Corp"),
+    )
+    
+    assert websites == ["https://acmecorp.com", "https://acmecorp.com"]
+    assert len(probed) == 4
+
+
+@pytest.mark.asyncio
+async def test_business_documents_stream_sec_paragraphs(mock_transport):
+    """Test that streamed SEC documents yield relevant paragraphs once each."""
+    source = BusinessDocumentsSource(make_config({
+        "cdp_related": ["customer data platform"],
+        "cdp_vendors": ["segment"],
+    }))
+    html = (
+        b"<html><body><div>"
+        b"<p>We invested in a customer data platform during the year.</p>"
+        b"<p>Revenue grew in every region during the year.</p>"
+        b"<div>Our <b>Segment</b> rollout continued across all brands.</div>"
+        b"</div></body></html>"
+    )
+    
+    mock_transport(source, lambda request: httpx.Response(200, content=html))
+    paragraphs, keyword_groups = await source._stream_sec_paragraphs("https://www.sec.gov/doc.htm")
+    
+    assert paragraphs == [
+        "We invested in a customer data platform during the year.",
+        "Our Segment rollout continued across all brands.",
+    ]
+    assert keyword_groups == {"cdp", "customer", "vendor"}
+
+
+@pytest.mark.asyncio
+async def test_make_request_revalidates_cached_responses(tmp_path, mock_transport):
+    """Test that cached GET responses are served on 304 Not Modified."""
+    source = StubSource(make_config(http_cache_dir=str(tmp_path)))
+    seen_headers = []
+    
+    def handler(request):
+        seen_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, headers={"ETag": '"v1"'}, content=b"filing body")
+    
+    mock_transport(source, handler)
+    
+    first = await source.make_request("https://www.sec.gov/filing.htm")
+    second = await source.make_request("https://www.sec.gov/filing.htm")
+    
+    assert seen_headers == [None, '"v1"']
+    assert first.content == second.content == b"filing body"
+    assert second.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_make_request_serves_fresh_cached_responses(tmp_path, mock_transport):
+    """Test that cached GET responses within the TTL skip the request."""
+    source = StubSource(make_config(http_cache_dir=str(tmp_path), http_cache_ttl=3600))
+    requested = []
+    
+    def handler(request):
+        requested.append(str(request.url))
+        return httpx.Response(200, json={"jobs": []})
+    
+    mock_transport(source, handler)
+    
+    url = "https://boards-api.greenhouse.io/v1/boards/acme/jobs?content=true"
+    first = await source.make_request(url)
+    second = await source.make_request(url)
+    
+    # An expired entry without validators is fetched again
+    with patch("cdp_signal_scanner.utils.time.time", return_value=10 ** 12):
+        await source.make_request(url)
+    
+    assert requested == [url, url]
+    assert first.content == second.content
+    assert second.json() == {"jobs": []}
+
+
+def test_business_documents_ir_doc_links():
+    """Test the investor document link filter on a parsed IR page."""
+    tree = parse_html(
+        b'<html><body>'
+        b'<a href="#top">Annual Report</a>'
+        b'<a href="/files/Q3.PDF">Q3 deck</a>'
+        b'<a href="/reports/2024">Annual REPORT 2024</a>'
+        b'<a href="/about">About us</a>'
+        b'<a href="/ir/10-K">Latest filing</a>'
+        b'</body></html>'
+    )
+    
+    assert [a.get("href") for a in IR_DOC_LINKS(tree)] == ["/files/Q3.PDF", "/reports/2024", "/ir/10-K"]
+
+
+def test_business_documents_news_containers():
+    """Test that news item containers are found in pattern order."""
+    tree = parse_html(
+        b'<html><body>'
+        b'<div class="post">Old layout</div>'
+        b'<div class="latest-news"><a href="/news/1">Launch</a><span class="date">May 1</span></div>'
+        b'<article><a href="/news/2">Funding</a></article>'
+        b'</body></html>'
+    )
+    
+    # Exact class names and <article> take priority over partial class matches
+    containers = next(found for found in (find(tree) for find in NEWS_CONTAINERS) if found)
+    assert [c.tag for c in containers] == ["article"]
+    
+    partial = NEWS_CONTAINERS[1](tree)
+    assert [c.get("class") for c in partial] == ["latest-news"]
+    assert NEWS_DATES(partial[0])[0].text_content() == "May 1"
+
+
+def test_business_documents_build_snippet():
+    """Test that snippets match joining and truncating the first 3 paragraphs."""
+    assert _build_snippet(["one", "two", "three", "four"]) == "one ... two ... three"
+    assert _build_snippet(["a" * 395, "b" * 400]) == "a" * 395 + " ... " + "b" * 400
+    
+    long_snippet = _build_snippet(["a" * 5000, "b" * 5000])
+    assert long_snippet == "a" * 797 + "..."
+    assert _build_snippet(["a" * 397, "b" * 500]) == "a" * 397 + " ... " + "b" * 395 + "..."
+
+
+@pytest.mark.asyncio
+async def test_business_documents_lists_sec_filings_from_submissions_json(mock_transport):
+    """Test CIK lookup and filing selection from the EDGAR JSON endpoints."""
+    source = BusinessDocumentsSource(make_config())
+    recent = (date.today() - timedelta(days=30)).isoformat()
+    old = (date.today() - timedelta(days=800)).isoformat()
+    
+    def handler(request):
+        if request.url.path == "/files/company_tickers.json":
+            return httpx.Response(200, json={
+                "0": {"cik_str": 111, "ticker": "BIG", "title": "Big Corp"},
+                "1": {"cik_str": 320193, "ticker": "ACME", "title": "Acme Corp."},
+            })
+        assert request.url.path == "/submissions/CIK0000320193.json"
+        return httpx.Response(200, json={"filings": {"recent": {
+            "form": ["4", "10-Q", "8-K", "10-K"],
+            "filingDate": [recent, recent, recent, old],
+            "accessionNumber": ["0001-24-000001", "0001-24-000002", "0001-24-000003", "0001-22-000004"],
+            "primaryDocument": ["form4.xml", "acme-10q.htm", "", "acme-10k.htm"],
+        }}})
+    
+    mock_transport(source, handler)
+    BusinessDocumentsSource._sec_companies = None
+    
+    try:
+        cik = await source._find_sec_cik("ACME Corp")
+        filings = await source._list_sec_filings(cik)
+    finally:
+        BusinessDocumentsSource._sec_companies = None
+    
+    folder = "https://www.sec.gov/Archives/edgar/data/320193/"
+    assert cik == 320193
+    assert filings == [
+        {
+            "type": "10-Q",
+            "date": recent,
+            "url": f"{folder}000124000002/0001-24-000002-index.htm",
+            "document_url": f"{folder}000124000002/acme-10q.htm",
+        },
+        {
+            "type": "8-K",
+            "date": recent,
+            "url": f"{folder}000124000003/0001-24-000003-index.htm",
+            "document_url": None,
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_business_documents_sec_requests_rate_limit_every_attempt(monkeypatch, mock_transport):
+    """Test that SEC retries take a rate limiter token per attempt."""
+    source = BusinessDocumentsSource(make_config(max_retries=3))
+    attempts = []
+    tokens = []
+    
+    def handler(request):
+        attempts.append(str(request.url))
+        return httpx.Response(503 if len(attempts) < 3 else 200)
+    
+    async def acquire():
+        tokens.append(len(attempts))
+    
+    async def no_sleep(delay):
+        pass
+    
+    monkeypatch.setattr(business_documents.SEC_RATE_LIMITER, "acquire", acquire)
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    mock_transport(source, handler)
+    response = await source._sec_request("https://data.sec.gov/submissions/CIK0000320193.json")
+    
+    assert response.status_code == 200
+    assert tokens == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_business_documents_sec_company_list_loads_once(monkeypatch, mock_transport):
+    """Test that concurrent CIK lookups share one company list download."""
+    monkeypatch.setattr(BusinessDocumentsSource, "_sec_companies", None)
+    sources = [BusinessDocumentsSource(make_config()) for _ in range(3)]
+    downloads = []
+    
+    async def handler(request):
+        downloads.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"0": {"cik_str": 320193, "ticker": "ACME", "title": "Acme Corp."}})
+    
+    for source in sources:
+        mock_transport(source, handler)
+    ciks = await asyncio.gather(*(source._find_sec_cik("Acme") for source in sources))
+    
+    assert ciks == [320193, 320193, 320193]
+    assert downloads == ["https://www.sec.gov/files/company_tickers.json"]
+
+
+@pytest.mark.asyncio
+async def test_careers_page_extract_job_listings():
+    """Test job listing extraction from headings, list items and job classes."""
+    source = CareersPageSource(make_config())
+    
+    jobs = await source._extract_job_listings(
+        b'<html><body>'
+        b'<a href="/jobs/1"><h2>Data Engineer</h2></a><p>Build pipelines</p>'
+        b'<ul><li>Marketing Manager <a href="/jobs/2">Apply</a></li><li>Benefits</li></ul>'
+        b'<div class="Job-Card Open-Position"><h3>Product Analyst</h3><p>Own metrics</p></div>'
+        b'</body></html>',
+        "https://acme.com/careers",
+    )
+    
+    # Listings come in document order, and the job-class card and its
+    # heading produce a single listing
+    assert jobs == [
+        {"title": "Data Engineer", "url": "https://acme.com/jobs/1", "description": "Build pipelines"},
+        {"title": "Marketing Manager Apply", "url": "https://acme.com/jobs/2", "description": ""},
+        {"title": "Product Analyst", "url": "https://acme.com/careers", "description": "Own metrics"},
+    ]
+
+
+def test_careers_page_homepage_link():
+    """Test that the first link with careers-related text is chosen."""
+    tree = parse_html(
+        b'<html><body>'
+        b'<a>Careers without a link</a>'
+        b'<a href="/about">About</a>'
+        b'<a href="/team"><span>Work With Us</span></a>'
+        b'<a href="/careers">Careers</a>'
+        b'</body></html>'
+    )
+    
+    assert [a.get("href") for a in CAREERS_LINK(tree)] == ["/team"]
+
+
+@pytest.mark.asyncio
+async def test_careers_page_probes_stop_at_first_reachable_path(mock_transport):
+    """Test that careers path probes return without waiting on later paths."""
+    source = CareersPageSource(make_config())
+    
+    async def handler(request):
+        if request.url.path == "/careers":
+            return httpx.Response(404)
+        if request.url.path == "/jobs":
+            return httpx.Response(200)
+        await asyncio.sleep(30)
+        return httpx.Response(200)
+    
+    mock_transport(source, handler)
+    careers_url = await asyncio.wait_for(source._find_careers_page("https://acme.com"), 5)
+    
+    assert careers_url == "https://acme.com/jobs"
+
+
+@pytest.mark.asyncio
+async def test_careers_page_scan_sitemap(mock_transport):
+    """Test that relevant job pages listed in the sitemap become signals."""
+    source = CareersPageSource(make_config({"target_personas": ["director data platform"]}))
+    
+    body = b'<body>' + b'<p>About the role</p>' * 40 + b'</body></html>'
+    pages = {
+        "/sitemap.xml": (
+            b'<urlset><url><loc>https://acme.com/jobs/1</loc></url>'
+            b'<url><loc>https://acme.com/jobs/2</loc></url>'
+            b'<url><loc>https://acme.com/jobs/3</loc></url>'
+            b'<url><loc>https://acme.com/jobs/4</loc></url>'
+            b'<url><loc>https://acme.com/blog</loc></url></urlset>'
+        ),
+        "/jobs/1": b'<html><head><title>Director Data Platform</title>'
+                   b'<meta name="description" content="Lead our data team"></head>' + body,
+        "/jobs/2": b'<html><head><title>Office Assistant</title></head>' + body,
+        # Too small to be a real job page
+        "/jobs/3": b'<html><head><title>Director Data Platform</title></head></html>',
+    }
+    
+    def handler(request):
+        if request.url.path == "/jobs/4":
+            # Not HTML, so it is never parsed
+            return httpx.Response(200, content=body, headers={"Content-Type": "application/pdf"})
+        content = pages.get(request.url.path)
+        return httpx.Response(200, content=content) if content else httpx.Response(404)
+    
+    mock_transport(source, handler)
+    signals = await source._scan_sitemap("https://acme.com")
+    
+    assert [s["source_url"] for s in signals] == ["https://acme.com/jobs/1"]
+    assert signals[0]["raw_data"] == {"title": "Director Data Platform", "description": "Lead our data team"}
+
+
+@pytest.mark.asyncio
+async def test_careers_page_robots_rules_are_cached(mock_transport):
+    """Test that robots.txt is fetched once per site and honours Allow rules."""
+    source = CareersPageSource(make_config())
+    fetches = []
+    
+    def handler(request):
+        fetches.append(request.url.host)
+        if request.url.host == "down.example.com":
+            return httpx.Response(404)
+        return httpx.Response(
+            200, text="User-agent: *\nAllow: /careers/open\nDisallow: /careers\n"
+        )
+    
+    mock_transport(source, handler)
+    assert not await source._can_scrape("https://acme.com/careers")
+    assert await source._can_scrape("https://acme.com/careers/open")
+    assert await source._can_scrape("https://acme.com/jobs")
+    assert await source._can_scrape("https://down.example.com/careers")
+    assert await source._can_scrape("https://down.example.com/jobs")
+    
+    assert fetches == ["acme.com", "down.example.com"]
+
+
+def test_careers_page_job_relevance():
+    """Test careers job relevance rules with the compiled keyword groups."""
+    source = CareersPageSource(make_config({
+        "target_personas": ["vp marketing"],
+        "cdp_vendors": ["segment"],
+        "cdp_related": ["customer data platform"],
+    }))
+    
+    assert source._is_likely_job_title("Senior Backend Engineer")
+    assert not source._is_likely_job_title("Benefits and perks")
+    
+    assert source._is_relevant_job("VP, Marketing", "")
+    assert source._is_relevant_job("Data Scientist", "Drive growth experiments")
+    assert source._is_relevant_job("Analytics Lead", "Build user profiles")
+    assert source._is_relevant_job("Software Engineer", "Integrate our Customer Data Platform")
+    assert not source._is_relevant_job("Data Scientist", "Forecast inventory")
+    assert not source._is_relevant_job("Office Manager", "Run the front desk")
+
+
+@pytest.mark.asyncio
+async def test_careers_page_snippet_classification_shared_across_sources():
+    """Test that careers sources of one scan share snippet classifications."""
+    config = make_config({"target_personas": ["vp marketing"]})
+    first, second = CareersPageSource(config), CareersPageSource(config)
+    
+    assert first._classify_snippet("VP Marketing jobs") == "hiring_target_persona"
+    hits = first._classify_snippet.cache_info().hits
+    assert second._classify_snippet("VP Marketing jobs") == "hiring_target_persona"
+    assert second._classify_snippet.cache_info().hits == hits + 1
+    
+    # The next scan starts with an empty cache
+    await DataSourceBase.close_shared(config)
+    assert CareersPageSource(config)._classify_snippet.cache_info().currsize == 0
+    await DataSourceBase.close_shared(config)
+
+
+def test_careers_page_sitemap_locs():
+    """Test that sitemap index entries and page entries are told apart."""
+    index = (
+        b'<?xml version="1.0"?>'
+        b'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        b'<sitemap><loc> https://acme.com/jobs.xml </loc></sitemap>'
+        b'</sitemapindex>'
+    )
+    assert _sitemap_locs(index) == (["https://acme.com/jobs.xml"], [])
+    
+    # Truncated documents keep the entries read so far
+    urlset = b'<urlset><url><loc>https://acme.com/a</loc></url><url><loc>https://acme.com/b'
+    assert _sitemap_locs(urlset)[1][0] == "https://acme.com/a"
+    assert _sitemap_locs(b"") == ([], [])
+
+
+def test_careers_page_company_domain_match():
+    """Test the company domain heuristic used to filter search results."""
+    assert _domain_matches("https://www.acmecorp.com/about", "acmecorp")
+    assert _domain_matches("https://acme.io", "acmecorp")
+    assert not _domain_matches("https://news.example.com/acme", "acmecorp")
+    assert not _domain_matches("", "acmecorp")
+
+
+@pytest.mark.asyncio
+async def test_careers_page_company_websites_prefer_search_results(monkeypatch, mock_transport):
+    """Test that matching search results come first, in ranked order."""
+    monkeypatch.setenv("GOOGLE_API_KEY", "key")
+    monkeypatch.setenv("GOOGLE_CSE_ID", "cse")
+    source = CareersPageSource(make_config())
+    
+    def handler(request):
+        return httpx.Response(200, json={"items": [
+            {"link": "https://acme.io/"},
+            {"link": "https://news.example.com/acme"},
+            {"link": "https://www.acme.com"},
+        ]})
+    
+    mock_transport(source, handler)
+    urls = await source._find_all_company_websites("Acme")
+    
+    assert urls[:4] == ["https://acme.io/", "https://www.acme.com", "https://acme.com", "https://acme.ai"]
+    assert len(urls) == len(set(urls)) == 9
+
+
+def test_google_cse_result_relevance():
+    """Test search result relevance rules with the combined keyword matcher."""
+    source = GoogleCSESource(make_config({
+        "cdp_vendors": ["mParticle"],
+        "cdp_related": ["customer data platform"],
+        "data_tech": ["snowflake"],
+    }))
+    
+    assert source._is_relevant_result("Acme picks mParticle", "")
+    assert source._is_relevant_result("Acme news", "Rolling out a Customer Data Platform")
+    assert source._is_relevant_result("Acme moves to Snowflake", "to improve the customer journey")
+    assert source._is_relevant_result("Acme names new VP", "to lead marketing")
+    assert source._is_relevant_result("Acme raised $20M", "for its software")
+    assert source._is_relevant_result("Acme blog", "Building a single customer view")
+    assert not source._is_relevant_result("Acme moves to Snowflake", "for finance reporting")
+    assert not source._is_relevant_result("Acme opens office", "in Berlin")
+    
+    # Keywords only match at the start of a word
+    assert source._is_relevant_result("Acme appointed a new CMO", "to run digital")
+    assert not source._is_relevant_result("Mischief at Acme", "in the data center")
+    
+    # Repeated results are answered from the cache, shared by the scan's sources
+    hits = source._is_relevant_result.cache_info().hits
+    assert source._is_relevant_result("Acme picks mParticle", "")
+    assert GoogleCSESource(source.config)._is_relevant_result("Acme picks mParticle", "")
+    assert source._is_relevant_result.cache_info().hits == hits + 2
+
+
+@pytest.mark.asyncio
+async def test_google_cse_runs_queries_concurrently(mock_transport):
+    """Test that all queries run and their results are merged by URL."""
+    source = GoogleCSESource(make_config(SEGMENT_KEYWORDS, api={"google_cse": {"rate_limit": 60000}}))
+    source.api_key = "key"
+    source.cse_id = "cse"
+    queries = []
+    
+    def handler(request):
+        queries.append(request.url.params["q"])
+        return httpx.Response(200, json={"items": [
+            {"title": "Acme adopts Segment", "snippet": "", "link": "https://news.example.com/acme"},
+        ]})
+    
+    mock_transport(source, handler)
+    signals = await source.gather_signals("Acme")
+    
+    assert len(queries) == 5
+    assert [s["source_url"] for s in signals] == ["https://news.example.com/acme"]
+    assert signals[0]["raw_data"] == {"keywords": '"Acme" "segment"'}
+    assert signals[0]["signal_category"] == "technology_signal"
+
+
+@pytest.mark.asyncio
+async def test_google_cse_fallback_parses_result_page(monkeypatch, mock_transport):
+    """Test that the public CSE page is parsed into deduplicated signals."""
+    source = GoogleCSESource(make_config(SEGMENT_KEYWORDS))
+    source.cse_id = "cse"
+    
+    page = b"""<html><body>
+        <div class="gsc-webResult"><div class="gsc-result">
+            <a class="gs-title" href="https://news.example.com/acme"><b>Acme</b> adopts Segment</a>
+            <div class="gs-snippet">The new customer data platform</div>
+        </div></div>
+        <div class="gsc-webResult"><div class="gsc-result">
+            <a class="gs-title" href="https://news.example.com/office">Acme opens office</a>
+            <div class="gs-snippet">in Berlin</div>
+        </div></div>
+    </body></html>"""
+    
+    async def no_sleep(delay):
+        pass
+    
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+    mock_transport(source, lambda request: httpx.Response(200, content=page))
+    signals = await source.gather_signals("Acme")
+    
+    assert [s["source_url"] for s in signals] == ["https://news.example.com/acme"]
+    assert signals[0]["snippet"] == "Acme adopts Segment - The new customer data platform"
+    assert signals[0]["raw_data"] == {"keywords": "segment (from CDP Vendors)"}
+    assert signals[0]["signal_category"] == "technology_signal"
+
+
+def test_google_cse_or_queries():
+    """Test that keyword queries are combined within the query limits."""
+    assert _or_queries("Acme", ["Segment", "mParticle", "segment"]) == ['"Acme" ("Segment" OR "mParticle")']
+    assert _or_queries("Acme", ["Segment"]) == ['"Acme" "Segment"']
+    assert _or_queries("Acme", []) == []
+    
+    # At most 8 terms per query
+    queries = _or_queries("Acme", [f"vendor{i}" for i in range(10)])
+    assert len(queries) == 2
+    assert queries[1] == '"Acme" ("vendor8" OR "vendor9")'
+    
+    # At most 32 words per query, counting the ORs
+    queries = _or_queries("Acme", [f"term {i} with five words" for i in range(8)])
+    assert [len(query.split()) for query in queries] == [30, 18]
+
+
+@pytest.mark.asyncio
+async def test_google_cse_scrapes_public_page_after_quota_error(monkeypatch, mock_transport):
+    """Test that a 429 stops API queries and falls back to the public CSE page."""
+    monkeypatch.setattr(google_cse, "_quota_exhausted_until", 0.0)
+    monkeypatch.setattr(google_cse, "FALLBACK_DELAY", 0)
+    source = GoogleCSESource(make_config(SEGMENT_KEYWORDS, api={"google_cse": {"rate_limit": 60000}}))
+    source.api_key = "key"
+    source.cse_id = "cse"
+    api_requests = []
+    
+    page = b"""<html><body><div class="gsc-webResult"><div class="gsc-result">
+        <a class="gs-title" href="https://news.example.com/acme">Acme adopts Segment</a>
+    </div></div></body></html>"""
+    
+    def handler(request):
+        if request.url.host == "cse.google.com":
+            return httpx.Response(200, content=page)
+        api_requests.append(request.url.params["q"])
+        return httpx.Response(429, json={"error": {"code": 429, "message": "Rate limit"}})
+    
+    mock_transport(source, handler)
+    first = await source.gather_signals("Acme")
+    sent = len(api_requests)
+    second = await source.gather_signals("Acme")
+    
+    assert 1 <= sent <= 5
+    assert len(api_requests) == sent
+    assert [s["source_url"] for s in first] == [s["source_url"] for s in second] == ["https://news.example.com/acme"]
+    assert first[0]["source"] == "Google CSE (Fallback)"
+
+
+@pytest.mark.asyncio
+async def test_google_cse_skips_rate_limiter_while_quota_exhausted(monkeypatch, mock_transport):
+    """Test that an open quota breaker sends no API queries through the limiter."""
+    monkeypatch.setattr(google_cse, "_quota_exhausted_until", float("inf"))
+    monkeypatch.setattr(google_cse, "FALLBACK_DELAY", 0)
+    limiters = []
+    monkeypatch.setattr(google_cse, "_query_rate_limiter", limiters.append)
+    source = GoogleCSESource(make_config(SEGMENT_KEYWORDS, api={"google_cse": {"rate_limit": 1}}))
+    source.api_key = "key"
+    source.cse_id = "cse"
+    hosts = []
+    
+    def handler(request):
+        hosts.append(request.url.host)
+        return httpx.Response(200, content=b"<html><body></body></html>")
+    
+    mock_transport(source, handler)
+    assert await source.gather_signals("Acme") == []
+    
+    assert limiters == []
+    assert hosts and set(hosts) == {"cse.google.com"}
+
+
+@pytest.mark.asyncio
+async def test_indeed_runs_queries_concurrently(mock_transport):
+    """Test that every Indeed query runs and results are deduplicated by URL."""
+    source = IndeedSource(make_config({
+        "target_personas": ["Director of Data"],
+        "cdp_related": ["customer data platform"],
+        "cdp_vendors": ["segment"],
+        "data_tech": [],
+    }, api={"serpapi": {"rate_limit": 1000}}))
+    source.api_key = "key"
+    queries = []
+    
+    def handler(request):
+        queries.append(request.url.params["q"])
+        return httpx.Response(200, json={"jobs_results": [{
+            "title": "Director of Data",
+            "company_name": "Acme",
+            "job_link": "https://jobs.example.com/1",
+            "description": "Own our customer data platform",
+        }]})
+    
+    mock_transport(source, handler)
+    signals = await source.gather_signals("Acme")
+    
+    assert sorted(queries) == ["Director of Data Acme", "customer data platform Acme", "segment Acme"]
+    assert [s["source_url"] for s in signals] == ["https://jobs.example.com/1"]
+
+
+@pytest.mark.asyncio
+async def test_first_reachable_url_head_probes(mock_transport):
+    """Test HEAD probing: redirects are rejected and 405 falls back to GET."""
+    source = StubSource(make_config())
+    requests = []
+    
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        if request.url.path == "/moved":
+            return httpx.Response(301, headers={"Location": "https://api.example.com/ok"})
+        if request.url.path == "/no-head" and request.method == "HEAD":
+            return httpx.Response(405)
+        if request.url.path in ("/no-head", "/ok"):
+            return httpx.Response(200)
+        return httpx.Response(404)
+    
+    mock_transport(source, handler)
+    url = await source._first_reachable_url(
+        ["https://api.example.com/moved", "https://api.example.com/no-head"], head=True
+    )
+    
+    assert url == "https://api.example.com/no-head"
+    assert ("GET", "/ok") not in requests
+    assert ("GET", "/no-head") in requests
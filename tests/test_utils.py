@@ -2,8 +2,13 @@
 Unit tests for the utilities module.
 """
 
+import asyncio
 import pytest
-from cdp_signal_scanner.utils import clean_company_name, extract_domain, extract_keywords
+from unittest.mock import patch
+from cdp_signal_scanner.utils import (
+    clean_company_name, extract_domain, extract_keywords, KeywordMatcher, LookupCache, TokenBucket,
+    clean_text, load_json,
+)
 
 
 def test_clean_company_name():
@@ -40,3 +45,95 @@ def test_extract_keywords():
     # Partial words shouldn't match
     text = "I have an application and a bandana"
     assert extract_keywords(text, keywords) == []
+
+
+def test_keyword_matcher_find_groups():
+    """Test multi-group keyword matching."""
+    matcher = KeywordMatcher({
+        "persona": ["head of data", "cto"],
+        "tech": ["data warehouse", "dbt"],
+        "empty": [],
+    })
+    
+    # Overlapping keywords from different groups are both found
+    assert matcher.find_groups("new head of data warehouse team") == {"persona", "tech"}
+    assert matcher.find_groups("hiring a cto") == {"persona"}
+    assert matcher.find_groups("nothing relevant") == set()
+    assert matcher.find_groups("") == set()
+    
+    # Substring semantics match the plain `in` operator
+    assert matcher.find_groups("dbtlabs") == {"tech"}
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_spaces_requests():
+    """Test that the token bucket only delays requests beyond the burst."""
+    limiter = TokenBucket(4, 1.0)
+    
+    with patch("cdp_signal_scanner.utils.time.monotonic", return_value=100.0), \
+         patch("cdp_signal_scanner.utils.asyncio.sleep") as mock_sleep:
+        for _ in range(6):
+            await limiter.acquire()
+    
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert delays == pytest.approx([0.25, 0.5])
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_cancelled_wait_holds_no_slot():
+    """Test that a caller cancelled while waiting does not delay later callers."""
+    limiter = TokenBucket(1, 1.0)
+    delays = []
+    sleeping = asyncio.Event()
+    
+    async def sleep(delay):
+        delays.append(delay)
+        sleeping.set()
+        if len(delays) == 1:
+            await asyncio.Event().wait()
+    
+    with patch("cdp_signal_scanner.utils.time.monotonic", return_value=100.0), \
+         patch("cdp_signal_scanner.utils.asyncio.sleep", sleep):
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await sleeping.wait()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        
+        await limiter.acquire()
+    
+    # The last caller gets the slot the cancelled one was waiting for
+    assert delays == pytest.approx([1.0, 1.0])
+
+
+def test_lookup_cache_expires_entries(tmp_path):
+    """Test that cached values, including None, are served until they expire."""
+    cache = LookupCache(str(tmp_path / "lookups"))
+    assert cache.get("missing", "default") == "default"
+    
+    cache.set("found", "acme", ttl=60)
+    cache.set("not-found", None, ttl=60)
+    assert cache.get("found") == "acme"
+    assert cache.get("not-found", "default") is None
+    
+    with patch("cdp_signal_scanner.utils.time.time", return_value=10 ** 12):
+        assert cache.get("found", "default") == "default"
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_load_json(use_orjson):
+    """Test JSON parsing with and without orjson."""
+    import cdp_signal_scanner.utils as utils
+    
+    with patch.object(utils, "orjson", utils.orjson if use_orjson else None):
+        assert load_json('{"jobs": [{"title": "Caf\u00e9"}]}'.encode()) == {"jobs": [{"title": "Caf\u00e9"}]}
+        with pytest.raises(ValueError):
+            load_json(b"<html>")
+
+
+def test_clean_text():
+    """Test text normalization shared by the data sources and the scorer."""
+    assert clean_text("VP, Data & Analytics (Remote)") == "vp data & analytics remote"
+    assert clean_text("  \"Customer-360\"\n platform. ") == "customer-360 platform"
+    assert clean_text("") == ""